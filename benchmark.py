@@ -0,0 +1,507 @@
+"""Micro-benchmarks for the decoder and encoder, driven by the canboatjs corpus."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from nmea2000 import input_formats
+from nmea2000.binary import message_from_bytes, message_to_bytes
+from nmea2000.decoder import NMEA2000Decoder
+from nmea2000.encoder import EncodeTemplate, create_encoder, encode_values
+from nmea2000.encoder_formats import ENCODER_CLASSES
+from nmea2000.input_formats import TEXT_FORMATS, N2KFormat, detect_format
+from nmea2000.message import NMEA2000Message
+
+ROOT_DIR = Path(__file__).resolve().parent
+TESTS_DIR = ROOT_DIR / "tests"
+CORPUS_PATH = TESTS_DIR / "canboatjs_roundtrip.json"
+
+# Navigation, engine, tank and environment PGNs of a typical embedded gateway
+GATEWAY_PGNS = (
+    "126992,127245,127250,127251,127257,127258,127488,127489,127493,127505,"
+    "127508,127513,128259,128267,128275,129025,129026,129029,129033,129038,"
+    "129039,129040,129283,129284,129285,129539,129540,129794,129809,129810,"
+    "130306,130310,130311,130312,130313,130314,130316,130577"
+)
+
+# Run in a fresh interpreter so each build is imported from a cold module cache
+IMPORT_PROBE = """
+import os, sys, time, tracemalloc
+
+def rss():
+    # Resident set size in bytes, as reported by Linux
+    with open("/proc/self/statm", encoding="ascii") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+if sys.argv[1] == "heap":
+    tracemalloc.start()
+    import nmea2000
+    print(tracemalloc.get_traced_memory()[0])
+else:
+    before = rss()
+    started = time.perf_counter()
+    import nmea2000
+    elapsed = time.perf_counter() - started
+    print(elapsed, rss() - before)
+"""
+
+
+def load_corpus_messages() -> list[NMEA2000Message]:
+    """Decode every canboatjs fixture input into an NMEA2000Message."""
+    cases = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))["cases"]
+    messages = []
+    for case in cases:
+        data = case["input"]
+        if isinstance(data, list):
+            # Multi-frame fixtures need a fresh reassembling decoder
+            decoder = NMEA2000Decoder()
+            for line in data:
+                message = decoder.decode(line)
+        else:
+            message = NMEA2000Decoder(already_combined=True).decode(data)
+        if message is not None:
+            messages.append(message)
+    return messages
+
+
+def build_source_frames(
+    messages: list[NMEA2000Message], sources: int, repeat: int
+) -> dict[int, list[str]]:
+    """Encode the corpus as raw CAN frame lines, once per source address."""
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW)
+    frames: dict[int, list[str]] = {}
+    for source in range(sources):
+        source_frames: list[str] = []
+        for message in messages:
+            message.source = source
+            encoded = encoder.encode(message)
+            source_frames.extend([encoded] if isinstance(encoded, str) else encoded)
+        frames[source] = source_frames * repeat
+    return frames
+
+
+def encode_corpus(
+    messages: list[NMEA2000Message], output_format: N2KFormat
+) -> list[str | bytes]:
+    """Encode the corpus in one format, skipping messages the format cannot carry."""
+    encoder = create_encoder(output_format)
+    encoded_items: list[str | bytes] = []
+    for message in messages:
+        try:
+            encoded = encoder.encode(message)
+        except ValueError:
+            continue
+        if isinstance(encoded, (str, bytes)):
+            encoded_items.append(encoded)
+        else:
+            # python-can messages are not benchmarked
+            encoded_items.extend(
+                item for item in encoded if isinstance(item, (str, bytes))
+            )
+    return encoded_items
+
+
+def load_text_lines() -> list[str]:
+    """Collect the text test inputs plus the corpus encoded in every text format."""
+    lines: list[str] = []
+    for path in sorted(TESTS_DIR.glob("recombine-frames*.in")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            if line and not line.startswith("#"):
+                lines.append(line)
+    messages = load_corpus_messages()
+    for output_format in sorted(TEXT_FORMATS - {N2KFormat.PDGY_DEBUG}):
+        for item in encode_corpus(messages, output_format):
+            lines.append(item.decode().strip() if isinstance(item, bytes) else item)
+    return lines
+
+
+def _time_per_item(func, items: list, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - started) / (len(items) * repeat)
+
+
+def run_detect(args: argparse.Namespace) -> int:
+    """Compare detect_format with the sequential regex scan it replaced."""
+    lines = load_text_lines()
+    messages = load_corpus_messages()
+    packets = [
+        item
+        for output_format in (N2KFormat.EBYTE, N2KFormat.WAVESHARE, N2KFormat.BST_95)
+        for item in encode_corpus(messages, output_format)
+        if isinstance(item, bytes)
+    ]
+    print(f"{len(lines)} text lines, {len(packets)} binary packets")
+
+    sequential = _time_per_item(
+        lambda line: input_formats._detect_text_format_sequential(  # pylint: disable=protected-access
+            line.strip()
+        ),
+        lines,
+        args.repeat,
+    )
+    classified = _time_per_item(detect_format, lines, args.repeat)
+    binary = _time_per_item(
+        lambda packet: detect_format(memoryview(packet)), packets, args.repeat
+    )
+    print(f"text, sequential scan : {sequential * 1e9:8.0f} ns/line")
+    print(
+        f"text, detect_format   : {classified * 1e9:8.0f} ns/line  ({sequential / classified:.2f}x)"
+    )
+    print(f"binary, detect_format : {binary * 1e9:8.0f} ns/packet")
+    return 0
+
+
+def run_formats(args: argparse.Namespace) -> int:
+    """Decode the corpus encoded in each wire format and report lines per second."""
+    messages = load_corpus_messages()
+    print(f"{'format':<22}{'str lines/s':>14}{'bytes lines/s':>16}")
+    for output_format in sorted(
+        set(NMEA2000Decoder.HANDLERS)
+        - {
+            N2KFormat.PDGY_DEBUG,
+            N2KFormat.PYTHON_CAN,
+            N2KFormat.CAN_FRAME_ASCII_RAW_OUT,
+        }
+    ):
+        items = encode_corpus(messages, output_format)
+        if output_format in TEXT_FORMATS:
+            lines = [i.decode() if isinstance(i, bytes) else i for i in items]
+            columns = [lines, [line.encode() for line in lines]]
+        else:
+            columns = [None, items]
+        rates = []
+        for column in columns:
+            if column is None:
+                rates.append(f"{'-':>14}")
+                continue
+            decoder = NMEA2000Decoder(bound_format=output_format)
+            per_item = _time_per_item(decoder.decode, column, args.repeat)
+            decoder.close()
+            rates.append(f"{1 / per_item:14,.0f}")
+        print(f"{output_format.value:<22}{rates[0]}  {rates[1]}")
+    return 0
+
+
+def _import_cost(package_root: Path, repeat: int) -> tuple[float, int, int]:
+    """Return best import seconds, RSS growth and retained heap, in bytes."""
+
+    def probe(mode: str) -> list[str]:
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE, mode],
+            cwd=package_root,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        return result.stdout.split()
+
+    runs = [probe("time") for _ in range(repeat)]
+    elapsed = min(float(run[0]) for run in runs)
+    rss = min(int(run[1]) for run in runs)
+    return elapsed, rss, int(probe("heap")[0])
+
+
+def run_build(args: argparse.Namespace) -> int:
+    """Compare import time and memory of the full and a trimmed generated build."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        trimmed_root = Path(temp_dir)
+        package_dir = trimmed_root / "nmea2000"
+        shutil.copytree(
+            ROOT_DIR / "nmea2000",
+            package_dir,
+            ignore=shutil.ignore_patterns("__pycache__", "pgns.py", "consts.py"),
+        )
+        if args.profile:
+            selection = ["--profile", args.profile]
+        else:
+            selection = ["--pgns", args.pgns or GATEWAY_PGNS]
+        subprocess.run(
+            [sys.executable, "canboat2python.py", *selection]
+            + ["--output-dir", str(package_dir)],
+            cwd=ROOT_DIR,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        # Cold imports should read bytecode, not recompile the generated module
+        for root in (ROOT_DIR, trimmed_root):
+            subprocess.run(
+                [sys.executable, "-m", "compileall", "-q", "nmea2000"],
+                cwd=root,
+                check=True,
+            )
+
+        print(f"{'build':<10}{'pgns.py':>12}{'import':>12}{'RSS':>12}{'heap':>12}")
+        for label, root in (("full", ROOT_DIR), ("trimmed", trimmed_root)):
+            size = (root / "nmea2000" / "pgns.py").stat().st_size
+            elapsed, rss, heap = _import_cost(root, args.repeat)
+            print(
+                f"{label:<10}{size / 1024:>9,.0f} KiB{elapsed * 1e3:>9.1f} ms"
+                f"{rss / 2**20:>8.1f} MiB{heap / 2**20:>8.1f} MiB"
+            )
+    return 0
+
+
+def _gil_label() -> str:
+    # Builds before 3.13 always hold the GIL
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    return "GIL" if is_gil_enabled() else "free-threaded"
+
+
+def run_threads(args: argparse.Namespace) -> int:
+    """Decode per-source frame streams on a shared decoder with N threads."""
+    messages = load_corpus_messages()
+    frames = build_source_frames(messages, args.sources, args.repeat)
+    total = sum(len(f) for f in frames.values())
+    print(f"{total} frames from {args.sources} sources, {_gil_label()} build")
+
+    baseline = None
+    for thread_count in args.threads:
+        decoder = NMEA2000Decoder(bound_format=N2KFormat.CAN_FRAME_ASCII_RAW)
+        # Each thread owns whole sources so per-source frame order is kept
+        shards: list[list[str]] = [[] for _ in range(thread_count)]
+        for source, source_frames in frames.items():
+            shards[source % thread_count].extend(source_frames)
+
+        def worker(shard: list[str], decoder=decoder) -> None:
+            for frame in shard:
+                decoder.decode(frame)
+
+        threads = [threading.Thread(target=worker, args=(s,)) for s in shards]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        decoder.close()
+
+        rate = total / elapsed
+        baseline = baseline or rate
+        print(
+            f"threads={thread_count:<3} {rate:12,.0f} frames/s  speedup={rate / baseline:.2f}x"
+        )
+    return 0
+
+
+def run_serialize(args: argparse.Namespace) -> int:
+    """Compare message size and round-trip cost of the serialization formats."""
+    messages = load_corpus_messages()
+    for message in messages:
+        # Not part of the binary format, so keep the comparison fair
+        message.raw_can_data = None
+    formats = {
+        "binary": (message_to_bytes, message_from_bytes),
+        "json": (lambda m: m.to_json().encode(), NMEA2000Message.from_json),
+        "json compact": (
+            lambda m: m.to_json(compact=True, raw_values=True).encode(),
+            NMEA2000Message.from_json,
+        ),
+        "pickle": (pickle.dumps, pickle.loads),
+    }
+    print(f"{'format':<14}{'bytes/msg':>10}{'encode us':>11}{'decode us':>11}")
+    for name, (dump, load) in formats.items():
+        items = [dump(message) for message in messages]
+        size = sum(len(item) for item in items) / len(items)
+        encode = _time_per_item(dump, messages, args.repeat)
+        decode = _time_per_item(load, items, args.repeat)
+        print(f"{name:<14}{size:10.0f}{encode * 1e6:11.2f}{decode * 1e6:11.2f}")
+    return 0
+
+
+def run_encode(args: argparse.Namespace) -> int:
+    """Report encode throughput per output format, with payloads encoded once."""
+    messages = []
+    for message in load_corpus_messages():
+        try:
+            messages.append(EncodeTemplate(message).message())
+        except ValueError:
+            continue
+    print(f"{len(messages)} messages with precomputed payloads")
+    print(f"{'format':<24}{'encode msg/s':>14}{'encode_many msg/s':>19}{'MB/s':>8}")
+    for output_format in sorted(
+        set(ENCODER_CLASSES) - {N2KFormat.PDGY_DEBUG, N2KFormat.PYTHON_CAN}
+    ):
+        encoder = create_encoder(output_format)
+        per_message = _time_per_item(encoder.encode, messages, args.repeat)
+        started = time.perf_counter()
+        size = 0
+        for _ in range(args.repeat):
+            size += len(encoder.encode_many(messages))
+        elapsed = time.perf_counter() - started
+        rate = len(messages) * args.repeat / elapsed
+        print(
+            f"{output_format.value:<24}{1 / per_message:14,.0f}"
+            f"{rate:19,.0f}{size / elapsed / 1e6:8.1f}"
+        )
+    return 0
+
+
+async def _receive_rate(output_format: N2KFormat, args: argparse.Namespace) -> float:
+    """Stream single-frame messages from the test server and time their delivery."""
+    # pylint: disable=import-outside-toplevel
+    from nmea2000.ioclient import EByteNmea2000Gateway, TextNmea2000Gateway
+    from tests.NMEA2000TestServer import NMEA2000TestServer
+
+    logging.getLogger().setLevel(logging.WARNING)
+    messages = [
+        encode_values("vesselHeading", sid=i % 250, heading=i % 6, source=1)
+        for i in range(args.frames)
+    ]
+    stream = bytes(create_encoder(output_format).encode_many(messages))
+    if output_format == N2KFormat.EBYTE:
+        client = EByteNmea2000Gateway("127.0.0.1", args.port)
+    else:
+        client = TextNmea2000Gateway(
+            "127.0.0.1", args.port, output_format=output_format
+        )
+    server = NMEA2000TestServer("127.0.0.1", args.port, output_format)
+    received = 0
+    done = asyncio.Event()
+
+    async def on_message(_message: NMEA2000Message) -> None:
+        nonlocal received
+        received += 1
+        if received == args.frames:
+            done.set()
+
+    client.set_receive_callback(on_message)
+    await server.start()
+    try:
+        await client.connect()
+        while not server.clients:
+            await asyncio.sleep(0.01)
+        frame_size = len(stream) // args.frames
+        chunk = frame_size * args.burst
+        started = time.perf_counter()
+        for offset in range(0, len(stream), chunk):
+            await server.send_to_clients(stream[offset : offset + chunk])
+        await asyncio.wait_for(done.wait(), timeout=60)
+        return args.frames / (time.perf_counter() - started)
+    finally:
+        await client.close()
+        await server.stop()
+
+
+def run_tcp(args: argparse.Namespace) -> int:
+    """Report receive throughput of the TCP gateway clients against a local server."""
+    print(f"{args.frames} single-frame messages in writes of {args.burst} frames")
+    for output_format in (
+        N2KFormat.EBYTE,
+        N2KFormat.CAN_FRAME_ASCII,
+        N2KFormat.N2K_ASCII_RAW,
+    ):
+        rate = asyncio.run(_receive_rate(output_format, args))
+        print(f"{output_format.value:<24}{rate:12,.0f} frames/s")
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse CLI arguments for the selected benchmark."""
+    parser = argparse.ArgumentParser(description="nmea2000 micro-benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    threads_parser = subparsers.add_parser(
+        "threads", help="Decode throughput of one decoder shared between threads"
+    )
+    threads_parser.add_argument(
+        "--threads",
+        type=lambda v: [int(t) for t in v.split(",")],
+        default=[1, 2, 4, 8],
+        help="Comma separated thread counts (default: 1,2,4,8)",
+    )
+    threads_parser.add_argument(
+        "--sources", type=int, default=32, help="Number of source addresses"
+    )
+    threads_parser.add_argument(
+        "--repeat", type=int, default=20, help="Corpus repetitions per source"
+    )
+    threads_parser.set_defaults(func=run_threads)
+
+    detect_parser = subparsers.add_parser(
+        "detect", help="Input format detection cost per line and packet"
+    )
+    detect_parser.add_argument(
+        "--repeat", type=int, default=200, help="Passes over the corpus"
+    )
+    detect_parser.set_defaults(func=run_detect)
+
+    formats_parser = subparsers.add_parser(
+        "formats", help="Single-threaded decode throughput per wire format"
+    )
+    formats_parser.add_argument(
+        "--repeat", type=int, default=20, help="Passes over the corpus"
+    )
+    formats_parser.set_defaults(func=run_formats)
+
+    build_parser = subparsers.add_parser(
+        "build", help="Import time and memory of the full and a trimmed build"
+    )
+    build_parser.add_argument(
+        "--pgns",
+        type=str,
+        default=None,
+        help="PGNs of the trimmed build (default: a typical gateway set)",
+    )
+    build_parser.add_argument(
+        "--profile", type=str, help="Profile file of the trimmed build"
+    )
+    build_parser.add_argument(
+        "--repeat", type=int, default=5, help="Imports per build, best is kept"
+    )
+    build_parser.set_defaults(func=run_build)
+
+    serialize_parser = subparsers.add_parser(
+        "serialize", help="Size and speed of binary, JSON and pickle messages"
+    )
+    serialize_parser.add_argument(
+        "--repeat", type=int, default=20, help="Passes over the corpus"
+    )
+    serialize_parser.set_defaults(func=run_serialize)
+
+    encode_parser = subparsers.add_parser(
+        "encode", help="Encode throughput of each output format"
+    )
+    encode_parser.add_argument(
+        "--repeat", type=int, default=200, help="Passes over the corpus"
+    )
+    encode_parser.set_defaults(func=run_encode)
+
+    tcp_parser = subparsers.add_parser(
+        "tcp", help="Receive throughput of the TCP gateway clients"
+    )
+    tcp_parser.add_argument(
+        "--frames", type=int, default=100_000, help="Frames sent by the test server"
+    )
+    tcp_parser.add_argument(
+        "--burst", type=int, default=100, help="Frames per server write"
+    )
+    tcp_parser.add_argument(
+        "--port", type=int, default=8882, help="Port of the local test server"
+    )
+    tcp_parser.set_defaults(func=run_tcp)
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Run the selected benchmark."""
+    args = parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,6 @@
 """Generate Python constant and PGN modules from the canboat JSON schema."""
 
+import argparse
 import json
 import keyword
 import os
@@ -7,10 +8,6 @@ import re
 
 from jinja2 import Environment, FileSystemLoader
 
-# Load the JSON data
-with open("canboat.json", encoding="utf-8") as f:
-    json_data = json.load(f)
-
 
 def bits_to_hex(bit_length: int) -> str:
     """Return a hexadecimal mask with all bits up to bit_length set."""
@@ -38,32 +35,197 @@ def generate_field_python_name(field_name, field_type, field_offset):
     return temp
 
 
-# Set up the Jinja2 environment
-file_loader = FileSystemLoader(searchpath="./")
-env = Environment(loader=file_loader, extensions=["jinja2.ext.loopcontrols"])
-env.globals["bits_to_hex"] = bits_to_hex
-env.globals["generate_field_id"] = generate_field_id
-env.globals["generate_field_python_name"] = generate_field_python_name
-env.filters["pyrepr"] = lambda value: repr(str(value))
-
-# Load the Jinja2 template
-template = env.get_template("python.consts.j2")
-
-# Render the template with the JSON data
-output = template.render(data=json_data)
-
-# Save the generated Python code to a file
-with open(os.path.join("nmea2000", "consts.py"), "w", encoding="utf-8") as f:
-    f.write(output)
-
-# Load the Jinja2 template
-template = env.get_template("python.PGNs.j2")
-
-# Render the template with the JSON data
-output = template.render(data=json_data)
-
-# Save the generated Python code to a file
-with open(os.path.join("nmea2000", "pgns.py"), "w", encoding="utf-8") as f:
-    f.write(output)
-
-print("Python code generated successfully!")
+# Attributes every record has, which a field attribute must not shadow
+RECORD_HEADER_ATTRIBUTES = frozenset(
+    {"destination", "entries", "priority", "source", "source_iso_name", "timestamp"}
+)
+
+RECORD_ATTRIBUTE_TYPES = {
+    "BINARY": "bytes | None",
+    "BITLOOKUP": "str | None",
+    "DATE": "_dt.date | None",
+    "DYNAMIC_FIELD_KEY": "str | None",
+    "DYNAMIC_FIELD_VALUE": "bytes | None",
+    "INDIRECT_LOOKUP": "str | None",
+    "ISO_NAME": "int | None",
+    "LOOKUP": "str | None",
+    "STRING_FIX": "str | None",
+    "STRING_LAU": "str | None",
+    "STRING_LZ": "str | None",
+    "TIME": "_dt.time | None",
+    "VARIABLE": "bytes | None",
+}
+
+
+def generate_record_class_name(pgn_id):
+    """Convert a canboat PGN id such as vesselHeading into a class name."""
+    name = pgn_id[0].upper() + pgn_id[1:]
+    return name if name[0].isalpha() else "Pgn" + name
+
+
+def generate_record_attribute_name(field_name, field_type, field_offset):
+    """Return the record attribute of a field, or None for reserved and spare bits."""
+    if field_type in ("RESERVED", "SPARE"):
+        return None
+    name = generate_field_python_name(field_name, field_type, field_offset).lstrip("_")
+    if name[0].isdigit():
+        return "field_" + name
+    if keyword.iskeyword(name) or name in RECORD_HEADER_ATTRIBUTES:
+        return name + "_"
+    return name
+
+
+# PGNs a trimmed build always keeps: the decoder decodes ISO address claims to
+# name sources, and N2KDevice sends and answers the network management PGNs
+REQUIRED_PGNS = frozenset({59392, 59904, 60928, 126208, 126464, 126993, 126996, 126998})
+
+# ManufacturerCodes in consts.py is built from this lookup
+REQUIRED_LOOKUPS = frozenset({"MANUFACTURER_CODE"})
+
+
+def parse_pgn_selection(items):
+    """Split PGN numbers and PGN variant ids, e.g. 127250 or vesselHeading."""
+    pgns, ids = set(), set()
+    for item in items:
+        item = item.strip()
+        if not item:
+            continue
+        if item.isdigit():
+            pgns.add(int(item))
+        else:
+            ids.add(item)
+    return pgns, ids
+
+
+def read_profile(path):
+    """Read a profile file: one PGN number or variant id per line, # comments."""
+    with open(path, encoding="utf-8") as profile:
+        return [line.split("#", 1)[0] for line in profile]
+
+
+def trim_schema(data, pgns, ids):
+    """Return a copy of the schema with only the selected PGNs and their lookups.
+
+    A variant id keeps every variant of its PGN, since the generated decoder
+    picks the variant from the payload and needs all of them to dispatch.
+    """
+    known_ids = {pgn["Id"] for pgn in data["PGNs"]}
+    unknown = sorted(ids - known_ids)
+    if unknown:
+        raise ValueError(f"Unknown PGN ids: {', '.join(unknown)}")
+    known_pgns = {pgn["PGN"] for pgn in data["PGNs"]}
+    unknown_pgns = sorted(pgns - known_pgns)
+    if unknown_pgns:
+        raise ValueError(f"Unknown PGNs: {', '.join(map(str, unknown_pgns))}")
+
+    selected = set(pgns) | REQUIRED_PGNS
+    selected |= {pgn["PGN"] for pgn in data["PGNs"] if pgn["Id"] in ids}
+    kept_pgns = [pgn for pgn in data["PGNs"] if pgn["PGN"] in selected]
+
+    lookups = set(REQUIRED_LOOKUPS)
+    bit_lookups = set()
+    indirect_lookups = set()
+    field_type_lookups = set()
+    for pgn in kept_pgns:
+        for field in pgn["Fields"]:
+            lookups.add(field.get("LookupEnumeration"))
+            bit_lookups.add(field.get("LookupBitEnumeration"))
+            indirect_lookups.add(field.get("LookupIndirectEnumeration"))
+            field_type_lookups.add(field.get("LookupFieldTypeEnumeration"))
+    # Field type lookups decode their values through further lookups
+    for lookup in data["LookupFieldTypeEnumerations"]:
+        if lookup["Name"] in field_type_lookups:
+            for item in lookup["EnumFieldTypeValues"]:
+                lookups.add(item.get("LookupEnumeration"))
+                bit_lookups.add(item.get("LookupBitEnumeration"))
+
+    trimmed = dict(data)
+    trimmed["PGNs"] = kept_pgns
+    for key, names in (
+        ("LookupEnumerations", lookups),
+        ("LookupBitEnumerations", bit_lookups),
+        ("LookupIndirectEnumerations", indirect_lookups),
+        ("LookupFieldTypeEnumerations", field_type_lookups),
+    ):
+        trimmed[key] = [lookup for lookup in data[key] if lookup["Name"] in names]
+    return trimmed
+
+
+def create_environment():
+    """Create the Jinja2 environment the templates are rendered with."""
+    file_loader = FileSystemLoader(searchpath="./")
+    env = Environment(loader=file_loader, extensions=["jinja2.ext.loopcontrols"])
+    env.globals["bits_to_hex"] = bits_to_hex
+    env.globals["generate_field_id"] = generate_field_id
+    env.globals["generate_field_python_name"] = generate_field_python_name
+    env.globals["generate_record_class_name"] = generate_record_class_name
+    env.globals["generate_record_attribute_name"] = generate_record_attribute_name
+    env.globals["record_attribute_types"] = RECORD_ATTRIBUTE_TYPES
+    env.filters["pyrepr"] = lambda value: repr(str(value))
+    return env
+
+
+def generate(data, output_dir):
+    """Render consts.py and pgns.py for the schema into output_dir."""
+    env = create_environment()
+    for template_name, file_name in (
+        ("python.consts.j2", "consts.py"),
+        ("python.PGNs.j2", "pgns.py"),
+    ):
+        output = env.get_template(template_name).render(data=data)
+        with open(os.path.join(output_dir, file_name), "w", encoding="utf-8") as f:
+            f.write(output)
+
+
+def parse_args():
+    """Parse CLI arguments for the generator."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--pgns",
+        type=str,
+        help="Only generate these PGNs, comma separated numbers or variant ids",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        help="Only generate the PGNs listed in this file, one per line",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="nmea2000",
+        help="Directory to write consts.py and pgns.py to (default: nmea2000)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Generate the modules, trimmed to the selected PGNs if any were given."""
+    args = parse_args()
+    with open("canboat.json", encoding="utf-8") as f:
+        data = json.load(f)
+
+    items = []
+    if args.pgns:
+        items.extend(args.pgns.split(","))
+    if args.profile:
+        items.extend(read_profile(args.profile))
+    if args.pgns or args.profile:
+        pgns, ids = parse_pgn_selection(items)
+        try:
+            data = trim_schema(data, pgns, ids)
+        except ValueError as exc:
+            print(f"Error: {exc}")
+            return 1
+        print(
+            f"Trimmed build: {len(data['PGNs'])} PGN variants, "
+            f"{len(data['LookupEnumerations'])} lookups"
+        )
+
+    generate(data, args.output_dir)
+    print("Python code generated successfully!")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
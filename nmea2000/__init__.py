@@ -1,35 +1,81 @@
-"""Public package exports for the nmea2000 library."""
+"""Public package exports for the nmea2000 library.
 
+Gateway clients and ``N2KDevice`` are imported on first access, so offline
+decoding and encoding do not load pyserial, tenacity or python-can.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from .binary import read_binary, write_binary
 from .consts import FieldTypes, ManufacturerCodes, PhysicalQuantities
 from .decoder import NMEA2000Decoder
-from .device import N2KDevice
-from .encoder import create_encoder
-from .ioclient import (
-    ActisenseBstNmea2000Gateway,
-    AsyncIOClient,
-    EByteNmea2000Gateway,
-    PythonCanAsyncIOClient,
-    State,
-    TextNmea2000Gateway,
-    WaveShareNmea2000Gateway,
-)
-from .message import IsoName, NMEA2000Field, NMEA2000Message
+from .encoder import EncodeTemplate, create_encoder, encode_values
+from .jsonl import read_jsonl, write_jsonl
+from .message import IsoName, NMEA2000Field, NMEA2000Message, RepeatingFieldColumns
+from .records import N2KRecord
+
+if TYPE_CHECKING:
+    from .device import N2KDevice
+    from .ioclient import (
+        ActisenseBstNmea2000Gateway,
+        AsyncIOClient,
+        EByteNmea2000Gateway,
+        PythonCanAsyncIOClient,
+        State,
+        TextNmea2000Gateway,
+        WaveShareNmea2000Gateway,
+    )
+
+# Export name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "ActisenseBstNmea2000Gateway": ".ioclient",
+    "AsyncIOClient": ".ioclient",
+    "EByteNmea2000Gateway": ".ioclient",
+    "N2KDevice": ".device",
+    "PythonCanAsyncIOClient": ".ioclient",
+    "State": ".ioclient",
+    "TextNmea2000Gateway": ".ioclient",
+    "WaveShareNmea2000Gateway": ".ioclient",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "ActisenseBstNmea2000Gateway",
     "AsyncIOClient",
     "EByteNmea2000Gateway",
+    "EncodeTemplate",
     "FieldTypes",
     "IsoName",
     "ManufacturerCodes",
     "N2KDevice",
+    "N2KRecord",
     "NMEA2000Decoder",
     "NMEA2000Field",
     "NMEA2000Message",
     "PhysicalQuantities",
     "PythonCanAsyncIOClient",
+    "RepeatingFieldColumns",
     "State",
     "TextNmea2000Gateway",
     "WaveShareNmea2000Gateway",
     "create_encoder",
+    "encode_values",
+    "read_binary",
+    "read_jsonl",
+    "write_binary",
+    "write_jsonl",
 ]
@@ -0,0 +1,518 @@
+"""Versioned binary serialization of NMEA2000Message for IPC and storage.
+
+A message is a fixed header (format version, PGN, source, destination,
+priority, timestamp in nanoseconds, flags and the PGN variant id) followed by
+the value and raw value of every field in the order of the PGN's generated
+field specs. Names, descriptions and types are not stored; they come from the
+generated schema, so the reader must use the same ``pgns.py`` build as the
+writer. Fields whose name, unit or type differ from the schema, such as units
+converted by ``preferred_units``, carry their own metadata. ``hash`` and
+``raw_can_data`` are not stored.
+
+Values are stored column-wise: one type tag byte per value, then every
+fixed-width value packed with a single struct, then the bytes of strings and
+byte fields. The struct of each tag sequence is cached, so a message of a PGN
+seen before packs and unpacks its numbers in one call.
+
+``write_binary`` and ``read_binary`` frame messages with a length prefix for
+streams and files.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from typing import IO, Any
+
+from . import pgns as pgns_module
+from .consts import FieldTypes
+from .jsonl import READ_BUFFER_SIZE, WRITE_BATCH_SIZE
+from .message import (
+    FieldSpec,
+    IsoName,
+    NMEA2000Field,
+    NMEA2000Message,
+    RepeatingFieldColumns,
+    _field_from_spec,
+)
+from .records import LIST_FIELD_ID, record_class
+
+FORMAT_VERSION = 1
+
+# version, PGN, source, destination, priority, timestamp ns, flags, id length
+_HEADER = struct.Struct("<BIBBBqBB")
+# layout, repeating entries, fields with their own metadata, values
+_BODY = struct.Struct("<BIHH")
+_LENGTH = struct.Struct("<I")
+_INT32 = struct.Struct("<i")
+_UINT64 = struct.Struct("<Q")
+
+# Header flags
+_FLAG_UTC_OFFSET = 0x01
+_FLAG_ISO_NAME = 0x02
+
+# What follows the schema fields
+_LAYOUT_PLAIN = 0
+_LAYOUT_ENTRIES = 1
+# The decoder leaves the repeating fields in place when a set has no entries
+_LAYOUT_IN_PLACE = 2
+
+# Value tags and the struct format of their fixed-width part
+_NONE = 0
+_INT = 1
+_BIG_INT = 2
+_FLOAT = 3
+_STR = 4
+_BYTES = 5
+_TIME = 6
+_DATE = 7
+_TRUE = 8
+_FALSE = 9
+# The value and raw value of a field missing from a repeating entry
+_ABSENT = 10
+_TAG_FORMATS = ("", "q", "I", "d", "I", "I", "q", "i", "", "", "")
+_TAG_BY_TYPE: dict[type, int] = {
+    int: _INT,
+    float: _FLOAT,
+    str: _STR,
+    type(None): _NONE,
+    bytes: _BYTES,
+    time: _TIME,
+    date: _DATE,
+}
+# Tag sequences whose values all come out of the struct unchanged
+_PLAIN_TAGS = frozenset((_INT, _FLOAT))
+_STRUCT_CACHE_SIZE = 4096
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+_EPOCH = datetime(1970, 1, 1)
+_FIELD_TYPES = list(FieldTypes)
+_FIELD_TYPE_INDEX = {field_type: i for i, field_type in enumerate(_FIELD_TYPES)}
+
+
+class _AbsentType:
+    """Placeholder value of a field missing from a repeating entry."""
+
+
+_ABSENT_VALUE = _AbsentType()
+
+# Tag sequence -> (struct of its fixed-width values, True if no conversion needed)
+_structs: dict[bytes, tuple[struct.Struct, bool]] = {}
+# ISO NAME -> IsoName rebuilt from it, shared by every message of the device
+_iso_names: dict[int, IsoName] = {}
+
+
+def _values_struct(tags: bytes) -> tuple[struct.Struct, bool]:
+    cached = _structs.get(tags)
+    if cached is None:
+        if len(_structs) >= _STRUCT_CACHE_SIZE:
+            _structs.clear()
+        values_format = "<" + "".join([_TAG_FORMATS[tag] for tag in tags])
+        cached = (struct.Struct(values_format), _PLAIN_TAGS.issuperset(tags))
+        _structs[tags] = cached
+    return cached
+
+
+def message_to_bytes(message: NMEA2000Message) -> bytes:
+    """Serialize a message; the PGN variant must exist in the generated schema."""
+    cls = record_class(message.id)
+    fields = message.fields
+    specs = cls.FIELDS
+    if len(fields) < len(specs):
+        raise _schema_mismatch(message)
+
+    values: list[Any] = []
+    overrides: list[Any] = []
+    for index, (spec, nmea_field) in enumerate(zip(specs, fields)):
+        if nmea_field.id != spec.id:
+            raise _schema_mismatch(message)
+        _add_field(values, overrides, index, spec, nmea_field)
+
+    tail = fields[len(specs) :]
+    entry_count = 0
+    if not tail:
+        layout = _LAYOUT_PLAIN
+    elif len(tail) == 1 and tail[0].id == LIST_FIELD_ID:
+        layout = _LAYOUT_ENTRIES
+        entries = tail[0].value
+        if isinstance(entries, RepeatingFieldColumns):
+            entries = entries.to_entries()
+        elif entries is None:
+            entries = []
+        elif not isinstance(entries, list):
+            raise _schema_mismatch(message)
+        entry_count = len(entries)
+        index = len(specs)
+        for entry in entries:
+            for spec in cls.REPEATING_FIELDS:
+                nmea_field = entry.get(spec.id)
+                if nmea_field is None:
+                    values.append(_ABSENT_VALUE)
+                    values.append(_ABSENT_VALUE)
+                else:
+                    _add_field(values, overrides, index, spec, nmea_field)
+                index += 1
+    elif [f.id for f in tail] == [s.id for s in cls.REPEATING_FIELDS]:
+        layout = _LAYOUT_IN_PLACE
+        for index, (spec, nmea_field) in enumerate(
+            zip(cls.REPEATING_FIELDS, tail), len(specs)
+        ):
+            _add_field(values, overrides, index, spec, nmea_field)
+    else:
+        raise _schema_mismatch(message)
+    values.extend(overrides)
+
+    timestamp = message.timestamp
+    offset = timestamp.utcoffset()
+    flags = 0
+    if offset is not None:
+        flags |= _FLAG_UTC_OFFSET
+        timestamp = timestamp.replace(tzinfo=None)
+    iso_name = message.source_iso_name
+    if iso_name is not None:
+        flags |= _FLAG_ISO_NAME
+    delta = timestamp - _EPOCH
+    nanoseconds = (delta.days * 86400 + delta.seconds) * 1_000_000_000
+    nanoseconds += delta.microseconds * 1000
+    message_id = message.id.encode()
+    parts = [
+        _HEADER.pack(
+            FORMAT_VERSION,
+            message.PGN,
+            message.source,
+            message.destination,
+            message.priority,
+            nanoseconds,
+            flags,
+            len(message_id),
+        ),
+        message_id,
+    ]
+    if offset is not None:
+        parts.append(_INT32.pack(int(offset.total_seconds())))
+    if iso_name is not None:
+        parts.append(_UINT64.pack(iso_name.name))
+    parts.append(_BODY.pack(layout, entry_count, len(overrides) // 4, len(values)))
+    _pack_values(parts, values)
+    return b"".join(parts)
+
+
+def _schema_mismatch(message: NMEA2000Message) -> ValueError:
+    return ValueError(f"PGN: {message.id}: fields do not match the generated schema")
+
+
+def _add_field(
+    values: list[Any],
+    overrides: list[Any],
+    index: int,
+    spec: FieldSpec,
+    nmea_field: NMEA2000Field,
+) -> None:
+    values.append(nmea_field.value)
+    values.append(nmea_field.raw_value)
+    if (
+        nmea_field.unit_of_measurement != spec.unit_of_measurement
+        or nmea_field.type is not spec.type
+        or nmea_field.name != spec.name
+    ):
+        field_type = nmea_field.type
+        overrides.append(index)
+        overrides.append(nmea_field.name)
+        overrides.append(nmea_field.unit_of_measurement)
+        # Dynamic key/value fields carry the looked-up type name as a string
+        overrides.append(_FIELD_TYPE_INDEX.get(field_type, field_type))
+
+
+def _pack_values(parts: list[bytes], values: list[Any]) -> None:
+    tags = bytearray()
+    numbers: list[Any] = []
+    blobs: list[bytes] = []
+    tag_by_type = _TAG_BY_TYPE
+    for value in values:
+        tag = tag_by_type.get(type(value))
+        if tag == _INT:
+            if _INT64_MIN <= value <= _INT64_MAX:
+                numbers.append(value)
+            else:
+                tag = _BIG_INT
+                length = (value.bit_length() + 8) // 8
+                data = value.to_bytes(length, "little", signed=True)
+                numbers.append(len(data))
+                blobs.append(data)
+        elif tag == _FLOAT:
+            numbers.append(value)
+        elif tag == _STR:
+            data = value.encode()
+            numbers.append(len(data))
+            blobs.append(data)
+        elif tag is None:
+            if value is _ABSENT_VALUE:
+                tag = _ABSENT
+            elif value is True:
+                tag = _TRUE
+            elif value is False:
+                tag = _FALSE
+            elif isinstance(value, (bytes, bytearray, memoryview)):
+                tag = _BYTES
+                data = bytes(value)
+                numbers.append(len(data))
+                blobs.append(data)
+            else:
+                type_name = type(value).__name__
+                raise ValueError(f"Cannot serialize a {type_name} field value")
+        elif tag == _BYTES:
+            numbers.append(len(value))
+            blobs.append(value)
+        elif tag == _TIME:
+            numbers.append(
+                ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000
+                + value.microsecond
+            )
+        elif tag == _DATE:
+            numbers.append(value.toordinal())
+        tags.append(tag)
+    tag_bytes = bytes(tags)
+    parts.append(tag_bytes)
+    parts.append(_values_struct(tag_bytes)[0].pack(*numbers))
+    parts.extend(blobs)
+
+
+def message_from_bytes(data: bytes | bytearray | memoryview) -> NMEA2000Message:
+    """Rebuild a message written by ``message_to_bytes``."""
+    view = memoryview(data)
+    try:
+        message, end = _unpack_message(view)
+    except (struct.error, IndexError, StopIteration) as exc:
+        raise ValueError(f"Truncated or corrupt binary message: {exc}") from exc
+    if end != len(view):
+        raise ValueError(f"{len(view) - end} trailing bytes after the message")
+    return message
+
+
+def _unpack_message(view: memoryview) -> tuple[NMEA2000Message, int]:
+    (
+        version,
+        pgn,
+        source,
+        destination,
+        priority,
+        nanoseconds,
+        flags,
+        id_length,
+    ) = _HEADER.unpack_from(view)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary message version {version}")
+    pos = _HEADER.size
+    cls = record_class(str(view[pos : pos + id_length], "ascii"))
+    pos += id_length
+    timestamp = _EPOCH + timedelta(microseconds=nanoseconds // 1000)
+    if flags & _FLAG_UTC_OFFSET:
+        offset = _INT32.unpack_from(view, pos)[0]
+        pos += 4
+        timestamp = timestamp.replace(tzinfo=timezone(timedelta(seconds=offset)))
+    iso_name = None
+    if flags & _FLAG_ISO_NAME:
+        iso_name = _iso_name(_UINT64.unpack_from(view, pos)[0])
+        pos += 8
+    layout, entry_count, override_count, value_count = _BODY.unpack_from(view, pos)
+    pos += _BODY.size
+    values, pos = _unpack_values(view, pos, value_count)
+
+    value_iter = iter(values)
+    fields = [
+        NMEA2000Field(
+            spec.id,
+            spec.name,
+            spec.description,
+            spec.unit_of_measurement,
+            value,
+            raw_value,
+            spec.physical_quantities,
+            spec.type,
+            spec.part_of_primary_key,
+        )
+        for spec, value, raw_value in zip(cls.FIELDS, value_iter, value_iter)
+    ]
+    # Fields in the order their values were written, for the metadata overrides
+    ordered: Sequence[NMEA2000Field | None] = fields
+    if layout == _LAYOUT_ENTRIES:
+        slots: list[NMEA2000Field | None] = list(fields)
+        ordered = slots
+        entries = []
+        for _ in range(entry_count):
+            entry = {}
+            for spec in cls.REPEATING_FIELDS:
+                value = next(value_iter)
+                raw_value = next(value_iter)
+                if value is _ABSENT_VALUE:
+                    slots.append(None)
+                    continue
+                nmea_field = _field_from_spec(spec, value, raw_value)
+                entry[spec.id] = nmea_field
+                slots.append(nmea_field)
+            entries.append(entry)
+        fields.append(
+            NMEA2000Field(
+                LIST_FIELD_ID,
+                "List",
+                None,
+                None,
+                entries,
+                None,
+                None,
+                FieldTypes.VARIABLE,
+                False,
+            )
+        )
+    elif layout == _LAYOUT_IN_PLACE:
+        for spec in cls.REPEATING_FIELDS:
+            value = next(value_iter)
+            fields.append(_field_from_spec(spec, value, next(value_iter)))
+    elif layout != _LAYOUT_PLAIN:
+        raise ValueError(f"Unknown field layout {layout}")
+    for _ in range(override_count):
+        nmea_field = ordered[next(value_iter)]
+        if nmea_field is None:
+            raise ValueError("Metadata override of an absent field")
+        nmea_field.name = next(value_iter)
+        nmea_field.unit_of_measurement = next(value_iter)
+        field_type = next(value_iter)
+        nmea_field.type = (
+            _FIELD_TYPES[field_type] if isinstance(field_type, int) else field_type
+        )
+
+    message = NMEA2000Message(
+        PGN=pgn,
+        id=cls.ID,
+        description=cls.DESCRIPTION,
+        ttl=cls.TTL,
+        fields=fields,
+        source=source,
+        destination=destination,
+        priority=priority,
+        timestamp=timestamp,
+        source_iso_name=iso_name,
+    )
+    return message, pos
+
+
+def _unpack_values(view: memoryview, pos: int, count: int) -> tuple[list[Any], int]:
+    tags = bytes(view[pos : pos + count])
+    if len(tags) != count:
+        raise ValueError("Truncated binary message values")
+    pos += count
+    values_struct, plain = _values_struct(tags)
+    numbers = values_struct.unpack_from(view, pos)
+    pos += values_struct.size
+    if plain:
+        return list(numbers), pos
+
+    values: list[Any] = []
+    number_iter = iter(numbers)
+    for tag in tags:
+        if tag in (_INT, _FLOAT):
+            values.append(next(number_iter))
+        elif tag == _NONE:
+            values.append(None)
+        elif tag in (_STR, _BYTES, _BIG_INT):
+            length = next(number_iter)
+            data = view[pos : pos + length]
+            if len(data) != length:
+                raise ValueError("Truncated binary message value")
+            pos += length
+            if tag == _STR:
+                values.append(str(data, "utf-8"))
+            elif tag == _BYTES:
+                values.append(bytes(data))
+            else:
+                values.append(int.from_bytes(data, "little", signed=True))
+        elif tag == _TIME:
+            seconds, microsecond = divmod(next(number_iter), 1_000_000)
+            minutes, second = divmod(seconds, 60)
+            hour, minute = divmod(minutes, 60)
+            values.append(time(hour, minute, second, microsecond))
+        elif tag == _DATE:
+            values.append(date.fromordinal(next(number_iter)))
+        elif tag == _TRUE:
+            values.append(True)
+        elif tag == _FALSE:
+            values.append(False)
+        elif tag == _ABSENT:
+            values.append(_ABSENT_VALUE)
+        else:
+            raise ValueError(f"Unknown binary value tag {tag}")
+    return values, pos
+
+
+def _iso_name(name: int) -> IsoName:
+    iso_name = _iso_names.get(name)
+    if iso_name is None:
+        claim = pgns_module.decode_pgn_60928(name, 64)
+        iso_name = _iso_names[name] = IsoName(claim, name)
+    return iso_name
+
+
+def write_binary(
+    messages: Iterable[NMEA2000Message], target: str | os.PathLike[str] | IO[bytes]
+) -> int:
+    """Write length-prefixed binary messages to a path or binary file.
+
+    A path is created or truncated. Returns the number of messages written.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as file:
+            return _write_messages(messages, file)
+    return _write_messages(messages, target)
+
+
+def _write_messages(messages: Iterable[NMEA2000Message], file: IO[bytes]) -> int:
+    count = 0
+    batch: list[bytes] = []
+    for message in messages:
+        data = message_to_bytes(message)
+        batch.append(_LENGTH.pack(len(data)))
+        batch.append(data)
+        count += 1
+        if len(batch) == 2 * WRITE_BATCH_SIZE:
+            file.write(b"".join(batch))
+            batch = []
+    if batch:
+        file.write(b"".join(batch))
+    return count
+
+
+def read_binary(
+    source: str | os.PathLike[str] | IO[bytes],
+) -> Iterator[NMEA2000Message]:
+    """Yield the messages of a stream written by ``write_binary``."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb", buffering=READ_BUFFER_SIZE) as file:
+            yield from _read_messages(file)
+    else:
+        yield from _read_messages(source)
+
+
+def _read_messages(file: IO[bytes]) -> Iterator[NMEA2000Message]:
+    while True:
+        prefix = file.read(_LENGTH.size)
+        if not prefix:
+            return
+        if len(prefix) != _LENGTH.size:
+            raise ValueError("Truncated binary message length")
+        length = _LENGTH.unpack(prefix)[0]
+        data = file.read(length)
+        if len(data) != length:
+            raise ValueError("Truncated binary message")
+        yield message_from_bytes(data)
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "message_from_bytes",
+    "message_to_bytes",
+    "read_binary",
+    "write_binary",
+]
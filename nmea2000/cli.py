@@ -2,14 +2,16 @@
 
 import argparse
 import asyncio
+import itertools
 import logging
 import sys
 from pathlib import Path
 
 import can.cli
+import orjson
 
 from .decoder import NMEA2000Decoder
-from .encoder import create_encoder
+from .encoder import EncoderInterface, create_encoder
 from .input_formats import TEXT_FORMATS, N2KFormat
 from .ioclient import (
     ActisenseBstNmea2000Gateway,
@@ -20,6 +22,7 @@ from .ioclient import (
     TextNmea2000Gateway,
     WaveShareNmea2000Gateway,
 )
+from .jsonl import WRITE_BATCH_SIZE, read_jsonl
 from .message import NMEA2000Message
 
 logger = logging.getLogger(__name__)
@@ -39,15 +42,26 @@ async def handle_received_message_json(message: NMEA2000Message):
     print(message.to_json(), flush=True)
 
 
+async def handle_received_message_compact_json(message: NMEA2000Message):
+    """Callback function that outputs compact JSON (field values only), one per line."""
+    print(message.to_json(compact=True, raw_values=True), flush=True)
+
+
 # Define status change callback as a standalone function
 async def handle_status_change(state: State):
     """Callback function for status changes."""
     print(f"Connection status: {state}")
 
 
-async def interactive_client(client: AsyncIOClient, json_output: bool = False):
+async def interactive_client(
+    client: AsyncIOClient, json_output: bool = False, compact_json: bool = False
+):
     """Interactive client function to handle user input."""
-    callback = handle_received_message_json if json_output else handle_received_message
+    callback = handle_received_message
+    if compact_json:
+        callback = handle_received_message_compact_json
+    elif json_output:
+        callback = handle_received_message_json
     client.set_receive_callback(callback)
     client.set_status_callback(handle_status_change)
     await client.connect()
@@ -98,6 +112,31 @@ def parse(filename: str, decoder: NMEA2000Decoder):
         sys.stdout.flush()
 
 
+def encode_file(filename: str, encoder: EncoderInterface) -> None:
+    """Print the encoding of a JSON message file or of every line of a JSONL file."""
+    with open(filename, "rb") as file:
+        first_line = file.readline()
+    try:
+        orjson.loads(first_line)  # pylint: disable=no-member
+    except orjson.JSONDecodeError:  # pylint: disable=no-member
+        # A single, possibly pretty-printed, JSON document
+        print(encoder.encode(NMEA2000Message.from_json(Path(filename).read_bytes())))
+        return
+    for message in read_jsonl(filename):
+        print(encoder.encode(message))
+
+
+def encode_capture(filename: str, encoder: EncoderInterface, output: str) -> int:
+    """Write the frames of every message of a JSONL file to a capture file."""
+    messages = read_jsonl(filename)
+    count = 0
+    with open(output, "wb") as capture:
+        while batch := list(itertools.islice(messages, WRITE_BATCH_SIZE)):
+            capture.write(encoder.encode_many(batch))
+            count += len(batch)
+    return count
+
+
 def _add_common_client_args(sub: argparse.ArgumentParser):
     """Add arguments shared by all gateway client subcommands."""
     sub.add_argument("--dump_file", type=str, help="Record frames to a given file")
@@ -109,6 +148,11 @@ def _add_common_client_args(sub: argparse.ArgumentParser):
         action="store_true",
         help="Output received messages as JSON, one per line",
     )
+    sub.add_argument(
+        "--compact",
+        action="store_true",
+        help="Output compact JSON with field values and raw values only",
+    )
 
 
 async def async_main():
@@ -135,6 +179,16 @@ async def async_main():
         action="store_true",
         help="Fast frame is already merged to single line",
     )
+    decode_parser.add_argument(
+        "--mixed_formats",
+        action="store_true",
+        help="The file interleaves several input formats",
+    )
+    decode_parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Output compact JSON with field values and raw values only",
+    )
 
     # Encode command
     encode_parser = subparsers.add_parser("encode", help="Encode an NMEA 2000 frame")
@@ -144,7 +198,21 @@ async def async_main():
         "--frame", type=str, help="json NMEA 2000 frame (optional if file is provided)"
     )
     encode_parser.add_argument(
-        "--file", type=str, help="Path to a file containing a JSON NMEA 2000 frame"
+        "--file",
+        type=str,
+        help="Path to a JSON NMEA 2000 frame, or a JSONL file with one per line",
+    )
+    encode_parser.add_argument(
+        "--format",
+        type=N2KFormat,
+        default=N2KFormat.N2K_ASCII_RAW,
+        help="Output format (default: n2k_ascii_raw). Options: "
+        + ", ".join(f.value for f in N2KFormat),
+    )
+    encode_parser.add_argument(
+        "--output",
+        type=str,
+        help="Write the frames of a JSONL --file to this capture file",
     )
 
     # --- Gateway client subcommands (one per AsyncIOClient) ---
@@ -241,13 +309,15 @@ async def async_main():
         root_logger.addHandler(logging.StreamHandler())
 
     if args.command == "decode":
-        decoder = NMEA2000Decoder(already_combined=args.single_line)
+        decoder = NMEA2000Decoder(
+            already_combined=args.single_line, mixed_formats=args.mixed_formats
+        )
 
         # Decode from a frame string if provided
         if args.frame:
             decoded = decoder.decode(args.frame)
             if decoded is not None:
-                print(decoded.to_json())
+                print(decoded.to_json(compact=args.compact, raw_values=args.compact))
 
         # Decode from a file if provided
         elif args.file:
@@ -257,7 +327,7 @@ async def async_main():
             sys.exit(1)
 
     elif args.command == "encode":
-        encoder = create_encoder(N2KFormat.N2K_ASCII_RAW)
+        encoder = create_encoder(args.format)
 
         # Encode from a frame json
         if args.frame:
@@ -266,13 +336,16 @@ async def async_main():
             encoded = encoder.encode(NMEA2000Message.from_json(args.frame))
             print(encoded)
 
+        # Stream a JSONL file to a capture file
+        elif args.file and args.output:
+            count = await asyncio.to_thread(
+                encode_capture, args.file, encoder, args.output
+            )
+            print(f"Encoded {count} messages to {args.output}")
+
         # Encode from a json file
         elif args.file:
-            json_string = await asyncio.to_thread(
-                Path(args.file).read_text, encoding="utf-8"
-            )
-            encoded = encoder.encode(NMEA2000Message.from_json(json_string))
-            print(encoded)
+            await asyncio.to_thread(encode_file, args.file, encoder)
         else:
             print("Error: You must provide either a frame or a file to encode.")
             sys.exit(1)
@@ -289,7 +362,9 @@ async def async_main():
             dump_to_file=args.dump_file,
             dump_pgns=args.dump_pgns,
         )
-        await interactive_client(client, json_output=args.json)
+        await interactive_client(
+            client, json_output=args.json, compact_json=args.compact
+        )
 
     elif args.command == "text":
         fmt_label = args.format.name if args.format else "AUTO"
@@ -306,7 +381,9 @@ async def async_main():
             dump_to_file=args.dump_file,
             dump_pgns=args.dump_pgns,
         )
-        await interactive_client(client, json_output=args.json)
+        await interactive_client(
+            client, json_output=args.json, compact_json=args.compact
+        )
 
     elif args.command == "actisense_bst":
         logger.info(
@@ -320,23 +397,29 @@ async def async_main():
             dump_to_file=args.dump_file,
             dump_pgns=args.dump_pgns,
         )
-        await interactive_client(client, json_output=args.json)
+        await interactive_client(
+            client, json_output=args.json, compact_json=args.compact
+        )
 
     elif args.command == "waveshare":
         logger.info("Using WaveShareNmea2000Gateway with port: %s", args.port)
         client = WaveShareNmea2000Gateway(
             port=args.port, dump_to_file=args.dump_file, dump_pgns=args.dump_pgns
         )
-        await interactive_client(client, json_output=args.json)
+        await interactive_client(
+            client, json_output=args.json, compact_json=args.compact
+        )
 
     elif args.command == "can":
         logger.info("Using PythonCanAsyncIOClient with interface: %s", args.interface)
-        consumed = ["command", "dump_file", "dump_pgns", "json", "verbose"]
+        consumed = ["command", "compact", "dump_file", "dump_pgns", "json", "verbose"]
         kwargs = {k: v for (k, v) in args.__dict__.items() if k not in consumed}
         client = PythonCanAsyncIOClient(
             dump_to_file=args.dump_file, dump_pgns=args.dump_pgns, **kwargs
         )
-        await interactive_client(client, json_output=args.json)
+        await interactive_client(
+            client, json_output=args.json, compact_json=args.compact
+        )
 
 
 def main():
@@ -4,19 +4,28 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterator, MutableMapping
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta
 from importlib import import_module
-from typing import ClassVar
+from typing import Any, ClassVar, TypeAlias
 
 from . import pgns as pgns_module
 from .consts import PhysicalQuantities
-from .input_formats import N2KFormat, N2KInput, detect_format
-from .message import IsoName, NMEA2000Message
+from .input_formats import N2KFormat, N2KInput, detect_format, looks_like_format
+from .message import IsoName, NMEA2000Field, NMEA2000Message
+from .records import N2KRecord
 
 logger = logging.getLogger(__name__)
 
+# Payloads are passed in wire order and may view a receive buffer; anything
+# kept after a decode call returns is copied to bytes first.
+_BytesLike: TypeAlias = bytes | bytearray | memoryview
+
 
 class InvalidFrameError(Exception):
     """Raised when a USB frame has invalid structure (bad checksum, wrong length, etc.)."""
@@ -39,6 +48,143 @@ class FastPgnMetadata:
         )
 
 
+class OnChangeEntry:
+    """Last delivered state for one network-map key in on-change mode."""
+
+    def __init__(
+        self,
+        pgn: int,
+        payload: bytes,
+        data_length_bits: int,
+        fields: dict[str, NMEA2000Field],
+        emitted_at: datetime,
+    ) -> None:
+        self.pgn = pgn
+        self.payload = payload
+        self.data_length_bits = data_length_bits
+        self.fields = fields
+        self.emitted_at = emitted_at
+        # Unchanged repeats suppressed since the last delivery, and before it
+        self.repeats = 0
+        self.delivered_repeats = 0
+
+    def __repr__(self):
+        return (
+            "<OnChangeEntry "
+            f"fields={len(self.fields)} emitted_at={self.emitted_at} repeats={self.repeats}>"
+        )
+
+
+class RateLimitWindow:
+    """Current rate-limit window for one PGN and source."""
+
+    def __init__(self, started_at: datetime) -> None:
+        self.started_at = started_at
+        # Arguments for _decode_payload of the latest message in keep-latest mode
+        self.pending: tuple | None = None
+
+    def __repr__(self):
+        return (
+            "<RateLimitWindow "
+            f"started_at={self.started_at} pending={self.pending is not None}>"
+        )
+
+
+class RateLimitClock:
+    """Timestamp of the latest rate-limited frame and when it was decoded."""
+
+    def __init__(self) -> None:
+        # (frame timestamp, time.monotonic() when it was decoded), set together
+        self.latest: tuple[datetime, float] | None = None
+
+    def now(self, live: bool) -> datetime | None:
+        """Return the latest frame timestamp, advanced by the time since it in live mode."""
+        latest = self.latest
+        if latest is None:
+            return None
+        timestamp, decoded_at = latest
+        if not live:
+            return timestamp
+        return timestamp + timedelta(seconds=time.monotonic() - decoded_at)
+
+    def __repr__(self):
+        return f"<RateLimitClock latest={self.latest}>"
+
+
+class RecordRequest:
+    """Receives the record of a decode run by ``decode_record``.
+
+    Passed down the decode call chain, it makes the generated decode functions
+    fill the PGN record directly instead of building a message.
+    """
+
+    __slots__ = ("record",)
+
+    def __init__(self) -> None:
+        self.record: N2KRecord | None = None
+
+
+class SourceRecord:
+    """Network-map entry for one source address, rebuilt only when its NAME changes."""
+
+    def __init__(self, iso_name: IsoName, manufacturer_allowed: bool) -> None:
+        self.iso_name = iso_name
+        self.name = iso_name.name
+        self.manufacturer_allowed = manufacturer_allowed
+
+    def __repr__(self):
+        return (
+            "<SourceRecord "
+            f"name={self.name} manufacturer_allowed={self.manufacturer_allowed}>"
+        )
+
+
+class SourceIsoNames(MutableMapping[int, IsoName]):
+    """Source address to ISO NAME view over a decoder's source records.
+
+    Writes go through to the records, so the manufacturer verdict of a source
+    is updated together with its NAME.
+    """
+
+    def __init__(self, decoder: DecoderBase) -> None:
+        self._decoder = decoder
+
+    def __getitem__(self, src: int) -> IsoName:
+        record = self._decoder.source_records[src] if 0 <= src < 256 else None
+        if record is None:
+            raise KeyError(src)
+        return record.iso_name
+
+    def __setitem__(self, src: int, iso_name: IsoName) -> None:
+        if not 0 <= src < 256:
+            raise ValueError(f"Invalid source address: {src}")
+        self._decoder._set_source_iso_name(src, iso_name)  # pylint: disable=protected-access
+
+    def __delitem__(self, src: int) -> None:
+        if not 0 <= src < 256 or self._decoder.source_records[src] is None:
+            raise KeyError(src)
+        self._decoder.source_records[src] = None
+
+    def __iter__(self) -> Iterator[int]:
+        records = self._decoder.source_records
+        return (src for src, record in enumerate(records) if record is not None)
+
+    def __len__(self) -> int:
+        return sum(record is not None for record in self._decoder.source_records)
+
+    def __repr__(self):
+        return f"<SourceIsoNames {dict(self)}>"
+
+
+SNAPSHOT_VERSION = 3
+
+
+def _check_snapshot_version(snapshot: dict[str, Any]) -> None:
+    version = snapshot.get("version")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported decoder snapshot version: {version}")
+
+
 ISO_CLAIM_PGN = 60928
 ISO_CLAIM_PGN_ID = "isoAddressClaim"
 
@@ -111,13 +257,42 @@ class DecoderInterface(DecoderStaticsMixin, ABC):
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        """Decode the input data and return an NMEA2000Message object."""
+        """Decode the input data and return an NMEA2000Message object.
+
+        With a ``record_request`` the decoded PGN record is stored in it
+        instead, and None is returned.
+        """
 
     @abstractmethod
     def close(self):
         """Close any resources held by the decoder, such as dump files."""
 
+    def get_statistics(self) -> dict[str, int | float]:
+        """Return decoder counters, such as suppressed or dropped messages."""
+        return {}
+
+    def suppressed_repeats(self, message: NMEA2000Message) -> int:
+        """Return how many unchanged repeats on-change mode dropped before message."""
+        del message
+        return 0
+
+    def flush_rate_limited(
+        self, force: bool = False, now: datetime | None = None, live: bool = False
+    ) -> list[NMEA2000Message]:
+        """Return the held keep-latest messages whose rate-limit window ended."""
+        del force, now, live
+        return []
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the decoder state as a JSON-serializable dict."""
+        return {"version": SNAPSHOT_VERSION}
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Load state previously returned by :meth:`snapshot`."""
+        del snapshot
+
     def __enter__(self):
         return self
 
@@ -138,10 +313,17 @@ class DecoderBase(DecoderStaticsMixin):
         preferred_units: dict[PhysicalQuantities, str] | None = None,
         dump_to_file: str | None = None,
         dump_pgns: list[int | str] | None = None,
+        dump_compact: bool = False,
         build_network_map: bool = False,
         bound_format: N2KFormat | None = None,
         started_at: datetime | None = None,
         already_combined: bool = False,
+        on_change: bool = False,
+        on_change_heartbeat: timedelta | None = None,
+        rate_limits: dict[int, float] | None = None,
+        rate_limit_keep_latest: bool = False,
+        decode_cache_size: int = 0,
+        columnar_repeating: bool = False,
     ) -> None:
         if exclude_pgns is None:
             exclude_pgns = []
@@ -153,6 +335,8 @@ class DecoderBase(DecoderStaticsMixin):
             include_manufacturer_code = []
         if preferred_units is None:
             preferred_units = {}
+        if rate_limits is None:
+            rate_limits = {}
         if dump_pgns is None:
             dump_pgns = []
 
@@ -160,6 +344,7 @@ class DecoderBase(DecoderStaticsMixin):
         self.already_combined = already_combined
         self.data: dict[str, FastPgnMetadata] = {}
         self.dump_file = None
+        self.dump_compact = dump_compact
         self.build_network_map = build_network_map
         self.started_at = started_at or datetime.now()
 
@@ -186,8 +371,56 @@ class DecoderBase(DecoderStaticsMixin):
             dump_pgns
         )
         self.preferred_units = {k: v.lower() for k, v in preferred_units.items()}
-        self.source_to_iso_name: dict[int, IsoName] = {}
+        # Indexed by source address
+        self.source_records: list[SourceRecord | None] = [None] * 256
+        # Interned by NAME, so a device that changes address keeps its IsoName
+        self._iso_names_by_name: dict[int, IsoName] = {}
         self.logged_unsupported_pgns: set[int] = set()
+        # Per-source state (fast-packet sessions, ISO names, on-change and
+        # rate-limit entries) is only touched while holding that source's lock,
+        # so one decoder can be shared by threads handling different sources.
+        self._source_locks = [threading.Lock() for _ in range(256)]
+        self._statistics_lock = threading.Lock()
+        self._dump_lock = threading.Lock()
+        # on_change_suppressed, decode_cache_hits and decode_cache_misses
+        self.counters: Counter[str] = Counter()
+
+        if on_change_heartbeat is not None and not on_change:
+            raise ValueError("on_change_heartbeat requires on_change")
+        self.on_change = on_change
+        self.on_change_heartbeat = on_change_heartbeat
+        # (primary key, source) -> last delivered state
+        self.on_change_entries: dict[tuple[str, int], OnChangeEntry] = {}
+        # (pgn, source) -> {payload: (primary key, source)}, lets identical
+        # repeats be dropped before the generated decode function runs
+        self.on_change_payloads: dict[
+            tuple[int, int], dict[bytes, tuple[str, int]]
+        ] = {}
+
+        if not isinstance(rate_limits, dict):
+            raise ValueError("rate_limits must be a dict of PGN to maximum rate in Hz")
+        if ISO_CLAIM_PGN in rate_limits:
+            raise ValueError("ISO address claims cannot be rate limited")
+        self.rate_limit_intervals: dict[int, timedelta] = {}
+        for pgn, rate in rate_limits.items():
+            if rate <= 0:
+                raise ValueError(f"Rate limit for PGN {pgn} must be positive")
+            self.rate_limit_intervals[pgn] = timedelta(seconds=1 / rate)
+        self.rate_limit_keep_latest = rate_limit_keep_latest
+        self.rate_limit_windows: dict[tuple[int, int], RateLimitWindow] = {}
+        self.rate_limit_clock = RateLimitClock()
+        self.rate_limit_drops: Counter[int] = Counter()
+
+        if decode_cache_size < 0:
+            raise ValueError("decode_cache_size must not be negative")
+        self.decode_cache_size = decode_cache_size
+        # (pgn, payload, length in bits) -> decoded message with preferred units applied
+        self._decode_cache: OrderedDict[tuple[int, bytes, int], NMEA2000Message] = (
+            OrderedDict()
+        )
+        self._decode_cache_lock = threading.Lock()
+        # Repeating field sets as RepeatingFieldColumns instead of lists of dicts
+        self.columnar_repeating = columnar_repeating
 
         self.iso_claim_filter = (
             (ISO_CLAIM_PGN in self.exclude_pgns)
@@ -214,6 +447,37 @@ class DecoderBase(DecoderStaticsMixin):
         logger.info("Preffered units: %s", self.preferred_units)
         logger.info("Dump location: %s, PGNs: %s", dump_to_file, dump_pgns)
 
+    # State a decoder shares with its siblings when one stream mixes formats
+    _SHARED_STATE_ATTRIBUTES: ClassVar[tuple[str, ...]] = (
+        "data",
+        "dump_file",
+        "started_at",
+        "source_records",
+        "_iso_names_by_name",
+        "logged_unsupported_pgns",
+        "_source_locks",
+        "_statistics_lock",
+        "_dump_lock",
+        "counters",
+        "on_change_entries",
+        "on_change_payloads",
+        "rate_limit_windows",
+        "rate_limit_clock",
+        "rate_limit_drops",
+        "_decode_cache",
+        "_decode_cache_lock",
+    )
+
+    def share_state_from(self, other: DecoderBase) -> None:
+        """Use the reassembly, network-map and filter state of ``other``.
+
+        Both decoders then read and update the same objects, so fast packets,
+        ISO claims and on-change state carry over when the input format changes.
+        They must have been created with the same options.
+        """
+        for name in self._SHARED_STATE_ATTRIBUTES:
+            setattr(self, name, getattr(other, name))
+
     def _decode_fast_message(
         self,
         pgn: int,
@@ -221,9 +485,10 @@ class DecoderBase(DecoderStaticsMixin):
         src: int,
         dest: int,
         timestamp: datetime,
-        can_data: bytes,
+        can_data: _BytesLike,
         source_iso_name: IsoName | None,
-        raw_can_data: bytes | str,
+        raw_can_data: _BytesLike | str,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
         """Parse a fast packet message and store the data until all frames are received."""
         fast_packet_key = f"{pgn}_{src}_{dest}"
@@ -234,12 +499,12 @@ class DecoderBase(DecoderStaticsMixin):
 
         fast_pgn = self.data[fast_packet_key]
 
-        # the last byte has the sequence_counter and frame_counter
-        last_byte = can_data[-1]
+        # the first byte has the sequence_counter and frame_counter
+        first_byte = can_data[0]
 
-        # Extract the sequence counter (high 3 bits) and frame counter (low 5 bits) from the last byte
-        sequence_counter = (last_byte >> 5) & 0b111  # Extract high 3 bits
-        frame_counter = last_byte & 0b11111  # Extract low 5 bits
+        # Extract the sequence counter (high 3 bits) and frame counter (low 5 bits) from the first byte
+        sequence_counter = (first_byte >> 5) & 0b111  # Extract high 3 bits
+        frame_counter = first_byte & 0b11111  # Extract low 5 bits
         total_bytes = None
 
         if frame_counter != 0 and fast_pgn.payload_length == 0:
@@ -252,8 +517,8 @@ class DecoderBase(DecoderStaticsMixin):
 
         # if this is the first frame of new sequence we will start over
         if frame_counter == 0 and sequence_counter != fast_pgn.sequence_counter:
-            # Extract the total number of frames from the second-to-last byte
-            total_bytes = can_data[-2]
+            # Extract the total number of bytes from the second byte
+            total_bytes = can_data[1]
 
             # Start a new pgn hass structure
             fast_pgn.payload_length = total_bytes
@@ -261,8 +526,8 @@ class DecoderBase(DecoderStaticsMixin):
             fast_pgn.bytes_stored = 0  # Reset bytes stored for a new message
             fast_pgn.frames.clear()  # Clear previous frames
 
-            # For the first frame, exclude the last 4 hex characters (2 bytes) from the payload
-            data_payload = can_data[:-2]
+            # For the first frame, exclude the counter and length bytes from the payload
+            data_payload = can_data[2:]
         else:
             if sequence_counter != fast_pgn.sequence_counter:
                 logger.debug(
@@ -276,13 +541,13 @@ class DecoderBase(DecoderStaticsMixin):
                     "Frame %s for PGN %s is already stored.", frame_counter, pgn
                 )
                 return None
-            # For subsequent frames, exclude the last byte from the payload
-            data_payload = can_data[:-1]
+            # For subsequent frames, exclude the counter byte from the payload
+            data_payload = can_data[1:]
 
         byte_length = len(data_payload)
 
-        # Store the frame data
-        fast_pgn.frames[frame_counter] = data_payload
+        # Store the frame data, copied as can_data may view a reused receive buffer
+        fast_pgn.frames[frame_counter] = bytes(data_payload)
         fast_pgn.bytes_stored += byte_length  # Update the count of bytes stored
 
         # Log the extracted values
@@ -291,9 +556,13 @@ class DecoderBase(DecoderStaticsMixin):
         )
         if total_bytes is not None:
             logger.debug("Total Payload Bytes: %s", total_bytes)
-        logger.debug(
-            "Orig Payload (hex): %s, Data Payload (hex): %s", can_data, data_payload
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Log hex copies, a log record must not hold a view of the input
+            logger.debug(
+                "Orig Payload (hex): %s, Data Payload (hex): %s",
+                can_data.hex(),
+                data_payload.hex(),
+            )
         logger.debug("PGN Data: %s", fast_pgn)
 
         # Check if all expected bytes have been stored
@@ -301,13 +570,9 @@ class DecoderBase(DecoderStaticsMixin):
             logger.debug("All Fast packet frames collected for PGN: %d", pgn)
 
             # All data for this PGN has been received, proceed to publish
-            combined_payload = bytes(
-                [
-                    b
-                    for idx in sorted(fast_pgn.frames)
-                    for b in fast_pgn.frames[idx][::-1]
-                ]
-            )[::-1]
+            combined_payload = b"".join(
+                fast_pgn.frames[idx] for idx in sorted(fast_pgn.frames)
+            )
 
             nmea = None
             if combined_payload is not None:
@@ -322,6 +587,7 @@ class DecoderBase(DecoderStaticsMixin):
                     source_iso_name,
                     raw_can_data,
                     fast_pgn.payload_length * 8,
+                    record_request,
                 )
 
             # Reset the structure for this PGN
@@ -334,6 +600,48 @@ class DecoderBase(DecoderStaticsMixin):
         )
         return None
 
+    @property
+    def source_to_iso_name(self) -> SourceIsoNames:
+        """Map of source address to the ISO NAME it last claimed.
+
+        A live view of ``source_records``; assigning an entry updates the
+        source's record.
+        """
+        return SourceIsoNames(self)
+
+    @source_to_iso_name.setter
+    def source_to_iso_name(self, iso_names: dict[int, IsoName]) -> None:
+        view = SourceIsoNames(self)
+        view.clear()
+        view.update(iso_names)
+
+    def _manufacturer_allowed(self, iso_name: IsoName) -> bool:
+        if iso_name.manufacturer_code is None:
+            return True
+        manufacturer_code = iso_name.manufacturer_code.lower()
+        if manufacturer_code in self.exclude_manufacturer_code:
+            return False
+        return (
+            len(self.include_manufacturer_code) == 0
+            or manufacturer_code in self.include_manufacturer_code
+        )
+
+    def _set_source_record(
+        self, src: int, claim: NMEA2000Message, name: int
+    ) -> SourceRecord:
+        """Record the NAME claimed by a source, reusing a known IsoName."""
+        iso_name = self._iso_names_by_name.get(name)
+        if iso_name is None:
+            iso_name = self._iso_names_by_name[name] = IsoName(claim, name)
+        return self._set_source_iso_name(src, iso_name)
+
+    def _set_source_iso_name(self, src: int, iso_name: IsoName) -> SourceRecord:
+        self._iso_names_by_name.setdefault(iso_name.name, iso_name)
+        record = self.source_records[src] = SourceRecord(
+            iso_name, self._manufacturer_allowed(iso_name)
+        )
+        return record
+
     def _log_unsupported_pgn_once(self, pgn_id: int) -> None:
         if pgn_id not in self.logged_unsupported_pgns:
             logger.warning("Not supporrted PGN: %d", pgn_id)
@@ -346,11 +654,43 @@ class DecoderBase(DecoderStaticsMixin):
         source_id: int,
         destination_id: int,
         timestamp: datetime,
-        can_data: bytes,
-        raw_can_data: bytes | str,
+        can_data: _BytesLike,
+        raw_can_data: _BytesLike | str,
         already_combined: bool = False,
+        record_request: RecordRequest | None = None,
+    ) -> NMEA2000Message | None:
+        """Decode a single PGN message.
+
+        Frames are serialized per source address, so concurrent callers only
+        contend when they feed frames from the same source.
+        """
+        if not 0 <= source_id <= 255:
+            raise ValueError(f"Invalid source address: {source_id}")
+        with self._source_locks[source_id]:
+            return self._decode_source_frame(
+                pgn,
+                priority,
+                source_id,
+                destination_id,
+                timestamp,
+                can_data,
+                raw_can_data,
+                already_combined,
+                record_request,
+            )
+
+    def _decode_source_frame(
+        self,
+        pgn: int,
+        priority: int,
+        source_id: int,
+        destination_id: int,
+        timestamp: datetime,
+        can_data: _BytesLike,
+        raw_can_data: _BytesLike | str,
+        already_combined: bool,
+        record_request: RecordRequest | None,
     ) -> NMEA2000Message | None:
-        """Decode a single PGN message."""
         source_iso_name = None
         # Check if the PGN should be excluded or included
         if (
@@ -367,44 +707,30 @@ class DecoderBase(DecoderStaticsMixin):
                 logger.debug("Excluding (by include) PGN: %s", pgn)
                 return None
 
-            source_iso_name = self.source_to_iso_name.get(source_id, None)
-            if source_iso_name is None and self.build_network_map:
-                if self.started_at > datetime.now() - timedelta(minutes=10):
-                    logger.debug(
-                        "No ISO name found for source %s in PGN id %s. Skipping the message for now.",
+            record = self.source_records[source_id]
+            if record is None:
+                if self.build_network_map:
+                    if self.started_at > datetime.now() - timedelta(minutes=10):
+                        logger.debug(
+                            "No ISO name found for source %s in PGN id %s. Skipping the message for now.",
+                            source_id,
+                            pgn,
+                        )
+                        return None
+                    logger.warning(
+                        "No ISO name found for source %s in PGN id %s for too long. Will process it anyhow.",
                         source_id,
                         pgn,
                     )
-                    return None
-                logger.warning(
-                    "No ISO name found for source %s in PGN id %s for too long. Will process it anyhow.",
-                    source_id,
+            elif not record.manufacturer_allowed:
+                logger.debug(
+                    "Excluding PGN: %s based on manufacturer code %s",
                     pgn,
+                    record.iso_name.manufacturer_code,
                 )
-
-            if (
-                source_iso_name is not None
-                and source_iso_name.manufacturer_code is not None
-            ):
-                # Check if the PGN should be excluded or included based on manufacturer
-                manufacturer_code = source_iso_name.manufacturer_code.lower()
-                if manufacturer_code in self.exclude_manufacturer_code:
-                    logger.debug(
-                        "Excluding PGN: %s based on manufacturer code %s",
-                        pgn,
-                        source_iso_name.manufacturer_code,
-                    )
-                    return None
-                if (
-                    len(self.include_manufacturer_code) > 0
-                    and manufacturer_code not in self.include_manufacturer_code
-                ):
-                    logger.debug(
-                        "Excluding (by include) PGN: %s based on manufacturer code %s",
-                        pgn,
-                        source_iso_name.manufacturer_code,
-                    )
-                    return None
+                return None
+            else:
+                source_iso_name = record.iso_name
 
         is_fast = False
         if not already_combined:
@@ -423,6 +749,7 @@ class DecoderBase(DecoderStaticsMixin):
                 can_data,
                 source_iso_name,
                 raw_can_data,
+                record_request,
             )
         return self._call_decode_function(
             pgn,
@@ -433,6 +760,7 @@ class DecoderBase(DecoderStaticsMixin):
             can_data,
             source_iso_name,
             raw_can_data,
+            record_request=record_request,
         )
 
     def _call_decode_function(
@@ -442,10 +770,141 @@ class DecoderBase(DecoderStaticsMixin):
         src: int,
         dest: int,
         timestamp: datetime,
-        data: bytes,
+        data: _BytesLike,
         source_iso_name: IsoName | None,
-        raw_can_data: bytes | str,
+        raw_can_data: _BytesLike | str,
         data_length_bits: int | None = None,
+        record_request: RecordRequest | None = None,
+    ) -> NMEA2000Message | None:
+        interval = self.rate_limit_intervals.get(pgn)
+        if interval is not None:
+            return self._rate_limit(
+                interval,
+                (
+                    pgn,
+                    priority,
+                    src,
+                    dest,
+                    timestamp,
+                    data,
+                    source_iso_name,
+                    raw_can_data,
+                    data_length_bits,
+                ),
+                record_request,
+            )
+        return self._decode_payload(
+            pgn,
+            priority,
+            src,
+            dest,
+            timestamp,
+            data,
+            source_iso_name,
+            raw_can_data,
+            data_length_bits,
+            record_request,
+        )
+
+    def _rate_limit(
+        self,
+        interval: timedelta,
+        decode_args: tuple,
+        record_request: RecordRequest | None,
+    ) -> NMEA2000Message | None:
+        """Decode at most one message per interval for each PGN and source.
+
+        The first message of a window is delivered and opens the window. By
+        default the rest of the window is dropped. In keep-latest mode the
+        newest message of the window is held instead, and delivered by the
+        first message after the window or by :meth:`flush_rate_limited`.
+        """
+        pgn, _, src, _, timestamp = decode_args[:5]
+        self.rate_limit_clock.latest = (timestamp, time.monotonic())
+        key = (pgn, src)
+        window = self.rate_limit_windows.get(key)
+        if window is None:
+            self.rate_limit_windows[key] = RateLimitWindow(timestamp)
+            return self._decode_payload(*decode_args, record_request=record_request)
+
+        if window.started_at <= timestamp < window.started_at + interval:
+            if self.rate_limit_keep_latest:
+                dropped = window.pending is not None
+                window.pending = self._retained_args(decode_args)
+            else:
+                dropped = True
+            if dropped:
+                with self._statistics_lock:
+                    self.rate_limit_drops[pgn] += 1
+            logger.debug("Rate limiting PGN %s from source %s", pgn, src)
+            return None
+
+        window.started_at = timestamp
+        pending = window.pending
+        if pending is None:
+            return self._decode_payload(*decode_args, record_request=record_request)
+        # Deliver the held message now and hold this one for the new window
+        window.pending = self._retained_args(decode_args)
+        return self._decode_payload(*pending, record_request=record_request)
+
+    def flush_rate_limited(
+        self, force: bool = False, now: datetime | None = None, live: bool = False
+    ) -> list[NMEA2000Message]:
+        """Decode the messages keep-latest rate limiting holds past their window.
+
+        A held message is delivered once its window has ended at ``now``, in
+        the time of the frame timestamps. ``now`` defaults to the timestamp of
+        the latest rate-limited frame, so replayed logs are flushed by their
+        own time. With ``live=True`` the wall-clock time elapsed since that
+        frame was decoded is added, for clients reading a live stream.
+        ``force=True`` delivers every held message, for example at the end of
+        a file or before ``close()``.
+        """
+        if now is None:
+            now = self.rate_limit_clock.now(live)
+        messages = []
+        with self._all_sources_locked():
+            for (pgn, _), window in self.rate_limit_windows.items():
+                pending = window.pending
+                if pending is None:
+                    continue
+                window_end = window.started_at + self.rate_limit_intervals[pgn]
+                if not force and (now is None or now < window_end):
+                    continue
+                # The next message opens a new window
+                window.started_at = window_end
+                window.pending = None
+                message = self._decode_payload(*pending)
+                if message is not None:
+                    messages.append(message)
+        return messages
+
+    @staticmethod
+    def _retained_args(decode_args: tuple) -> tuple:
+        """Copy the payload and raw input of arguments kept past this call."""
+        data, source_iso_name, raw_can_data = decode_args[5:8]
+        return (
+            *decode_args[:5],
+            bytes(data),
+            source_iso_name,
+            raw_can_data
+            if isinstance(raw_can_data, (bytes, str))
+            else bytes(raw_can_data),
+            *decode_args[8:],
+        )
+
+    def _decode_payload(
+        self,
+        pgn: int,
+        priority: int,
+        src: int,
+        dest: int,
+        timestamp: datetime,
+        data: _BytesLike,
+        source_iso_name: IsoName | None,
+        raw_can_data: _BytesLike | str,
+        data_length_bits: int | None = None,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
         decode_func_name = f"decode_pgn_{pgn}"
         decode_func: Callable[..., NMEA2000Message | None] | None = getattr(
@@ -461,49 +920,64 @@ class DecoderBase(DecoderStaticsMixin):
             )
             return None
 
-        data_int = int.from_bytes(data, "big")
+        if self.on_change or self.decode_cache_size:
+            # Both keep the payload as a dict key, which needs a bytes copy
+            data = bytes(data)
+            if self.on_change and self._is_unchanged_repeat(pgn, src, data, timestamp):
+                return None
+
+        data_int = int.from_bytes(data, "little")
+        if pgn == ISO_CLAIM_PGN and self.iso_claim_filter:
+            # A filtered claim only matters when the source's NAME changes
+            record = self.source_records[src]
+            if record is not None and record.name == data_int:
+                logger.debug("Skipping unchanged ISO_CLAIM_PGN for source %s", src)
+                return None
+
         payload_length_bits = (
             data_length_bits if data_length_bits is not None else len(data) * 8
         )
-        nmea2000_message: NMEA2000Message | None = decode_func(  # pylint: disable=not-callable
-            data_int,
-            payload_length_bits,
+        if record_request is not None:
+            record_request.record = self._decode_record_payload(
+                decode_func,
+                pgn,
+                priority,
+                src,
+                dest,
+                timestamp,
+                data_int,
+                payload_length_bits,
+                source_iso_name,
+            )
+            return None
+
+        # Only a bytes copy can be a cache key, see above
+        cache_key = (
+            (pgn, data, payload_length_bits) if isinstance(data, bytes) else None
         )
+        nmea2000_message = self._get_cached_message(cache_key)
+        from_cache = nmea2000_message is not None
+        if nmea2000_message is None and self.columnar_repeating:
+            nmea2000_message = decode_func(  # pylint: disable=not-callable
+                data_int, payload_length_bits, True
+            )
+        elif nmea2000_message is None:
+            nmea2000_message = decode_func(  # pylint: disable=not-callable
+                data_int,
+                payload_length_bits,
+            )
         if nmea2000_message is None:
             logger.debug("No sub-decoding function found for PGN: %s", pgn)
             return None
 
         # Handle ISO Address Claim messages and enrichment
         if nmea2000_message.PGN == ISO_CLAIM_PGN:
-            # In this message the data is a 64 bit unique NAME which is stable between network restarts
-            old_source = self.source_to_iso_name.get(src, None)
-            if old_source is not None and old_source.name == data_int:
-                logger.debug("Using existing ISO_CLAIM_PGN for source %s", src)
-                source_iso_name = old_source
-            else:
-                new_source = IsoName(nmea2000_message, data_int)
-                logger.info(
-                    "Using new ISO_CLAIM_PGN for source %s: %s", src, new_source
-                )
-                source_iso_name = self.source_to_iso_name[src] = new_source
+            source_iso_name = self._claimed_iso_name(src, data_int, nmea2000_message)
             if self.iso_claim_filter:
                 logger.debug("Excluding ISO_CLAIM_PGN")
                 return None
 
-        # Check if the PGN should be excluded or included by ID
-        msg_id = nmea2000_message.id.lower()
-        if msg_id in self.exclude_pgns_ids:
-            logger.debug("Excluding PGN by id: %s", nmea2000_message.id)
-            return None
-        if (
-            len(self.include_pgns) > 0
-            and msg_id not in self.include_pgns
-            and len(self.include_pgns_ids) > 0
-            and msg_id not in self.include_pgns_ids
-        ):
-            logger.debug(
-                "Excluding (by include) PGN %d by id: %s", pgn, nmea2000_message.id
-            )
+        if self._excluded_by_id(pgn, nmea2000_message.id):
             return None
 
         nmea2000_message.add_data(
@@ -513,44 +987,466 @@ class DecoderBase(DecoderStaticsMixin):
             timestamp,
             source_iso_name,
             self.build_network_map,
-            raw_can_data,
+            raw_can_data
+            if isinstance(raw_can_data, (bytes, str))
+            else bytes(raw_can_data),
         )
-        nmea2000_message.apply_preferred_units(self.preferred_units)
+        if not from_cache:
+            nmea2000_message.apply_preferred_units(self.preferred_units)
+            self._cache_message(cache_key, nmea2000_message)
 
-        # Handle dump to file
-        if self.dump_file is not None and (
+        if self.dump_file is not None and self._dumps(pgn, nmea2000_message.id):
+            self._dump_message(nmea2000_message)
+
+        if self.on_change:
+            assert isinstance(data, bytes)  # Copied above
+            return self._apply_on_change(
+                nmea2000_message, pgn, src, data, payload_length_bits, timestamp
+            )
+        return nmea2000_message
+
+    def _decode_record_payload(
+        self,
+        decode_func: Callable[..., Any],
+        pgn: int,
+        priority: int,
+        src: int,
+        dest: int,
+        timestamp: datetime,
+        data_int: int,
+        data_length_bits: int,
+        source_iso_name: IsoName | None,
+    ) -> N2KRecord | None:
+        """Decode a payload straight into its PGN record, for decode_record()."""
+        n2k_record: N2KRecord | None = decode_func(
+            data_int, data_length_bits, self.columnar_repeating, True
+        )
+        if n2k_record is None:
+            logger.debug("No sub-decoding function found for PGN: %s", pgn)
+            return None
+        if n2k_record.PGN == ISO_CLAIM_PGN:
+            source_iso_name = self._claimed_iso_name(src, data_int, n2k_record)
+            if self.iso_claim_filter:
+                logger.debug("Excluding ISO_CLAIM_PGN")
+                return None
+        if self._excluded_by_id(pgn, n2k_record.ID):
+            return None
+
+        n2k_record.source = src
+        n2k_record.destination = dest
+        n2k_record.priority = priority
+        n2k_record.timestamp = timestamp
+        n2k_record.source_iso_name = source_iso_name
+        if self.dump_file is not None and self._dumps(pgn, n2k_record.ID):
+            self._dump_message(n2k_record.to_message())
+        return n2k_record
+
+    def _claimed_iso_name(
+        self, src: int, name: int, claim: NMEA2000Message | N2KRecord
+    ) -> IsoName:
+        """Return the IsoName of an address claim, updating the network map."""
+        # The data is a 64 bit unique NAME which is stable between network restarts
+        record = self.source_records[src]
+        if record is not None and record.name == name:
+            logger.debug("Using existing ISO_CLAIM_PGN for source %s", src)
+            return record.iso_name
+        if isinstance(claim, N2KRecord):
+            claim = claim.to_message()
+        record = self._set_source_record(src, claim, name)
+        logger.info("Using new ISO_CLAIM_PGN for source %s: %s", src, record.iso_name)
+        return record.iso_name
+
+    def _excluded_by_id(self, pgn: int, message_id: str) -> bool:
+        """Return True when the PGN id is excluded, or not included, by id."""
+        msg_id = message_id.lower()
+        if msg_id in self.exclude_pgns_ids:
+            logger.debug("Excluding PGN by id: %s", message_id)
+            return True
+        if (
+            len(self.include_pgns) > 0
+            and msg_id not in self.include_pgns
+            and len(self.include_pgns_ids) > 0
+            and msg_id not in self.include_pgns_ids
+        ):
+            logger.debug("Excluding (by include) PGN %d by id: %s", pgn, message_id)
+            return True
+        return False
+
+    def _dumps(self, pgn: int, message_id: str) -> bool:
+        return (
             len(self.dump_include_pgns) + len(self.dump_include_pgns_ids) == 0
-            or nmea2000_message.PGN in self.dump_include_pgns
-            or nmea2000_message.id in self.dump_include_pgns_ids
+            or pgn in self.dump_include_pgns
+            or message_id in self.dump_include_pgns_ids
+        )
+
+    def _dump_message(self, nmea2000_message: NMEA2000Message) -> None:
+        json_str = (
+            nmea2000_message.to_json(
+                compact=self.dump_compact, raw_values=self.dump_compact
+            )
+            + "\n"
+        )
+        with self._dump_lock:
+            if self.dump_file is not None:
+                self.dump_file.write(json_str)
+
+    @staticmethod
+    def _copy_message(nmea2000_message: NMEA2000Message) -> NMEA2000Message:
+        return NMEA2000Message(
+            PGN=nmea2000_message.PGN,
+            id=nmea2000_message.id,
+            description=nmea2000_message.description,
+            ttl=nmea2000_message.ttl,
+            fields=[f.copy() for f in nmea2000_message.fields],
+        )
+
+    def _get_cached_message(
+        self, cache_key: tuple[int, bytes, int] | None
+    ) -> NMEA2000Message | None:
+        """Return a copy of a previously decoded message for the same payload."""
+        if self.decode_cache_size == 0 or cache_key is None:
+            return None
+        with self._decode_cache_lock:
+            cached = self._decode_cache.get(cache_key)
+            if cached is None:
+                self.counters["decode_cache_misses"] += 1
+                return None
+            self._decode_cache.move_to_end(cache_key)
+            self.counters["decode_cache_hits"] += 1
+        return self._copy_message(cached)
+
+    def _cache_message(
+        self,
+        cache_key: tuple[int, bytes, int] | None,
+        nmea2000_message: NMEA2000Message,
+    ) -> None:
+        if self.decode_cache_size == 0 or cache_key is None:
+            return
+        # Keep a private copy so callers can mutate the returned message
+        cached = self._copy_message(nmea2000_message)
+        with self._decode_cache_lock:
+            self._decode_cache[cache_key] = cached
+            if len(self._decode_cache) > self.decode_cache_size:
+                self._decode_cache.popitem(last=False)
+
+    def _is_unchanged_repeat(
+        self, pgn: int, src: int, data: bytes, timestamp: datetime
+    ) -> bool:
+        """Return True when the payload repeats the last delivered one for its key."""
+        payloads = self.on_change_payloads.get((pgn, src))
+        if payloads is None:
+            return False
+        key = payloads.get(data)
+        if key is None:
+            return False
+        entry = self.on_change_entries[key]
+        if (
+            self.on_change_heartbeat is not None
+            and timestamp - entry.emitted_at >= self.on_change_heartbeat
         ):
-            json_str = nmea2000_message.to_json() + "\n"
-            self.dump_file.write(json_str)
+            return False
+        entry.repeats += 1
+        with self._statistics_lock:
+            self.counters["on_change_suppressed"] += 1
+        logger.debug("Suppressing unchanged PGN %s from source %s", pgn, src)
+        return True
+
+    def _apply_on_change(
+        self,
+        nmea2000_message: NMEA2000Message,
+        pgn: int,
+        src: int,
+        data: bytes,
+        data_length_bits: int,
+        timestamp: datetime,
+    ) -> NMEA2000Message | None:
+        """Reduce a changed message to its primary-key fields and the fields that differ."""
+        key = (nmea2000_message.primary_key(), src)
+        fields = {f.id: f for f in nmea2000_message.fields}
+        payloads = self.on_change_payloads.setdefault((pgn, src), {})
+        entry = self.on_change_entries.get(key)
+        if entry is None:
+            self.on_change_entries[key] = OnChangeEntry(
+                pgn, data, data_length_bits, fields, timestamp
+            )
+            payloads[data] = key
+            return nmea2000_message
+
+        payloads.pop(entry.payload, None)
+        payloads[data] = key
+        previous = entry.fields
+        entry.payload = data
+        entry.data_length_bits = data_length_bits
+        entry.fields = fields
+        heartbeat_due = (
+            self.on_change_heartbeat is not None
+            and timestamp - entry.emitted_at >= self.on_change_heartbeat
+        )
+        if not heartbeat_due:
+            changed = [
+                f
+                for f in nmea2000_message.fields
+                if f.part_of_primary_key or previous.get(f.id) != f
+            ]
+            if all(f.part_of_primary_key for f in changed):
+                # Only bits outside any decoded field changed
+                entry.repeats += 1
+                with self._statistics_lock:
+                    self.counters["on_change_suppressed"] += 1
+                return None
+            nmea2000_message.fields = changed
 
+        entry.emitted_at = timestamp
+        entry.delivered_repeats = entry.repeats
+        entry.repeats = 0
         return nmea2000_message
 
+    def suppressed_repeats(self, message: NMEA2000Message) -> int:
+        """Return how many unchanged repeats on-change mode dropped before message.
+
+        The count covers the repeats of the message's network-map key between
+        the previous delivery and the latest one, such as the repeats a
+        heartbeat stands for. It is 0 outside on-change mode.
+        """
+        entry = self.on_change_entries.get((message.primary_key(), message.source))
+        return 0 if entry is None else entry.delivered_repeats
+
+    def get_statistics(self) -> dict[str, int | float]:
+        """Return counters describing the work this decoder skipped."""
+        with self._statistics_lock:
+            statistics: dict[str, int | float] = {
+                "on_change_suppressed": self.counters["on_change_suppressed"],
+                "rate_limit_dropped": self.rate_limit_drops.total(),
+            }
+            for pgn, drops in self.rate_limit_drops.items():
+                statistics[f"rate_limit_dropped_{pgn}"] = drops
+        with self._decode_cache_lock:
+            hits = self.counters["decode_cache_hits"]
+            lookups = hits + self.counters["decode_cache_misses"]
+            statistics["decode_cache_size"] = len(self._decode_cache)
+            statistics["decode_cache_hits"] = hits
+            statistics["decode_cache_misses"] = self.counters["decode_cache_misses"]
+            statistics["decode_cache_hit_rate"] = hits / lookups if lookups else 0.0
+        return statistics
+
+    @contextmanager
+    def _all_sources_locked(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for lock in self._source_locks:
+                stack.enter_context(lock)
+            yield
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the network map, fast-packet sessions, on-change and rate-limit state.
+
+        The result only holds JSON types so it can be persisted and handed to
+        :meth:`restore` after a restart.
+        """
+        with self._all_sources_locked():
+            return {
+                "version": SNAPSHOT_VERSION,
+                "iso_names": {
+                    str(src): iso_name.name
+                    for src, iso_name in self.source_to_iso_name.items()
+                },
+                "fast_packets": {
+                    key: {
+                        "payload_length": fast_pgn.payload_length,
+                        "bytes_stored": fast_pgn.bytes_stored,
+                        "sequence_counter": fast_pgn.sequence_counter,
+                        "frames": {
+                            str(idx): frame.hex()
+                            for idx, frame in fast_pgn.frames.items()
+                        },
+                    }
+                    for key, fast_pgn in self.data.items()
+                },
+                "on_change": [
+                    {
+                        "pgn": entry.pgn,
+                        "source": src,
+                        "payload": entry.payload.hex(),
+                        "data_length_bits": entry.data_length_bits,
+                        "emitted_at": entry.emitted_at.isoformat(),
+                        "repeats": entry.repeats,
+                        "delivered_repeats": entry.delivered_repeats,
+                    }
+                    for (_, src), entry in self.on_change_entries.items()
+                ],
+                "rate_limit_latest": None
+                if self.rate_limit_clock.latest is None
+                else self.rate_limit_clock.latest[0].isoformat(),
+                "rate_limit": [
+                    {
+                        "pgn": pgn,
+                        "source": src,
+                        "started_at": window.started_at.isoformat(),
+                        "pending": None
+                        if window.pending is None
+                        else self._snapshot_decode_args(window.pending),
+                    }
+                    for (pgn, src), window in self.rate_limit_windows.items()
+                ],
+            }
+
+    @staticmethod
+    def _snapshot_decode_args(decode_args: tuple) -> dict[str, Any]:
+        """Return held ``_decode_payload`` arguments as JSON types."""
+        (_, priority, _, dest, timestamp, data, iso_name, raw, data_length_bits) = (
+            decode_args
+        )
+        return {
+            "priority": priority,
+            "dest": dest,
+            "timestamp": timestamp.isoformat(),
+            "payload": bytes(data).hex(),
+            "iso_name": None if iso_name is None else iso_name.name,
+            "raw_text": raw if isinstance(raw, str) else None,
+            "raw": None if isinstance(raw, str) else bytes(raw).hex(),
+            "data_length_bits": data_length_bits,
+        }
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Load state returned by :meth:`snapshot`, replacing the current state.
+
+        ISO names and on-change fields are rebuilt by decoding the stored raw
+        values, so a snapshot stays valid across releases with new lookups.
+        """
+        _check_snapshot_version(snapshot)
+        with self._all_sources_locked():
+            # Cleared in place, the list may be shared with sibling decoders
+            self.source_records[:] = [None] * 256
+            for src, name in snapshot.get("iso_names", {}).items():
+                claim = pgns_module.decode_pgn_60928(name, 64)
+                self._set_source_record(int(src), claim, name)
+
+            self.data.clear()
+            for key, session in snapshot.get("fast_packets", {}).items():
+                fast_pgn = FastPgnMetadata()
+                fast_pgn.payload_length = session["payload_length"]
+                fast_pgn.bytes_stored = session["bytes_stored"]
+                fast_pgn.sequence_counter = session["sequence_counter"]
+                fast_pgn.frames = {
+                    int(idx): bytes.fromhex(frame)
+                    for idx, frame in session["frames"].items()
+                }
+                self.data[key] = fast_pgn
+
+            self.on_change_entries.clear()
+            self.on_change_payloads.clear()
+            for item in snapshot.get("on_change", []):
+                self._restore_on_change_entry(item)
+
+            self.rate_limit_windows.clear()
+            latest = snapshot.get("rate_limit_latest")
+            # Time elapsed while the decoder was not running is not counted
+            self.rate_limit_clock.latest = (
+                None
+                if latest is None
+                else (datetime.fromisoformat(latest), time.monotonic())
+            )
+            for item in snapshot.get("rate_limit", []):
+                window = RateLimitWindow(datetime.fromisoformat(item["started_at"]))
+                if item["pending"] is not None:
+                    window.pending = self._restore_decode_args(
+                        item["pgn"], item["source"], item["pending"]
+                    )
+                self.rate_limit_windows[(item["pgn"], item["source"])] = window
+        logger.info(
+            "Restored decoder state: %d ISO names, %d fast-packet sessions, "
+            "%d on-change entries, %d rate-limit windows",
+            len(self.source_to_iso_name),
+            len(self.data),
+            len(self.on_change_entries),
+            len(self.rate_limit_windows),
+        )
+
+    def _restore_decode_args(self, pgn: int, src: int, held: dict[str, Any]) -> tuple:
+        name = held["iso_name"]
+        iso_name = None
+        if name is not None:
+            iso_name = self._iso_names_by_name.get(name)
+            if iso_name is None:
+                claim = pgns_module.decode_pgn_60928(name, 64)
+                iso_name = self._iso_names_by_name[name] = IsoName(claim, name)
+        raw_text = held["raw_text"]
+        return (
+            pgn,
+            held["priority"],
+            src,
+            held["dest"],
+            datetime.fromisoformat(held["timestamp"]),
+            bytes.fromhex(held["payload"]),
+            iso_name,
+            bytes.fromhex(held["raw"]) if raw_text is None else raw_text,
+            held["data_length_bits"],
+        )
+
+    def _restore_on_change_entry(self, item: dict[str, Any]) -> None:
+        pgn = item["pgn"]
+        src = item["source"]
+        payload = bytes.fromhex(item["payload"])
+        decode_func = getattr(pgns_module, f"decode_pgn_{pgn}", None)
+        if decode_func is None:
+            logger.warning("Dropping on-change state for unsupported PGN %s", pgn)
+            return
+        message: NMEA2000Message | None = decode_func(
+            int.from_bytes(payload, "little"),
+            item["data_length_bits"],
+            self.columnar_repeating,
+        )
+        if message is None:
+            return
+        message.apply_preferred_units(self.preferred_units)
+        key = (message.primary_key(), src)
+        entry = self.on_change_entries[key] = OnChangeEntry(
+            pgn,
+            payload,
+            item["data_length_bits"],
+            {f.id: f for f in message.fields},
+            datetime.fromisoformat(item["emitted_at"]),
+        )
+        entry.repeats = item["repeats"]
+        entry.delivered_repeats = item["delivered_repeats"]
+        self.on_change_payloads.setdefault((pgn, src), {})[payload] = key
+
     def close(self):
         """Close the dump file if it is open."""
-        if self.dump_file:
-            self.dump_file.close()
-            self.dump_file = None
-            logger.info("dump_file file has been closed.")
+        with self._dump_lock:
+            if self.dump_file:
+                self.dump_file.close()
+                self.dump_file = None
+                logger.info("dump_file file has been closed.")
 
 
 class NMEA2000Decoder(DecoderInterface):
-    """Thin public dispatcher that binds to one concrete format decoder."""
+    """Thin public dispatcher that binds to one concrete format decoder.
+
+    With ``mixed_formats=True`` it instead keeps one decoder per format seen
+    in the stream. They share fast-packet, network-map and filter state, so
+    interleaved formats decode in a single pass.
+    """
 
     HANDLERS: ClassVar[dict[N2KFormat, Callable[..., DecoderInterface]]] = {}
 
     def __init__(
         self,
         bound_format: N2KFormat | None = None,
+        mixed_formats: bool = False,
         **kwargs,
     ) -> None:
         self._handler_init_kwargs = kwargs
+        self._bind_lock = threading.Lock()
+        self._pending_snapshot: dict[str, Any] | None = None
         self._delegate: DecoderInterface | None = None
         self._bound_format: N2KFormat | None = None
+        self.mixed_formats = mixed_formats
+        self._delegates: dict[N2KFormat, DecoderInterface] = {}
+        # Format of the previous input, checked first for the next one
+        self._last_format: N2KFormat | None = None
         if bound_format is not None:
             self._bind_delegate(bound_format)
+            self._last_format = bound_format
 
     @classmethod
     def add_handler(
@@ -568,6 +1464,10 @@ class NMEA2000Decoder(DecoderInterface):
         return handler_cls
 
     def _bind_delegate(self, input_format: N2KFormat) -> DecoderInterface:
+        with self._bind_lock:
+            return self._bind_delegate_locked(input_format)
+
+    def _bind_delegate_locked(self, input_format: N2KFormat) -> DecoderInterface:
         if self._delegate is None:
             handler_cls = self.get_handler(input_format)
             self._delegate = handler_cls(
@@ -575,28 +1475,121 @@ class NMEA2000Decoder(DecoderInterface):
                 **self._handler_init_kwargs,
             )
             self._bound_format = input_format
+            self._delegates[input_format] = self._delegate
+            if self._pending_snapshot is not None:
+                self._delegate.restore(self._pending_snapshot)
+                self._pending_snapshot = None
             return self._delegate
 
+        if self.mixed_formats:
+            delegate = self._delegates.get(input_format)
+            if delegate is None:
+                delegate = self._add_sibling_delegate(input_format)
+            return delegate
+
         if self._bound_format != input_format:
             assert self._bound_format is not None
             raise ValueError(
                 "This NMEA2000Decoder instance is already bound to "
-                f"{self._bound_format.value}; create a new decoder for {input_format.value}."
+                f"{self._bound_format.value}; create a new decoder for "
+                f"{input_format.value}, or use mixed_formats=True."
             )
         return self._delegate
 
+    def _add_sibling_delegate(self, input_format: N2KFormat) -> DecoderInterface:
+        primary = self._delegate
+        handler_cls = self.get_handler(input_format)
+        # The dump file is opened once, by the first decoder, and then shared
+        kwargs = dict(self._handler_init_kwargs)
+        kwargs.pop("dump_to_file", None)
+        delegate = handler_cls(bound_format=input_format, **kwargs)
+        if not isinstance(primary, DecoderBase) or not isinstance(
+            delegate, DecoderBase
+        ):
+            raise ValueError(
+                f"Cannot share decoder state between {type(primary).__name__} "
+                f"and {type(delegate).__name__}"
+            )
+        delegate.share_state_from(primary)
+        self._delegates[input_format] = delegate
+        logger.info("Decoding %s input alongside %s", input_format, self._bound_format)
+        return delegate
+
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
+        if self.mixed_formats:
+            return self._decode_mixed(data, record_request)
         if self._delegate is not None:
-            return self._delegate.decode(data)
+            return self._delegate.decode(data, record_request)
         input_format = detect_format(data)
-        return self._bind_delegate(input_format).decode(data)
+        return self._bind_delegate(input_format).decode(data, record_request)
+
+    def decode_record(self, data: N2KInput) -> N2KRecord | None:
+        """Decode the input data and return the generated record of its PGN."""
+        if self._handler_init_kwargs.get("on_change") or self._handler_init_kwargs.get(
+            "preferred_units"
+        ):
+            raise ValueError(
+                "decode_record needs complete messages in canboat units; "
+                "create the decoder without on_change and preferred_units"
+            )
+        request = RecordRequest()
+        self.decode(data, request)
+        return request.record
+
+    def _decode_mixed(
+        self, data: N2KInput, record_request: RecordRequest | None
+    ) -> NMEA2000Message | None:
+        input_format = self._last_format
+        if input_format is None or not looks_like_format(data, input_format):
+            input_format = detect_format(data)
+            self._last_format = input_format
+        delegate = self._delegates.get(input_format)
+        if delegate is None:
+            delegate = self._bind_delegate(input_format)
+        return delegate.decode(data, record_request)
+
+    def get_statistics(self) -> dict[str, int | float]:
+        # Sibling decoders share their counters, so the first one covers all
+        if self._delegate is None:
+            return {}
+        return self._delegate.get_statistics()
+
+    def suppressed_repeats(self, message: NMEA2000Message) -> int:
+        if self._delegate is None:
+            return 0
+        return self._delegate.suppressed_repeats(message)
+
+    def flush_rate_limited(
+        self, force: bool = False, now: datetime | None = None, live: bool = False
+    ) -> list[NMEA2000Message]:
+        # Sibling decoders share their rate-limit windows
+        if self._delegate is None:
+            return []
+        return self._delegate.flush_rate_limited(force, now, live)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._bind_lock:
+            if self._delegate is None:
+                # Unbound and nothing restored yet, so there is no state
+                return dict(self._pending_snapshot or {"version": SNAPSHOT_VERSION})
+        return self._delegate.snapshot()
+
+    def restore(self, snapshot: dict[str, Any]) -> None:
+        """Restore state now, or once the format is detected if still unbound."""
+        _check_snapshot_version(snapshot)
+        with self._bind_lock:
+            if self._delegate is None:
+                self._pending_snapshot = snapshot
+                return
+        self._delegate.restore(snapshot)
 
     def close(self):
-        if self._delegate:
-            self._delegate.close()
+        for delegate in list(self._delegates.values()):
+            delegate.close()
 
 
 import_module(".decoder_formats", __package__)
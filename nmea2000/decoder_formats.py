@@ -7,11 +7,16 @@ import binascii
 import logging
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
-
-import can.message
-
-from .decoder import DecoderBase, DecoderInterface, InvalidFrameError, NMEA2000Decoder
-from .input_formats import N2KFormat, N2KInput
+from functools import lru_cache
+
+from .decoder import (
+    DecoderBase,
+    DecoderInterface,
+    InvalidFrameError,
+    NMEA2000Decoder,
+    RecordRequest,
+)
+from .input_formats import N2KFormat, N2KInput, is_can_message
 from .message import NMEA2000Message
 from .utils import calculate_canbus_checksum
 
@@ -20,21 +25,73 @@ logger = logging.getLogger(__name__)
 
 def _decode_text_input(
     data: N2KInput,
-    decode_line: Callable[[str], NMEA2000Message | None],
+    decode_line: Callable[[str, RecordRequest | None], NMEA2000Message | None],
+    record_request: RecordRequest | None,
 ) -> NMEA2000Message | None:
-    """Decode a single text line."""
-    if not isinstance(data, str):
+    """Decode a single text line, given as ``str`` or as the raw bytes read.
+
+    Every supported text format is ASCII, so bytes with any other byte are
+    rejected instead of decoding what is left of a corrupt line.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        try:
+            data = str(data, "ascii")
+        except UnicodeDecodeError as exc:
+            raise InvalidFrameError(f"Text line is not ASCII: {bytes(data)!r}") from exc
+    elif not isinstance(data, str):
         raise ValueError(f"Unsupported input type: {type(data)}")
-    return decode_line(data.strip())
+    return decode_line(data.strip(), record_request)
 
 
-def _as_bytes(data: N2KInput) -> bytes:
+def _as_buffer(data: N2KInput) -> memoryview:
+    """View a binary packet without copying it."""
     if isinstance(data, (bytes, bytearray, memoryview)):
-        return bytes(data)
+        return memoryview(data)
     raise ValueError("Input must be bytes-like")
 
 
+@lru_cache(maxsize=64)
+def _parse_date_time_prefix(prefix: str) -> datetime:
+    """Parse ``YYYY-MM-DD?HH:MM:SS``; consecutive lines mostly share it."""
+    return datetime(
+        int(prefix[0:4]),
+        int(prefix[5:7]),
+        int(prefix[8:10]),
+        int(prefix[11:13]),
+        int(prefix[14:16]),
+        int(prefix[17:19]),
+    )
+
+
+@lru_cache(maxsize=64)
+def _parse_time_prefix(prefix: str) -> timedelta:
+    """Parse ``HH:MM:SS`` into the offset from midnight."""
+    return timedelta(
+        hours=int(prefix[0:2]), minutes=int(prefix[3:5]), seconds=int(prefix[6:8])
+    )
+
+
+def _parse_microseconds(fraction: str) -> int | None:
+    """Return the microseconds in a 1-6 digit fraction, or None if malformed."""
+    if not 0 < len(fraction) <= 6 or not fraction.isdigit():
+        return None
+    return int(fraction) * 10 ** (6 - len(fraction))
+
+
 def _parse_basic_timestamp(timestamp: str) -> datetime:
+    if (
+        len(timestamp) > 20
+        and timestamp[4] == timestamp[7] == "-"
+        and timestamp[10] in "T-"
+        and timestamp[13] == timestamp[16] == ":"
+        and timestamp[19] == "."
+    ):
+        fraction = timestamp[20:-1] if timestamp.endswith("Z") else timestamp[20:]
+        microseconds = _parse_microseconds(fraction)
+        if microseconds is not None:
+            return _parse_date_time_prefix(timestamp[:19]).replace(
+                microsecond=microseconds
+            )
     if timestamp.endswith("Z"):
         return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
     if "T" in timestamp:
@@ -63,15 +120,36 @@ def _parse_hex_bytes(parts: list[str], expected_length: int | None = None) -> by
         raise ValueError(f"Expected {expected_length} data bytes, got {len(parts)}")
 
     selected_parts = parts if expected_length is None else parts[:expected_length]
+    joined = "".join(selected_parts)
+    if len(joined) == 2 * len(selected_parts):
+        return bytes.fromhex(joined)
+    # Some loggers drop the leading zero of single-digit bytes
     return bytes(int(part, 16) for part in selected_parts)
 
 
+def _parse_time_of_day(time_str: str) -> datetime:
+    """Parse ``HH:MM:SS.fff`` as a time on the current day."""
+    microseconds = None
+    if len(time_str) > 9 and time_str[2] == time_str[5] == ":" and time_str[8] == ".":
+        microseconds = _parse_microseconds(time_str[9:])
+    if microseconds is None:
+        parsed_time = datetime.strptime(time_str, "%H:%M:%S.%f").time()
+        return datetime.combine(datetime.now().date(), parsed_time)
+    midnight = datetime.combine(datetime.now().date(), datetime.min.time())
+    return (
+        midnight
+        + _parse_time_prefix(time_str[:8])
+        + timedelta(microseconds=microseconds)
+    )
+
+
 def _decode_raw_can_frame(
     decoder: DecoderBase,
     can_id: int,
     payload: bytes,
     raw_input: str,
     timestamp: datetime | None = None,
+    record_request: RecordRequest | None = None,
 ) -> NMEA2000Message | None:
     pgn_id, source_id, dest, priority = type(decoder).extract_header(can_id)
     return decoder._decode(  # pylint: disable=protected-access
@@ -80,9 +158,10 @@ def _decode_raw_can_frame(
         source_id,
         dest,
         timestamp or datetime.now(),
-        payload[::-1],
+        payload,
         raw_input,
         False,
+        record_request,
     )
 
 
@@ -92,9 +171,10 @@ def _decode_combined_payload(
     priority: int,
     source_id: int,
     dest: int,
-    payload: bytes,
-    raw_input: bytes | str,
+    payload: bytes | memoryview,
+    raw_input: bytes | memoryview | str,
     timestamp: datetime | None = None,
+    record_request: RecordRequest | None = None,
 ) -> NMEA2000Message | None:
     return decoder._decode(  # pylint: disable=protected-access
         pgn_id,
@@ -102,9 +182,10 @@ def _decode_combined_payload(
         source_id,
         dest,
         timestamp or datetime.now(),
-        payload[::-1],
+        payload,
         raw_input,
         True,
+        record_request,
     )
 
 
@@ -116,7 +197,9 @@ class N2kAsciiDecoder(DecoderBase, DecoderInterface):
         ``09FF7 0FF00 3F9FDCFFFFFFFFFF``
     """
 
-    def _decode_text(self, n2k_ascii_string: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, n2k_ascii_string: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         # Split the N2K ASCII string by spaces
         parts = n2k_ascii_string.split()
 
@@ -142,9 +225,6 @@ class N2kAsciiDecoder(DecoderBase, DecoderInterface):
         priority = n & 0xF
         dest = (n >> 4) & 0xFF
         src = (n >> 12) & 0xFF
-        # Convert to bytes
-        # Reverse the byte order
-        reversed_bytes = bytes_data[::-1]
 
         # Log the extracted information
         logger.debug(
@@ -153,7 +233,7 @@ class N2kAsciiDecoder(DecoderBase, DecoderInterface):
             dest,
             src,
             pgn,
-            reversed_bytes,
+            bytes_data,
         )
 
         return self._decode(
@@ -162,16 +242,18 @@ class N2kAsciiDecoder(DecoderBase, DecoderInterface):
             src,
             dest,
             timestamp,
-            bytes(reversed_bytes),
+            bytes_data,
             bytes_data,
             True,
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class BasicStringDecoder(DecoderBase, DecoderInterface):
@@ -184,6 +266,7 @@ class BasicStringDecoder(DecoderBase, DecoderInterface):
     def _decode_text(
         self,
         basic_string: str,
+        record_request: RecordRequest | None = None,
         already_combined: bool = False,
     ) -> NMEA2000Message | None:
         # Split the basic string by commas
@@ -200,8 +283,7 @@ class BasicStringDecoder(DecoderBase, DecoderInterface):
         dest = int(parts[4])
         length = int(parts[5])
         # Extract the CAN data from the remaining parts
-        can_data = parts[6 : 6 + length][::-1]
-        can_data_bytes = [int(byte, 16) for byte in can_data]
+        can_data_bytes = _parse_hex_bytes(parts[6 : 6 + length])
 
         # Log the extracted information
         logger.debug(
@@ -220,18 +302,20 @@ class BasicStringDecoder(DecoderBase, DecoderInterface):
             src,
             dest,
             timestamp,
-            bytes(can_data_bytes),
+            can_data_bytes,
             basic_string,
             already_combined,
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
         if self.already_combined and isinstance(data, str):
-            return self._decode_text(data.strip(), True)
-        return _decode_text_input(data, self._decode_text)
+            return self._decode_text(data.strip(), record_request, True)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class CanFrameAsciiDecoder(DecoderBase, DecoderInterface):
@@ -242,14 +326,15 @@ class CanFrameAsciiDecoder(DecoderBase, DecoderInterface):
         ``01F010B3 FF FF 0C 4F 70 BE 3E 33``
     """
 
-    def _decode_text(self, can_frame_line: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, can_frame_line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         # Split the CAN Frame ASCII string by spaces
         parts = can_frame_line.split()
 
         if len(parts) >= 4 and parts[1] in ["R", "T"]:
             # Extract the timestamp from the first part
-            parsed_time = datetime.strptime(parts[0], "%H:%M:%S.%f").time()
-            timestamp = datetime.combine(datetime.now().date(), parsed_time)
+            timestamp = _parse_time_of_day(parts[0])
             # Extract the PGN, priority, destination, and source from the second part
             msgid = int(parts[2], 16)
             can_data_parts = parts[3:]
@@ -262,8 +347,7 @@ class CanFrameAsciiDecoder(DecoderBase, DecoderInterface):
 
         pgn_id, source_id, dest, priority = type(self).extract_header(msgid)
         # Extract the CAN data from the remaining parts
-        can_data = can_data_parts[::-1]
-        can_data_bytes = [int(byte, 16) for byte in can_data]
+        can_data_bytes = _parse_hex_bytes(can_data_parts)
 
         # Log the extracted information
         logger.debug(
@@ -281,15 +365,17 @@ class CanFrameAsciiDecoder(DecoderBase, DecoderInterface):
             source_id,
             dest,
             timestamp,
-            bytes(can_data_bytes),
+            can_data_bytes,
             can_frame_line,
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class Candump1Decoder(DecoderBase, DecoderInterface):
@@ -299,7 +385,9 @@ class Candump1Decoder(DecoderBase, DecoderInterface):
         ``<0x18EEFF01> [8] 05 A0 BE 1C 00 A0 A0 C0``
     """
 
-    def _decode_text(self, line: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         parts = line.split()
         if len(parts) < 3:
             raise ValueError("Invalid candump1 string format")
@@ -311,13 +399,15 @@ class Candump1Decoder(DecoderBase, DecoderInterface):
             can_id,
             _parse_hex_bytes(parts[2:], data_length),
             line,
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class Candump2Decoder(DecoderBase, DecoderInterface):
@@ -327,7 +417,9 @@ class Candump2Decoder(DecoderBase, DecoderInterface):
         ``can0  18EEFF01   [8]  05 A0 BE 1C 00 A0 A0 C0``
     """
 
-    def _decode_text(self, line: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         parts = line.split()
         if len(parts) < 4:
             raise ValueError("Invalid candump2 string format")
@@ -339,13 +431,15 @@ class Candump2Decoder(DecoderBase, DecoderInterface):
             can_id,
             _parse_hex_bytes(parts[3:], data_length),
             line,
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class Candump3Decoder(DecoderBase, DecoderInterface):
@@ -355,7 +449,9 @@ class Candump3Decoder(DecoderBase, DecoderInterface):
         ``(1502979132.106111) slcan0 18EEFF01#05A0BE1C00A0A0C0``
     """
 
-    def _decode_text(self, line: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         timestamp_str, _, can_frame = line.split(maxsplit=2)
         can_id_str, data_hex = can_frame.split("#", 1)
         return _decode_raw_can_frame(
@@ -364,13 +460,15 @@ class Candump3Decoder(DecoderBase, DecoderInterface):
             bytes.fromhex(data_hex),
             line,
             _utc_datetime_from_timestamp(float(timestamp_str[1:-1])),
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class PcdinDecoder(DecoderBase, DecoderInterface):
@@ -380,7 +478,9 @@ class PcdinDecoder(DecoderBase, DecoderInterface):
         ``$PCDIN,01F119,00000000,0F,2AAF00D1067414FF*59``
     """
 
-    def _decode_text(self, line: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         sentence = _strip_checksum(_get_0183_sentence(line))
         parts = sentence.split(",")
         if len(parts) != 5:
@@ -397,13 +497,15 @@ class PcdinDecoder(DecoderBase, DecoderInterface):
             bytes.fromhex(data_hex),
             line,
             _utc_datetime_from_timestamp(timer_seconds),
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class MxpgnDecoder(DecoderBase, DecoderInterface):
@@ -413,7 +515,9 @@ class MxpgnDecoder(DecoderBase, DecoderInterface):
         ``$MXPGN,01F801,2801,C1308AC40C5DE343*19``
     """
 
-    def _decode_text(self, line: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         sentence = _strip_checksum(_get_0183_sentence(line))
         parts = sentence.split(",")
         if len(parts) != 4:
@@ -435,13 +539,15 @@ class MxpgnDecoder(DecoderBase, DecoderInterface):
             dest,
             bytes.fromhex(data_hex)[::-1],
             line,
+            record_request=record_request,
         )
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class PdgyDecoder(DecoderBase, DecoderInterface):
@@ -451,7 +557,9 @@ class PdgyDecoder(DecoderBase, DecoderInterface):
         ``!PDGY,127257,3,17,255,0.563,AP9/UgAh/v8=``
     """
 
-    def _decode_text(self, line: str) -> NMEA2000Message | None:
+    def _decode_text(
+        self, line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
         parts = line.split(",")
         if len(parts) == 7:
             _, pgn_id, priority, source_id, dest, _, encoded = parts
@@ -463,6 +571,7 @@ class PdgyDecoder(DecoderBase, DecoderInterface):
                 int(dest),
                 base64.b64decode(encoded, validate=True),
                 line,
+                record_request=record_request,
             )
 
         if len(parts) == 4:
@@ -475,6 +584,7 @@ class PdgyDecoder(DecoderBase, DecoderInterface):
                 int(dest),
                 base64.b64decode(encoded, validate=True),
                 line,
+                record_request=record_request,
             )
 
         raise ValueError("Invalid PDGY string format")
@@ -482,8 +592,9 @@ class PdgyDecoder(DecoderBase, DecoderInterface):
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class PdgyDebugDecoder(DecoderBase, DecoderInterface):
@@ -493,15 +604,18 @@ class PdgyDebugDecoder(DecoderBase, DecoderInterface):
         ``$PDGY,000000,4,,5,482,1,0``
     """
 
-    def _decode_text(self, line: str) -> NMEA2000Message | None:
-        del line
+    def _decode_text(
+        self, line: str, record_request: RecordRequest | None = None
+    ) -> NMEA2000Message | None:
+        del line, record_request
         raise ValueError("PDGY debug lines are not supported")
 
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        return _decode_text_input(data, self._decode_text)
+        return _decode_text_input(data, self._decode_text, record_request)
 
 
 class TcpDecoder(DecoderBase, DecoderInterface):
@@ -510,8 +624,9 @@ class TcpDecoder(DecoderBase, DecoderInterface):
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        packet = _as_bytes(data)
+        packet = _as_buffer(data)
         if len(packet) < 6:
             raise ValueError("Packet is too short")
 
@@ -527,17 +642,18 @@ class TcpDecoder(DecoderBase, DecoderInterface):
         frame_id_int = int.from_bytes(frame_id, byteorder="big")
         # Parse it
         pgn_id, source_id, dest, priority = type(self).extract_header(frame_id_int)
-        # Extract and reverse the CAN data
-        can_data = packet[5 : 5 + data_length][::-1]
+        # Extract the CAN data
+        can_data = packet[5 : 5 + data_length]
 
         # Log the extracted information including the combined string
-        logger.debug(
-            "PGN ID: %s, Frame ID: %s, CAN Data: %s, Source ID: %s",
-            pgn_id,
-            binascii.hexlify(frame_id).decode("ascii"),
-            can_data,
-            source_id,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "PGN ID: %s, Frame ID: %s, CAN Data: %s, Source ID: %s",
+                pgn_id,
+                binascii.hexlify(frame_id).decode("ascii"),
+                can_data.hex(),
+                source_id,
+            )
 
         return self._decode(
             pgn_id,
@@ -545,8 +661,9 @@ class TcpDecoder(DecoderBase, DecoderInterface):
             source_id,
             dest,
             datetime.now(),
-            bytes(can_data),
+            can_data,
             packet,
+            record_request=record_request,
         )
 
 
@@ -556,8 +673,9 @@ class UsbDecoder(DecoderBase, DecoderInterface):
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        packet = _as_bytes(data)
+        packet = _as_buffer(data)
 
         if packet[0] != 0xAA or packet[1] != 0x55:
             raise InvalidFrameError("Packet does not have the right prefix and suffix")
@@ -580,19 +698,20 @@ class UsbDecoder(DecoderBase, DecoderInterface):
             )
 
         data_length = packet[9]
-        # Extract and reverse the CAN data
-        can_data = packet[10 : 10 + data_length][::-1]
+        # Extract the CAN data
+        can_data = packet[10 : 10 + data_length]
 
         # Log the extracted information including the combined string
-        logger.debug(
-            "Got valid packet. PGN ID: %s, source: %s, dest: %s, priority: %s, "
-            "CAN Data: %s",
-            pgn_id,
-            source_id,
-            dest,
-            priority,
-            can_data.hex(),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Got valid packet. PGN ID: %s, source: %s, dest: %s, priority: %s, "
+                "CAN Data: %s",
+                pgn_id,
+                source_id,
+                dest,
+                priority,
+                can_data.hex(),
+            )
 
         return self._decode(
             pgn_id,
@@ -600,8 +719,9 @@ class UsbDecoder(DecoderBase, DecoderInterface):
             source_id,
             dest,
             datetime.now(),
-            bytes(can_data),
+            can_data,
             packet,
+            record_request=record_request,
         )
 
 
@@ -611,15 +731,16 @@ class PythonCanDecoder(DecoderBase, DecoderInterface):
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        if not isinstance(data, can.message.Message):
+        if not is_can_message(data):
             raise ValueError("Input must be a python-can Message")
 
         pgn_id, source_id, dest, priority = type(self).extract_header(
             data.arbitration_id
         )
-        # python-can data is already in network byte order; reverse to match internal convention
-        can_data = bytes(data.data)[::-1]
+        # python-can data is already in network byte order
+        can_data = memoryview(data.data)
         timestamp = (
             datetime.fromtimestamp(data.timestamp) if data.timestamp else datetime.now()
         )
@@ -630,7 +751,8 @@ class PythonCanDecoder(DecoderBase, DecoderInterface):
             dest,
             timestamp,
             can_data,
-            bytes(data.data),
+            can_data,
+            record_request=record_request,
         )
 
 
@@ -647,8 +769,9 @@ class BstD0Decoder(DecoderBase, DecoderInterface):
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        packet = _as_bytes(data)
+        packet = _as_buffer(data)
         if len(packet) < 14:
             raise ValueError("BST D0 packet too short")
         if packet[0] != 0xD0:
@@ -681,14 +804,15 @@ class BstD0Decoder(DecoderBase, DecoderInterface):
         timestamp = datetime.now()  # BST D0 timestamp is relative; use wall clock
         payload = packet[13:-1]  # exclude checksum
 
-        logger.debug(
-            "BST D0: PGN=%d, src=%d, dst=%d, pri=%d, payload=%s",
-            pgn,
-            source,
-            dest,
-            priority,
-            payload.hex(),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "BST D0: PGN=%d, src=%d, dst=%d, pri=%d, payload=%s",
+                pgn,
+                source,
+                dest,
+                priority,
+                payload.hex(),
+            )
 
         return _decode_combined_payload(
             self,
@@ -699,6 +823,7 @@ class BstD0Decoder(DecoderBase, DecoderInterface):
             payload,
             packet,
             timestamp,
+            record_request=record_request,
         )
 
 
@@ -715,8 +840,9 @@ class Bst95Decoder(DecoderBase, DecoderInterface):
     def decode(
         self,
         data: N2KInput,
+        record_request: RecordRequest | None = None,
     ) -> NMEA2000Message | None:
-        packet = _as_bytes(data)
+        packet = _as_buffer(data)
         if len(packet) < 8:
             raise ValueError("BST 95 packet too short")
         if packet[0] != 0x95:
@@ -753,14 +879,15 @@ class Bst95Decoder(DecoderBase, DecoderInterface):
 
         can_data = packet[8:-1]  # between DPPC and checksum
 
-        logger.debug(
-            "BST 95: PGN=%d, src=%d, dst=%d, pri=%d, payload=%s",
-            pgn,
-            source,
-            dest,
-            priority,
-            can_data.hex(),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "BST 95: PGN=%d, src=%d, dst=%d, pri=%d, payload=%s",
+                pgn,
+                source,
+                dest,
+                priority,
+                can_data.hex(),
+            )
 
         return self._decode(
             pgn,
@@ -768,8 +895,9 @@ class Bst95Decoder(DecoderBase, DecoderInterface):
             source,
             dest,
             datetime.now(),
-            can_data[::-1],
+            can_data,
             packet,
+            record_request=record_request,
         )
 
 
@@ -13,6 +13,7 @@ from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 from typing import Any, Protocol
 
+from .encoder import EncodeTemplate
 from .input_formats import N2KFormat
 from .ioclient import (
     ActisenseBstNmea2000Gateway,
@@ -133,6 +134,8 @@ class N2KDevice:
         self._closing = False
         self.heartbeat_counter = 0
         self.devices: dict[int, DiscoveredDevice] = {}
+        # PGN -> template of the address claim and heartbeat, None if not encodable
+        self._templates: dict[int, EncodeTemplate | None] = {}
 
         self.persistence_path = self._resolve_persistence_path(
             persistence_path, persistence_key
@@ -406,7 +409,7 @@ class N2KDevice:
         if self._address_is_occupied(self.address):
             self._increase_address()
 
-        await self.client.send(self._build_address_claim_message())
+        await self.client.send(self._address_claim_message())
         await self._cancel_task(self._claim_ready_task)
         self._claim_ready_task = asyncio.create_task(self._mark_ready_after_claim())
 
@@ -422,9 +425,9 @@ class N2KDevice:
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
     async def _announce_startup_messages(self) -> None:
-        await self.client.send(self._build_product_information_message())
+        await self.client.send(self._product_information_message())
         if self._has_configuration_information():
-            await self.client.send(self._build_configuration_information_message())
+            await self.client.send(self._configuration_information_message())
 
     async def _heartbeat_loop(self) -> None:
         while self._started and not self._closing:
@@ -432,18 +435,18 @@ class N2KDevice:
             if not self._started or self._closing:
                 return
             if self.ready:
-                await self.client.send(self._build_heartbeat_message())
+                await self.client.send(self._heartbeat_message())
 
     async def _handle_iso_request(self, message: NMEA2000Message) -> None:
         requested_pgn = message.get_field_int_value_by_id("pgn")
         if requested_pgn == 60928:
-            await self.client.send(self._build_address_claim_message())
+            await self.client.send(self._address_claim_message())
             return
         if requested_pgn == 126996:
-            await self.client.send(self._build_product_information_message())
+            await self.client.send(self._product_information_message())
             return
         if requested_pgn == 126998 and self._has_configuration_information():
-            await self.client.send(self._build_configuration_information_message())
+            await self.client.send(self._configuration_information_message())
             return
         if requested_pgn == 126464:
             await self.client.send(self._build_pgn_list_message(message.source))
@@ -516,6 +519,51 @@ class N2KDevice:
         self._ready = False
         self._ready_event.clear()
 
+    def _template_message(
+        self, pgn: int, build: Callable[[], NMEA2000Message], **values: Any
+    ) -> NMEA2000Message:
+        """Return one of the device's own messages from its encode template.
+
+        The template is compiled from ``build`` on first use and kept for the
+        life of the device, so it is only used for the address claim and the
+        heartbeat; ``values`` are the only fields that change between sends.
+        """
+        if pgn not in self._templates:
+            try:
+                self._templates[pgn] = EncodeTemplate(build(), varying=values)
+            except ValueError as exc:
+                logger.warning(
+                    "Cannot build an encode template for PGN %s, "
+                    "sending it as a plain message: %s",
+                    pgn,
+                    exc,
+                )
+                self._templates[pgn] = None
+        template = self._templates[pgn]
+        if template is None:
+            # Let the client report the encoding error as for other messages
+            return build()
+        template.source = self.address
+        return template.message(**values)
+
+    def _address_claim_message(self) -> NMEA2000Message:
+        return self._template_message(60928, self._build_address_claim_message)
+
+    def _product_information_message(self) -> NMEA2000Message:
+        # Built per send, the model and software attributes may have changed
+        return self._build_product_information_message()
+
+    def _heartbeat_message(self) -> NMEA2000Message:
+        self.heartbeat_counter = (self.heartbeat_counter + 1) % 253
+        return self._template_message(
+            126993,
+            self._build_heartbeat_message,
+            sequenceCounter=self.heartbeat_counter,
+        )
+
+    def _configuration_information_message(self) -> NMEA2000Message:
+        return self._build_configuration_information_message()
+
     def _build_iso_request_message(
         self, requested_pgn: int, *, source: int | None = None, destination: int = 255
     ) -> NMEA2000Message:
@@ -585,7 +633,6 @@ class N2KDevice:
         )
 
     def _build_heartbeat_message(self) -> NMEA2000Message:
-        self.heartbeat_counter = (self.heartbeat_counter + 1) % 253
         return NMEA2000Message(
             PGN=126993,
             id="heartbeat",
@@ -2,23 +2,96 @@
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Generic, Literal, TypeAlias, TypeVar, overload
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias, TypeVar, overload
 
-import can.message
+if TYPE_CHECKING:
+    import can.message
 
 from . import pgns as pgns_module
+from .consts import FieldTypes
 from .decoder import NMEA2000Decoder
 from .input_formats import N2KFormat
-from .message import NMEA2000Message
+from .message import NMEA2000Field, NMEA2000Message
+from .records import LIST_FIELD_ID, RECORD_CLASSES, N2KRecord, record_class
+from .utils import encode_number
 
 N2KEncoded: TypeAlias = (  # pylint: disable=invalid-name
-    str | list[str] | list[bytes] | list[can.message.Message]
+    "str | list[str] | list[bytes] | list[can.message.Message]"
 )
 EncodedT_co = TypeVar("EncodedT_co", covariant=True)
 
 
+@functools.lru_cache(maxsize=4096)
+def _encode_function(
+    pgn: int, message_id: str, trusted: bool = False
+) -> Callable[[Any], bytes]:
+    """Return the generated encode function of a PGN variant.
+
+    The trusted variant skips the validation of field values.
+    """
+    prefix = "trusted_encode_pgn" if trusted else "encode_pgn"
+    encode_func = getattr(pgns_module, f"{prefix}_{pgn}", None)
+
+    # if we have multiple functions we need to use the ID as well
+    if not encode_func:
+        encode_func = getattr(pgns_module, f"{prefix}_{pgn}_{message_id}", None)
+
+        if not encode_func:
+            raise ValueError(f"No encoding function found for PGN: {pgn}")
+    return encode_func
+
+
+def _encode_payload(nmea200_message: NMEA2000Message, trusted: bool = False) -> bytes:
+    """Encode the PGN payload of a message with its generated encode function."""
+    encode_func = _encode_function(nmea200_message.PGN, nmea200_message.id, trusted)
+    try:
+        can_data_bytes = encode_func(nmea200_message)
+    except Exception as exc:
+        raise ValueError(exc) from exc
+    return can_data_bytes
+
+
+@functools.lru_cache(maxsize=4096)
+def _frame_id(pgn_id: int, source: int, dest: int, priority: int) -> int:
+    """
+    Builds a 29-bit CAN frame ID (ID0 - ID28) from PGN, source ID, destination, and priority.
+    Based on https://canboat.github.io/canboat/canboat.html
+    """
+    dp = (pgn_id >> 16) & 0x03  # Extract DP (and reserved)
+    pf = (pgn_id >> 8) & 0xFF  # Extract PF
+    ps = 0
+
+    if pf < 0xF0:
+        # PDU1 format: destination-specific, use `dest` in PS
+        ps = dest
+    else:
+        # PDU2 format: broadcast, PGN includes PS
+        ps = pgn_id & 0xFF
+
+    pgn_field = (dp << 16) | (pf << 8) | ps  # 18 bits
+    frame_id = (priority & 0x7) << 26  # 3 bits: Priority
+    frame_id |= (pgn_field & 0x3FFFF) << 8  # 18 bits: PGN
+    frame_id |= source & 0xFF  # 8 bits: Source
+
+    return frame_id
+
+
+# A fast packet has a 5 bit frame counter, and its first frame carries 6 bytes
+_FAST_PACKET_MAX_FRAMES = 32
+_FAST_PACKET_MAX_PAYLOAD = 6 + 7 * (_FAST_PACKET_MAX_FRAMES - 1)
+# Header bytes of the frames of a message, indexed by its sequence counter
+_FAST_PACKET_HEADERS = tuple(
+    bytes(range(sequence << 5, (sequence << 5) + _FAST_PACKET_MAX_FRAMES))
+    for sequence in range(8)
+)
+
+# Looked up once per PGN instead of once per encoded message
+_is_fast_pgn = functools.lru_cache(maxsize=4096)(NMEA2000Decoder.is_fast_pgn)
+
+
 class EncoderInterface(ABC, Generic[EncodedT_co]):
     """Encoder contract for a single output format."""
 
@@ -29,106 +102,427 @@ class EncoderInterface(ABC, Generic[EncodedT_co]):
     ) -> EncodedT_co:
         """Encode an NMEA2000Message."""
 
+    def encode_many(self, messages: Iterable[NMEA2000Message]) -> bytes | memoryview:
+        """Encode messages into one buffer, as written to a capture file.
+
+        Binary frames are concatenated and text frames end with a newline.
+        """
+        buffer = bytearray()
+        for nmea200_message in messages:
+            self._encode_into(buffer, nmea200_message)
+        return memoryview(buffer)
+
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        """Append the frames of one message to ``buffer``."""
+        encoded: Any = self.encode(nmea200_message)
+        if isinstance(encoded, str):
+            buffer += encoded.encode()
+            buffer += b"\n"
+            return
+        for frame in encoded:
+            if isinstance(frame, str):
+                buffer += frame.encode()
+                buffer += b"\n"
+            elif isinstance(frame, (bytes, bytearray)):
+                buffer += frame
+            else:
+                raise ValueError(
+                    f"{type(self).__name__} frames cannot be written to a buffer"
+                )
+
 
 class EncoderBase:
     """Shared encoder mechanics used by concrete format handlers."""
 
-    def __init__(self) -> None:
-        # Sequence counter (3 bits)
-        self.sequence_counter = 0
+    def __init__(self, trusted: bool = False) -> None:
+        # Fast packet sequence counter (3 bits) per (PGN, source address), so
+        # interleaved fast packet PGNs never share a sequence
+        self._sequence_counters: dict[tuple[int, int], int] = {}
+        # Frames of one fast packet message, each at an 8 byte stride
+        self._frame_buffer = bytearray(_FAST_PACKET_MAX_FRAMES * 8)
+        # Skip validation for messages built by our own code from typed values
+        self.trusted = trusted
 
     def _call_encode_function(self, nmea200_message: NMEA2000Message) -> bytes:
-        encode_func_name = f"encode_pgn_{nmea200_message.PGN}"
-        encode_func: Callable[[NMEA2000Message], bytes] | None = getattr(
-            pgns_module,
-            encode_func_name,
-            None,
-        )
+        if isinstance(nmea200_message, EncodedMessage) and (
+            self.trusted or nmea200_message.payload_is_current()
+        ):
+            return nmea200_message.payload
+        return _encode_payload(nmea200_message, self.trusted)
+
+    def _encode_fast_message(
+        self, payload_bytes: bytes, pgn: int = 0, source: int = 0
+    ) -> list[bytes]:
+        """Split a payload into fast packet frames for one PGN and source."""
+        payload_length = len(payload_bytes)
+        if payload_length > _FAST_PACKET_MAX_PAYLOAD:
+            raise ValueError(
+                f"Fast packet payload of {payload_length} bytes exceeds "
+                f"{_FAST_PACKET_MAX_PAYLOAD} bytes"
+            )
+        key = (pgn, source)
+        sequence_counter = self._sequence_counters.get(key, 0)
+        self._sequence_counters[key] = (sequence_counter + 1) % 8
+
+        # Frames hold 7 bytes of the length byte and payload after their
+        # header byte; lay them out at an 8 byte stride and slice them off
+        body = bytes((payload_length,)) + payload_bytes
+        body_length = payload_length + 1
+        frame_count = (body_length + 6) // 7
+        stream_length = body_length + frame_count
+        buffer = self._frame_buffer
+        buffer[0 : 8 * frame_count : 8] = _FAST_PACKET_HEADERS[sequence_counter][
+            :frame_count
+        ]
+        for column in range(min(body_length, 7)):
+            chunk = body[column::7]
+            buffer[column + 1 : column + 2 + 8 * (len(chunk) - 1) : 8] = chunk
+        stream = bytes(buffer[:stream_length])
+        return [stream[start : start + 8] for start in range(0, stream_length, 8)]
+
+    # Kept on the class, format handlers build their headers through it
+    _build_header = staticmethod(_frame_id)
+
+    def _encode(self, nmea200_message: NMEA2000Message) -> list[bytes]:
+        """Construct a single NMEA 2000 TCP packet from PGN, source ID, priority, and CAN data."""
+        if not self.trusted:
+            if not 0 <= nmea200_message.priority <= 7:
+                raise ValueError("Priority must be between 0 and 7")
+            if not 0 <= nmea200_message.source <= 255:
+                raise ValueError("Source ID must be between 0 and 255")
+            if not 0 <= nmea200_message.PGN <= 0x3FFFF:  # PGN is 18 bits
+                raise ValueError("PGN ID must be between 0 and 0x3FFFF")
+
+        can_data_bytes = self._call_encode_function(nmea200_message)
+        is_fast = _is_fast_pgn(nmea200_message.PGN)
+        if is_fast:
+            bytes_list = self._encode_fast_message(
+                can_data_bytes, nmea200_message.PGN, nmea200_message.source
+            )
+            return bytes_list
+        return [can_data_bytes]
 
-        # if we have multiple functions we need to use the ID as well
-        if not encode_func:
-            encode_func_name = f"encode_pgn_{nmea200_message.PGN}_{nmea200_message.id}"
-            encode_func = getattr(pgns_module, encode_func_name, None)
 
-            if not encode_func:
+# Field types encoded as the value divided by the field resolution
+_SCALED_FIELD_TYPES = frozenset(
+    {
+        FieldTypes.NUMBER,
+        FieldTypes.DURATION,
+        FieldTypes.MMSI,
+        FieldTypes.PGN,
+        FieldTypes.FIELD_INDEX,
+    }
+)
+# Fixed-size fields whose payload bits a template can replace
+_TEMPLATE_FIELD_TYPES = _SCALED_FIELD_TYPES | {
+    FieldTypes.LOOKUP,
+    FieldTypes.BITLOOKUP,
+    FieldTypes.INDIRECT_LOOKUP,
+    FieldTypes.RESERVED,
+    FieldTypes.SPARE,
+    FieldTypes.TIME,
+    FieldTypes.DATE,
+}
+
+
+class EncodedMessage(NMEA2000Message):
+    """Message built by EncodeTemplate or encode_values, carrying its encoded payload.
+
+    Encoders send ``payload`` instead of encoding the fields. A checked encoder
+    first makes sure the fields were not changed since the payload was encoded,
+    and encodes the fields if they were; a trusted encoder sends the payload
+    as is.
+    """
+
+    __slots__ = ("_encoded_fields", "payload")
+
+    def __init__(self, payload: bytes, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.payload = payload
+        self._encoded_fields = [nmea_field.copy() for nmea_field in self.fields]
+
+    def payload_is_current(self) -> bool:
+        """Return True if the fields still hold the values ``payload`` encodes."""
+        return self.fields == self._encoded_fields
+
+
+class EncodeTemplate:
+    """A message compiled once for repeated sends in which few fields change.
+
+    The payload is encoded with the generated encode function when the template
+    is created. ``encode`` then only replaces the bits of the ``varying`` fields,
+    skipping the per-field lookups and validation of a full encode, and
+    ``can_id`` is the 29-bit CAN identifier of the message header.
+
+    Varying fields must have a fixed position and size in the payload. Numeric
+    fields take their value in the field's unit, or ``None`` for not available;
+    other fields, such as lookups, take their raw value. Fields left out of an
+    ``encode`` call keep the value of the compiled message.
+    """
+
+    def __init__(self, message: NMEA2000Message, varying: Iterable[str] = ()):
+        """Compile ``message``; raise ValueError if it cannot be encoded."""
+        payload = _encode_payload(message)
+        self._length = len(payload)
+        self._payload = int.from_bytes(payload, "little")
+        self.PGN = message.PGN  # pylint: disable=invalid-name
+        self.id = message.id
+        self.description = message.description
+        self.ttl = message.ttl
+        self.destination = message.destination
+        self.priority = message.priority
+        self._source = message.source
+        self.can_id = _frame_id(self.PGN, self._source, self.destination, self.priority)
+        self._fields = [nmea_field.copy() for nmea_field in message.fields]
+        field_indexes = {f.id: index for index, f in enumerate(self._fields)}
+        specs = {spec.id: spec for spec in record_class(message.id).FIELDS}
+
+        # field id -> (spec, field index, mask of its payload bits)
+        self._layout: dict[str, tuple[Any, int, int]] = {}
+        for field_id in varying:
+            spec = specs.get(field_id)
+            if spec is None or field_id not in field_indexes:
+                raise ValueError(
+                    f"PGN: {self.id}: Field with id '{field_id}' is missing."
+                )
+            if (
+                spec.bit_offset is None
+                or spec.bit_length is None
+                or spec.type not in _TEMPLATE_FIELD_TYPES
+            ):
                 raise ValueError(
-                    f"No encoding function found for PGN: {nmea200_message.PGN}"
+                    f"PGN: {self.id}: Field '{field_id}' has no fixed position "
+                    "and size and cannot vary"
                 )
+            mask = ((1 << spec.bit_length) - 1) << spec.bit_offset
+            self._layout[field_id] = (spec, field_indexes[field_id], mask)
+
+    @property
+    def source(self) -> int:
+        """Source address of the messages, updating ``can_id`` when set."""
+        return self._source
+
+    @source.setter
+    def source(self, source: int) -> None:
+        self._source = source
+        self.can_id = _frame_id(self.PGN, source, self.destination, self.priority)
+
+    def _pack(self, values: dict[str, Any], raw_values: dict[str, int] | None) -> int:
+        data_raw = self._payload
+        for field_id, value in values.items():
+            layout = self._layout.get(field_id)
+            if layout is None:
+                raise ValueError(f"PGN: {self.id}: Field '{field_id}' is not varying")
+            spec, _, mask = layout
+            bit_length = spec.bit_length
+            if spec.type in _SCALED_FIELD_TYPES or value is None:
+                bits = encode_number(value, bit_length, spec.signed, spec.resolution)
+            elif not isinstance(value, int) or not 0 <= value < (1 << bit_length):
+                raise ValueError(
+                    f"PGN: {self.id}: Raw value {value!r} of '{field_id}' does not "
+                    f"fit in {bit_length} bits"
+                )
+            else:
+                bits = value
+            data_raw = (data_raw & ~mask) | (bits << spec.bit_offset)
+            if raw_values is not None:
+                if spec.signed and bits >> (bit_length - 1):
+                    bits -= 1 << bit_length
+                raw_values[field_id] = bits
+        return data_raw
+
+    def encode(self, **values: Any) -> bytes:
+        """Return the payload with the given varying field values packed in."""
+        return self._pack(values, None).to_bytes(self._length, "little")
+
+    def message(self, **values: Any) -> EncodedMessage:
+        """Return a message with the given field values and its payload.
+
+        The message has its own copy of every field. Trusted encoders send the
+        payload without encoding the fields again, so the returned message
+        should not be modified.
+        """
+        raw_values: dict[str, int] = {}
+        data_raw = self._pack(values, raw_values)
+        fields = [nmea_field.copy() for nmea_field in self._fields]
+        for field_id, value in values.items():
+            spec, index, _ = self._layout[field_id]
+            fields[index] = NMEA2000Field(
+                spec.id,
+                spec.name,
+                spec.description,
+                spec.unit_of_measurement,
+                value,
+                raw_values[field_id],
+                spec.physical_quantities,
+                spec.type,
+                spec.part_of_primary_key,
+            )
+        return EncodedMessage(
+            data_raw.to_bytes(self._length, "little"),
+            PGN=self.PGN,
+            id=self.id,
+            description=self.description,
+            ttl=self.ttl,
+            fields=fields,
+            source=self._source,
+            destination=self.destination,
+            priority=self.priority,
+        )
 
-        try:
-            can_data_bytes = encode_func(nmea200_message)  # pylint: disable=not-callable
-        except Exception as exc:
-            raise ValueError(exc) from exc
-        return can_data_bytes
 
-    def _encode_fast_message(self, payload_bytes: bytes) -> list[bytes]:
-        payload_length = len(payload_bytes)
+class _PlainField:
+    """A field value handed to a generated encode function by encode_values."""
 
-        first_frame_capacity = 6
-        if payload_length <= first_frame_capacity:
-            total_frames = 1
-        else:
-            leftover = payload_length - first_frame_capacity
-            total_frames = 1 + (leftover + 7 - 1) // 7
-
-        packets = []
-        frame_offset = 0
-        for frame_counter in range(total_frames):
-            chunk_size = first_frame_capacity if frame_counter == 0 else 7
-            start_index = frame_offset
-            end_index = min(start_index + chunk_size, payload_length)
-            frame_data = payload_bytes[start_index:end_index]
-            frame_offset = end_index
-
-            frame_bytes = bytes([(self.sequence_counter << 5) | frame_counter])
-            if frame_counter == 0:
-                frame_bytes += bytes([payload_length])
-            frame_bytes += frame_data
-
-            packets.append(frame_bytes)
-
-        self.sequence_counter = (self.sequence_counter + 1) % 8
-        return packets
-
-    @staticmethod
-    def _build_header(pgn_id: int, source: int, dest: int, priority: int) -> int:
-        """
-        Builds a 29-bit CAN frame ID (ID0 - ID28) from PGN, source ID, destination, and priority.
-        Based on https://canboat.github.io/canboat/canboat.html
-        """
-        dp = (pgn_id >> 16) & 0x03  # Extract DP (and reserved)
-        pf = (pgn_id >> 8) & 0xFF  # Extract PF
-        ps = 0
+    __slots__ = ("raw_value", "value")
 
-        if pf < 0xF0:
-            # PDU1 format: destination-specific, use `dest` in PS
-            ps = dest
-        else:
-            # PDU2 format: broadcast, PGN includes PS
-            ps = pgn_id & 0xFF
+    def __init__(self, value: Any, raw_value: Any = None) -> None:
+        self.value = value
+        self.raw_value = raw_value
 
-        pgn_field = (dp << 16) | (pf << 8) | ps  # 18 bits
-        frame_id = (priority & 0x7) << 26  # 3 bits: Priority
-        frame_id |= (pgn_field & 0x3FFFF) << 8  # 18 bits: PGN
-        frame_id |= source & 0xFF  # 8 bits: Source
 
-        return frame_id
+# Fields left out of encode_values whose default is all bits set (not available)
+_ALL_ONES_FIELD_TYPES = frozenset(
+    {
+        FieldTypes.LOOKUP,
+        FieldTypes.BITLOOKUP,
+        FieldTypes.INDIRECT_LOOKUP,
+        FieldTypes.RESERVED,
+        FieldTypes.SPARE,
+    }
+)
 
-    def _encode(self, nmea200_message: NMEA2000Message) -> list[bytes]:
-        """Construct a single NMEA 2000 TCP packet from PGN, source ID, priority, and CAN data."""
-        if not 0 <= nmea200_message.priority <= 7:
-            raise ValueError("Priority must be between 0 and 7")
-        if not 0 <= nmea200_message.source <= 255:
-            raise ValueError("Source ID must be between 0 and 255")
-        if not 0 <= nmea200_message.PGN <= 0x3FFFF:  # PGN is 18 bits
-            raise ValueError("PGN ID must be between 0 and 0x3FFFF")
 
-        can_data_bytes = self._call_encode_function(nmea200_message)
-        is_fast = NMEA2000Decoder.is_fast_pgn(nmea200_message.PGN)
-        if is_fast:
-            bytes_list = self._encode_fast_message(can_data_bytes)
-            return bytes_list
-        return [can_data_bytes]
+class _ValuesLayout:
+    """What encode_values needs to know about one PGN variant."""
+
+    __slots__ = (
+        "defaults",
+        "encode",
+        "field_ids",
+        "pgn",
+        "record",
+        "repeating_ids",
+        "trusted_encode",
+    )
+
+    def __init__(self, record: type[N2KRecord]) -> None:
+        self.record = record
+        self.pgn = record.PGN
+        self.encode = _encode_function(record.PGN, record.ID)
+        self.trusted_encode = _encode_function(record.PGN, record.ID, True)
+        self.field_ids = tuple(spec.id for spec in record.FIELDS)
+        self.repeating_ids = frozenset(record.REPEATING_FIELD_IDS)
+        self.defaults: dict[str, _PlainField] = {}
+        for spec in record.FIELDS:
+            raw_value = None
+            if spec.bit_length is not None and spec.type in _ALL_ONES_FIELD_TYPES:
+                raw_value = (1 << spec.bit_length) - 1
+            self.defaults[spec.id] = _PlainField(None, raw_value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _values_layout(pgn_or_id: int | str) -> _ValuesLayout:
+    if isinstance(pgn_or_id, str):
+        return _ValuesLayout(record_class(pgn_or_id))
+    records = [cls for cls in RECORD_CLASSES.values() if cls.PGN == pgn_or_id]
+    if not records:
+        raise ValueError(f"No encoding function found for PGN: {pgn_or_id}")
+    if len(records) > 1:
+        raise ValueError(
+            f"PGN {pgn_or_id} has several variants, pass one of their ids: "
+            + ", ".join(cls.ID for cls in records)
+        )
+    return _ValuesLayout(records[0])
+
+
+class _FieldValues:
+    """Message stand-in serving plain field values to a generated encode function."""
+
+    __slots__ = ("_defaults", "_values", "fields", "id")
+
+    def __init__(
+        self, layout: _ValuesLayout, values: dict[str, Any], fields: list[Any]
+    ) -> None:
+        self.id = layout.record.ID
+        self._defaults = layout.defaults
+        self._values = values
+        self.fields = fields
+
+    def get_field_by_id(self, field_id: str) -> _PlainField:
+        """Return the given value of a field, or its default if left out."""
+        value = self._values.get(field_id, _PlainField)
+        if value is _PlainField:
+            return self._defaults[field_id]
+        return _PlainField(value)
+
+
+def encode_values(
+    pgn_or_id: int | str,
+    values: Sequence[Any] | Mapping[str, Any] = (),
+    /,
+    *,
+    source: int = 0,
+    destination: int = 255,
+    priority: int = 0,
+    entries: Iterable[Mapping[str, Any]] | None = None,
+    trusted: bool = False,
+    **field_values: Any,
+) -> EncodedMessage:
+    """Encode plain field values without building NMEA2000Field objects.
+
+    ``pgn_or_id`` is a PGN variant id such as ``vesselHeading``, or a PGN that
+    has a single variant. Field values are given by field id, as ``values``
+    and keyword arguments, or as a tuple in field order. Fields left out are
+    encoded as not available, and ``entries`` holds the repeating field set as
+    a list of field id to value mappings. ``trusted`` skips the validation of
+    the values, as for an encoder created with ``trusted=True``.
+
+    The returned message carries the encoded payload in ``payload`` and no
+    fields; encoders send the payload unless fields were added to it.
+    """
+    layout = _values_layout(pgn_or_id)
+    if isinstance(values, (dict, Mapping)):
+        given = {**values, **field_values} if field_values else dict(values)
+    else:
+        if len(values) > len(layout.field_ids):
+            raise ValueError(
+                f"PGN: {layout.record.ID}: expected at most "
+                f"{len(layout.field_ids)} values, got {len(values)}"
+            )
+        given = dict(zip(layout.field_ids, values))
+        given.update(field_values)
+    if not layout.defaults.keys() >= given.keys():
+        unknown = ", ".join(sorted(given.keys() - layout.defaults.keys()))
+        raise ValueError(f"PGN: {layout.record.ID}: Unknown fields: {unknown}")
+
+    fields: list[Any] = []
+    if entries is not None:
+        entry_fields = []
+        for entry in entries:
+            if not layout.repeating_ids >= entry.keys():
+                unknown = ", ".join(sorted(entry.keys() - layout.repeating_ids))
+                raise ValueError(f"PGN: {layout.record.ID}: Unknown fields: {unknown}")
+            entry_fields.append(
+                {key: NMEA2000Field(key, value=value) for key, value in entry.items()}
+            )
+        fields.append(NMEA2000Field(LIST_FIELD_ID, value=entry_fields))
+
+    try:
+        encode = layout.trusted_encode if trusted else layout.encode
+        payload = encode(_FieldValues(layout, given, fields))
+    except Exception as exc:
+        raise ValueError(exc) from exc
+    return EncodedMessage(
+        payload,
+        PGN=layout.pgn,
+        id=layout.record.ID,
+        description=layout.record.DESCRIPTION,
+        ttl=layout.record.TTL,
+        source=source,
+        destination=destination,
+        priority=priority,
+    )
 
 
 def _normalize_output_format(output_format: N2KFormat | str) -> N2KFormat:
@@ -142,7 +536,7 @@ def _normalize_output_format(output_format: N2KFormat | str) -> N2KFormat:
 
 
 @overload
-def create_encoder() -> EncoderInterface[str]: ...
+def create_encoder(*, trusted: bool = ...) -> EncoderInterface[str]: ...
 
 
 @overload
@@ -156,6 +550,7 @@ def create_encoder(
         N2KFormat.PDGY,
         N2KFormat.PDGY_DEBUG,
     ],
+    trusted: bool = ...,
 ) -> EncoderInterface[str]: ...
 
 
@@ -168,6 +563,7 @@ def create_encoder(
         N2KFormat.CANDUMP2,
         N2KFormat.CANDUMP3,
     ],
+    trusted: bool = ...,
 ) -> EncoderInterface[str | list[str]]: ...
 
 
@@ -180,23 +576,34 @@ def create_encoder(
         N2KFormat.BST_D0,
         N2KFormat.BST_95,
     ],
+    trusted: bool = ...,
 ) -> EncoderInterface[list[bytes]]: ...
 
 
 @overload
 def create_encoder(
     output_format: Literal[N2KFormat.PYTHON_CAN],
+    trusted: bool = ...,
 ) -> EncoderInterface[list[can.message.Message]]: ...
 
 
 @overload
-def create_encoder(output_format: N2KFormat | str) -> EncoderInterface[N2KEncoded]: ...
+def create_encoder(
+    output_format: N2KFormat | str, trusted: bool = ...
+) -> EncoderInterface[N2KEncoded]: ...
 
 
 def create_encoder(
     output_format: N2KFormat | str = N2KFormat.N2K_ASCII_RAW,
+    trusted: bool = False,
 ) -> EncoderInterface[N2KEncoded]:
-    """Create an encoder bound to one output format."""
+    """Create an encoder bound to one output format.
+
+    A ``trusted`` encoder uses generated encode functions that skip the
+    validation of field values and of the header. Use it for messages built by
+    your own code from valid, typed values; invalid values are not reported and
+    produce wrong frames.
+    """
     from .encoder_formats import (  # pylint: disable=import-outside-toplevel
         ENCODER_CLASSES,
     )
@@ -205,11 +612,13 @@ def create_encoder(
     encoder_cls = ENCODER_CLASSES.get(normalized_format)
     if encoder_cls is None:
         raise ValueError(f"Unsupported output format: {normalized_format}")
-    return encoder_cls()
+    return encoder_cls(trusted=trusted)
 
 
 __all__ = [
+    "EncodeTemplate",
     "EncoderBase",
     "EncoderInterface",
     "create_encoder",
+    "encode_values",
 ]
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import base64
+import functools
 import logging
+import operator
+from binascii import hexlify
+from collections.abc import Callable
 from datetime import datetime
+from typing import TYPE_CHECKING, Protocol
 
-import can.message
+if TYPE_CHECKING:
+    import can.message
 
 from .encoder import EncoderBase, EncoderInterface, N2KEncoded
 from .input_formats import N2KFormat
@@ -16,78 +22,93 @@ from .utils import calculate_canbus_checksum
 logger = logging.getLogger(__name__)
 
 
-def _bytes_to_hex_string(
-    data: bytes,
-    separator: str = " ",
-    uppercase: bool = True,
-) -> str:
-    formatter = "{:02X}" if uppercase else "{:02x}"
-    return separator.join(formatter.format(byte) for byte in data)
-
-
 def _match_text_output(lines: list[str]) -> str | list[str]:
     return lines[0] if len(lines) == 1 else lines
 
 
 def _compute_0183_checksum(sentence: str) -> str:
     payload = sentence[1:] if sentence and sentence[0] in "$!" else sentence
-    checksum = 0
-    for char in payload:
-        checksum ^= ord(char)
+    checksum = functools.reduce(operator.xor, payload.encode(), 0)
     return f"*{checksum:02X}"
 
 
+class _SecondPrefixCache:
+    """Formats the part of a timestamp that only changes once a second.
+
+    Frames arrive many times a second, so the prefix of the last second is
+    kept and only the sub-second digits are formatted per frame.
+    """
+
+    __slots__ = ("_entry", "_format_second")
+
+    def __init__(self, format_second: Callable[[datetime], str]) -> None:
+        self._format_second = format_second
+        self._entry: tuple[datetime | None, str] = (None, "")
+
+    def __call__(self, timestamp: datetime) -> str:
+        second = timestamp.replace(microsecond=0)
+        cached_second, prefix = self._entry
+        if second != cached_second:
+            prefix = self._format_second(second)
+            # One tuple assignment, so threads never see a mismatched pair
+            self._entry = (second, prefix)
+        return prefix
+
+
+_time_of_day_prefix = _SecondPrefixCache(lambda second: second.strftime("%H:%M:%S."))
+_candump3_prefix = _SecondPrefixCache(lambda second: f"({int(second.timestamp())}.")
+
+
 def _format_basic_timestamp(timestamp: datetime) -> str:
     return timestamp.isoformat(timespec="milliseconds") + "Z"
 
 
 def _format_time_of_day(timestamp: datetime) -> str:
-    return timestamp.strftime("%H:%M:%S.%f")[:-3]
+    return f"{_time_of_day_prefix(timestamp)}{timestamp.microsecond // 1000:03d}"
 
 
 def _format_candump3_timestamp(timestamp: datetime) -> str:
-    return f"({timestamp.timestamp():.6f})"
+    return f"{_candump3_prefix(timestamp)}{timestamp.microsecond:06d})"
 
 
-def _encode_can_frame_packets(
+def _encode_can_frame_lines(
     encoder: EncoderBase,
     nmea200_message: NMEA2000Message,
-) -> list[bytes]:
+) -> list[str]:
+    """Return ``<CAN ID> <data bytes>`` hex text for each CAN frame of a message."""
+    arbitration_id, frames = _encode_can_frames(encoder, nmea200_message)
+    frame_id = f"{arbitration_id:08X} "
+    return [frame_id + frame.hex(" ").upper() for frame in frames]
+
+
+def _encode_can_frames(
+    encoder: EncoderBase,
+    nmea200_message: NMEA2000Message,
+) -> tuple[int, list[bytes]]:
+    """Return the 29-bit CAN ID and the data of each CAN frame for a message."""
     encoded_messages = encoder._encode(nmea200_message)  # pylint: disable=protected-access
-    # Construct the frame ID
-    frame_id_int = type(encoder)._build_header(  # pylint: disable=protected-access
+    arbitration_id = type(encoder)._build_header(  # pylint: disable=protected-access
         nmea200_message.PGN,
         nmea200_message.source,
         nmea200_message.destination,
         nmea200_message.priority,
     )
-    frame_id_bytes = frame_id_int.to_bytes(4, byteorder="big")
-    result = []
-    for message in encoded_messages:
-        # Construct and return the full packet
-        text_msg = (
-            frame_id_bytes.hex().upper() + " " + _bytes_to_hex_string(message) + "\r\n"
-        )
-        result.append(text_msg.encode())
-    return result
+    return arbitration_id, encoded_messages
 
 
 def _encode_python_can_messages(
     encoder: EncoderBase,
     nmea200_message: NMEA2000Message,
 ) -> list[can.message.Message]:
-    encoded_messages = encoder._encode(nmea200_message)  # pylint: disable=protected-access
-    arbitration_id = type(encoder)._build_header(  # pylint: disable=protected-access
-        nmea200_message.PGN,
-        nmea200_message.source,
-        nmea200_message.destination,
-        nmea200_message.priority,
-    )
+    # Imported on use so text and binary encoding work without python-can loaded
+    import can.message  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    arbitration_id, frames = _encode_can_frames(encoder, nmea200_message)
 
     # python-can expects timestamp as a float (Unix epoch seconds)
     ts = nmea200_message.timestamp.timestamp()
     result = []
-    for message in encoded_messages:
+    for message in frames:
         result.append(
             can.message.Message(
                 timestamp=ts,
@@ -153,17 +174,11 @@ class BasicStringEncoder(EncoderInterface[str], EncoderBase):
     ) -> str:
         can_data_bytes = self._call_encode_function(nmea200_message)
         timestamp = _format_basic_timestamp(nmea200_message.timestamp)
-        data_hex = [f"{byte:02x}" for byte in can_data_bytes]
-        return ",".join(
-            [
-                timestamp,
-                str(nmea200_message.priority),
-                str(nmea200_message.PGN),
-                str(nmea200_message.source),
-                str(nmea200_message.destination),
-                str(len(can_data_bytes)),
-                *data_hex,
-            ]
+        data_hex = f",{can_data_bytes.hex(',')}" if can_data_bytes else ""
+        return (
+            f"{timestamp},{nmea200_message.priority},{nmea200_message.PGN},"
+            f"{nmea200_message.source},{nmea200_message.destination},"
+            f"{len(can_data_bytes)}{data_hex}"
         )
 
 
@@ -174,7 +189,14 @@ class CanFrameAsciiEncoder(EncoderInterface[list[bytes]], EncoderBase):
         self,
         nmea200_message: NMEA2000Message,
     ) -> list[bytes]:
-        return _encode_can_frame_packets(self, nmea200_message)
+        lines = _encode_can_frame_lines(self, nmea200_message)
+        return [f"{line}\r\n".encode() for line in lines]
+
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
+        frame_id = b"%08X " % arbitration_id
+        for frame in frames:
+            buffer += frame_id + hexlify(frame, b" ").upper() + b"\r\n"
 
 
 class CanFrameAsciiRawOutEncoder(EncoderInterface[str | list[str]], EncoderBase):
@@ -184,11 +206,13 @@ class CanFrameAsciiRawOutEncoder(EncoderInterface[str | list[str]], EncoderBase)
         self,
         nmea200_message: NMEA2000Message,
     ) -> str | list[str]:
-        lines = [
-            frame.decode("utf-8").rstrip("\r\n")
-            for frame in _encode_can_frame_packets(self, nmea200_message)
-        ]
-        return _match_text_output(lines)
+        return _match_text_output(_encode_can_frame_lines(self, nmea200_message))
+
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
+        frame_id = b"%08X " % arbitration_id
+        for frame in frames:
+            buffer += frame_id + hexlify(frame, b" ").upper() + b"\n"
 
 
 class CanFrameAsciiRawEncoder(EncoderInterface[str | list[str]], EncoderBase):
@@ -198,13 +222,16 @@ class CanFrameAsciiRawEncoder(EncoderInterface[str | list[str]], EncoderBase):
         self,
         nmea200_message: NMEA2000Message,
     ) -> str | list[str]:
+        prefix = f"{_format_time_of_day(nmea200_message.timestamp)} R "
+        lines = _encode_can_frame_lines(self, nmea200_message)
+        return _match_text_output([prefix + line for line in lines])
+
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
         time_token = _format_time_of_day(nmea200_message.timestamp)
-        lines = [
-            f"{time_token} R {frame_text}"
-            for frame in _encode_can_frame_packets(self, nmea200_message)
-            for frame_text in [frame.decode("utf-8").rstrip("\r\n")]
-        ]
-        return _match_text_output(lines)
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
+        prefix = f"{time_token} R {arbitration_id:08X} ".encode()
+        for frame in frames:
+            buffer += prefix + hexlify(frame, b" ").upper() + b"\n"
 
 
 class Candump1Encoder(EncoderInterface[str | list[str]], EncoderBase):
@@ -214,13 +241,20 @@ class Candump1Encoder(EncoderInterface[str | list[str]], EncoderBase):
         self,
         nmea200_message: NMEA2000Message,
     ) -> str | list[str]:
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
         lines = [
-            f"<0x{frame.arbitration_id:08X}> [{len(frame.data)}] "
-            f"{_bytes_to_hex_string(bytes(frame.data))}"
-            for frame in _encode_python_can_messages(self, nmea200_message)
+            f"<0x{arbitration_id:08X}> [{len(frame)}] {frame.hex(' ').upper()}"
+            for frame in frames
         ]
         return _match_text_output(lines)
 
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
+        prefix = b"<0x%08X> [" % arbitration_id
+        for frame in frames:
+            buffer += prefix + b"%d] " % len(frame) + hexlify(frame, b" ").upper()
+            buffer += b"\n"
+
 
 class Candump2Encoder(EncoderInterface[str | list[str]], EncoderBase):
     """Encoder for candump2 text."""
@@ -229,13 +263,20 @@ class Candump2Encoder(EncoderInterface[str | list[str]], EncoderBase):
         self,
         nmea200_message: NMEA2000Message,
     ) -> str | list[str]:
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
         lines = [
-            f"can0  {frame.arbitration_id:08X}   [{len(frame.data)}]  "
-            f"{_bytes_to_hex_string(bytes(frame.data))}"
-            for frame in _encode_python_can_messages(self, nmea200_message)
+            f"can0  {arbitration_id:08X}   [{len(frame)}]  {frame.hex(' ').upper()}"
+            for frame in frames
         ]
         return _match_text_output(lines)
 
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
+        prefix = b"can0  %08X   [" % arbitration_id
+        for frame in frames:
+            buffer += prefix + b"%d]  " % len(frame) + hexlify(frame, b" ").upper()
+            buffer += b"\n"
+
 
 class Candump3Encoder(EncoderInterface[str | list[str]], EncoderBase):
     """Encoder for candump3 text."""
@@ -245,13 +286,20 @@ class Candump3Encoder(EncoderInterface[str | list[str]], EncoderBase):
         nmea200_message: NMEA2000Message,
     ) -> str | list[str]:
         timestamp_token = _format_candump3_timestamp(nmea200_message.timestamp)
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
         lines = [
-            f"{timestamp_token} slcan0 {frame.arbitration_id:08X}"
-            f"#{bytes(frame.data).hex().upper()}"
-            for frame in _encode_python_can_messages(self, nmea200_message)
+            f"{timestamp_token} slcan0 {arbitration_id:08X}#{frame.hex().upper()}"
+            for frame in frames
         ]
         return _match_text_output(lines)
 
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        timestamp_token = _format_candump3_timestamp(nmea200_message.timestamp)
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
+        prefix = f"{timestamp_token} slcan0 {arbitration_id:08X}#".encode()
+        for frame in frames:
+            buffer += prefix + hexlify(frame).upper() + b"\n"
+
 
 class PcdinEncoder(EncoderInterface[str], EncoderBase):
     """Encoder for PCDIN sentences."""
@@ -300,16 +348,9 @@ class PdgyEncoder(EncoderInterface[str], EncoderBase):
     ) -> str:
         payload = self._call_encode_function(nmea200_message)
         data = base64.b64encode(payload).decode("ascii")
-        return ",".join(
-            [
-                "!PDGY",
-                str(nmea200_message.PGN),
-                str(nmea200_message.priority),
-                str(nmea200_message.source),
-                str(nmea200_message.destination),
-                "0.000",
-                data,
-            ]
+        return (
+            f"!PDGY,{nmea200_message.PGN},{nmea200_message.priority},"
+            f"{nmea200_message.source},{nmea200_message.destination},0.000,{data}"
         )
 
 
@@ -348,6 +389,14 @@ class TcpEncoder(EncoderInterface[list[bytes]], EncoderBase):
             result.append(bytes([type_byte]) + frame_id_bytes + message)
         return result
 
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        arbitration_id, frames = _encode_can_frames(self, nmea200_message)
+        frame_id_bytes = arbitration_id.to_bytes(4, byteorder="big")
+        for frame in frames:
+            buffer.append((len(frame) & 0x0F) | (1 << 7))
+            buffer += frame_id_bytes
+            buffer += frame
+
 
 class UsbEncoder(EncoderInterface[list[bytes]], EncoderBase):
     """Encoder for USB packets."""
@@ -386,7 +435,7 @@ class UsbEncoder(EncoderInterface[list[bytes]], EncoderBase):
         return result
 
 
-class PythonCanEncoder(EncoderInterface[list[can.message.Message]], EncoderBase):
+class PythonCanEncoder(EncoderInterface["list[can.message.Message]"], EncoderBase):
     """Encoder for python-can Message objects."""
 
     def encode(
@@ -395,6 +444,10 @@ class PythonCanEncoder(EncoderInterface[list[can.message.Message]], EncoderBase)
     ) -> list[can.message.Message]:
         return _encode_python_can_messages(self, nmea200_message)
 
+    def _encode_into(self, buffer: bytearray, nmea200_message: NMEA2000Message) -> None:
+        del buffer, nmea200_message
+        raise ValueError("python-can messages cannot be written to a buffer")
+
 
 def _compute_bst_checksum(data: bytes) -> int:
     """Compute BST zero-sum checksum: (256 - sum(data)) % 256."""
@@ -499,7 +552,15 @@ class Bst95Encoder(EncoderInterface[list[bytes]], EncoderBase):
         return result
 
 
-ENCODER_CLASSES: dict[N2KFormat, type[EncoderInterface[N2KEncoded]]] = {
+class EncoderClass(Protocol):
+    """Encoder class of an output format, created by create_encoder."""
+
+    def __call__(self, *, trusted: bool = ...) -> EncoderInterface[N2KEncoded]:
+        """Return an encoder; ``trusted`` skips the validation of field values."""
+        ...  # pylint: disable=unnecessary-ellipsis
+
+
+ENCODER_CLASSES: dict[N2KFormat, EncoderClass] = {
     N2KFormat.N2K_ASCII_RAW: N2kAsciiRawEncoder,
     N2KFormat.N2K_ASCII: N2kAsciiEncoder,
     N2KFormat.BASIC_STRING: BasicStringEncoder,
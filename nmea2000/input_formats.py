@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import re
+import sys
+from collections.abc import Callable
 from enum import StrEnum
-from typing import TypeAlias
+from typing import TYPE_CHECKING, TypeAlias, TypeGuard
 
-import can.message
+if TYPE_CHECKING:
+    import can.message
 
 
 class N2KFormat(StrEnum):
@@ -83,9 +86,20 @@ TEXT_FORMATS: frozenset[N2KFormat] = frozenset(
 )
 
 N2KInput: TypeAlias = (  # pylint: disable=invalid-name
-    str | bytes | bytearray | memoryview | can.message.Message
+    "str | bytes | bytearray | memoryview | can.message.Message"
 )
 
+
+def is_can_message(data: object) -> TypeGuard[can.message.Message]:
+    """Return whether ``data`` is a python-can Message, without importing python-can.
+
+    Only code that has already imported python-can can hold such a message, so
+    checking against the loaded module keeps offline decoding free of it.
+    """
+    can_message = sys.modules.get("can.message")
+    return can_message is not None and isinstance(data, can_message.Message)
+
+
 _N2K_ASCII_RE = re.compile(
     r"^A\d+\.\d+\s+[0-9A-Fa-f]{5}\s+[0-9A-Fa-f]{5,6}\s+[0-9A-Fa-f]+$"
 )
@@ -153,17 +167,23 @@ def _is_candump3(line: str) -> bool:
     return bool(_CANDUMP3_RE.match(line))
 
 
-def _is_usb(packet: bytes) -> bool:
-    return len(packet) == 20 and packet[:2] == b"\xaa\x55"
+def _is_usb(packet: bytes | bytearray | memoryview) -> bool:
+    return len(packet) == 20 and packet[0] == 0xAA and packet[1] == 0x55
 
 
-def _looks_like_usb(packet: bytes) -> bool:
-    return packet.startswith(b"\xaa\x55") or (
-        len(packet) >= 5 and packet[1:5] == b"\x55\x01\x02\x01"
+def _looks_like_usb(packet: bytes | bytearray | memoryview) -> bool:
+    if len(packet) < 2 or packet[1] != 0x55:
+        return False
+    # A packet whose 0xAA header byte was lost still starts with 55 01 02 01
+    return packet[0] == 0xAA or (
+        len(packet) >= 5
+        and packet[2] == 0x01
+        and packet[3] == 0x02
+        and packet[4] == 0x01
     )
 
 
-def _is_tcp(packet: bytes) -> bool:
+def _is_tcp(packet: bytes | bytearray | memoryview) -> bool:
     if _is_usb(packet) or len(packet) < 6:
         return False
 
@@ -174,7 +194,7 @@ def _is_tcp(packet: bytes) -> bool:
     return len(packet) == 5 + data_length
 
 
-def _is_bst_d0(packet: bytes) -> bool:
+def _is_bst_d0(packet: bytes | bytearray | memoryview) -> bool:
     if len(packet) < 14 or packet[0] != 0xD0:
         return False
     length = int.from_bytes(packet[1:3], byteorder="little")
@@ -182,7 +202,7 @@ def _is_bst_d0(packet: bytes) -> bool:
     return length >= 13 and len(packet) == length + 1
 
 
-def _is_bst_95(packet: bytes) -> bool:
+def _is_bst_95(packet: bytes | bytearray | memoryview) -> bool:
     if len(packet) < 8 or packet[0] != 0x95:
         return False
     length = packet[1]
@@ -190,47 +210,170 @@ def _is_bst_95(packet: bytes) -> bool:
     return length >= 6 and len(packet) == length + 3
 
 
+def _detect_text_format_sequential(line: str) -> N2KFormat:
+    """Try every text format in priority order; the fallback for unusual lines."""
+    if _is_n2k_ascii(line):
+        return N2KFormat.N2K_ASCII_RAW
+    if _is_basic_string(line):
+        return N2KFormat.BASIC_STRING
+    if _is_can_frame_ascii(line):
+        return N2KFormat.CAN_FRAME_ASCII
+    if _is_pcdin(line):
+        return N2KFormat.PCDIN
+    if _is_mxpgn(line):
+        return N2KFormat.MXPGN
+    if _is_pdgy(line):
+        return N2KFormat.PDGY
+    if _is_pdgy_debug(line):
+        return N2KFormat.PDGY_DEBUG
+    if _is_candump1(line):
+        return N2KFormat.CANDUMP1
+    if _is_candump2(line):
+        return N2KFormat.CANDUMP2
+    if _is_candump3(line):
+        return N2KFormat.CANDUMP3
+    raise ValueError(f"Parser not found for input: {line}")
+
+
+def _classify_text_line(line: str) -> tuple[re.Pattern[str] | None, N2KFormat | None]:
+    """Pick the single candidate format for a line from its first characters.
+
+    Returns the regex that must match to confirm the candidate, or ``None``
+    when the prefix alone is conclusive.
+    """
+    first = line[0]
+    if first in "$\\":
+        sentence = _get_0183_sentence(line)
+        if sentence.startswith("$PCDIN,"):
+            return None, N2KFormat.PCDIN
+        if sentence.startswith("$MXPGN,"):
+            return None, N2KFormat.MXPGN
+        if line.startswith("$PDGY,"):
+            return None, N2KFormat.PDGY_DEBUG
+        return None, None
+    if first == "!":
+        return None, (N2KFormat.PDGY if line.startswith("!PDGY,") else None)
+    if first == "<":
+        return _CANDUMP1_RE, N2KFormat.CANDUMP1
+    if first == "(":
+        return _CANDUMP3_RE, N2KFormat.CANDUMP3
+    if line[4:5] == "-":
+        return _BASIC_STRING_RE, N2KFormat.BASIC_STRING
+    if line[2:3] == ":":
+        return _CAN_FRAME_ASCII_RE, N2KFormat.CAN_FRAME_ASCII
+    if first == "A" and line[1:2].isdigit() and "." in line[:16]:
+        return _N2K_ASCII_RE, N2KFormat.N2K_ASCII_RAW
+    token_length = len(line.split(None, 1)[0])
+    if token_length == 5:
+        return _N2K_ASCII_RAW_RE, N2KFormat.N2K_ASCII_RAW
+    if token_length == 8:
+        return _CAN_FRAME_ASCII_RAW_RE, N2KFormat.CAN_FRAME_ASCII
+    return _CANDUMP2_RE, N2KFormat.CANDUMP2
+
+
+_HEX_DIGITS = frozenset("0123456789ABCDEFabcdef")
+
+
+def _is_hex(text: str) -> bool:
+    return _HEX_DIGITS.issuperset(text)
+
+
+def _starts_like_can_frame_ascii(line: str) -> bool:
+    return (line[2:3] == ":" and line[:2].isdigit()) or (
+        line[8:9] == " " and _is_hex(line[:8])
+    )
+
+
+def _starts_like_n2k_ascii(line: str) -> bool:
+    return (line[:1] == "A" and line[1:2].isdigit()) or (
+        line[5:6] == " " and _is_hex(line[:5])
+    )
+
+
+# Prefix-only checks used to keep routing a stream to the format it last used.
+# They never run a regex; a line that fails its check is fully re-detected.
+_TEXT_PREFIX_CHECKS: dict[N2KFormat, Callable[[str], bool]] = {
+    N2KFormat.PCDIN: lambda line: line.startswith("$PCDIN,"),
+    N2KFormat.MXPGN: lambda line: line.startswith("$MXPGN,"),
+    N2KFormat.PDGY: lambda line: line.startswith("!PDGY,"),
+    N2KFormat.PDGY_DEBUG: lambda line: line.startswith("$PDGY,"),
+    N2KFormat.CANDUMP1: lambda line: line.startswith("<0x"),
+    N2KFormat.CANDUMP3: lambda line: line.startswith("("),
+    N2KFormat.BASIC_STRING: lambda line: line[4:5] == "-" and line[:4].isdigit(),
+    N2KFormat.CAN_FRAME_ASCII: _starts_like_can_frame_ascii,
+    N2KFormat.N2K_ASCII_RAW: _starts_like_n2k_ascii,
+}
+
+_BINARY_PREFIX_CHECKS: dict[
+    N2KFormat, Callable[[bytes | bytearray | memoryview], bool]
+] = {
+    N2KFormat.WAVESHARE: _looks_like_usb,
+    N2KFormat.BST_D0: _is_bst_d0,
+    N2KFormat.BST_95: _is_bst_95,
+    N2KFormat.EBYTE: _is_tcp,
+}
+
+
+def looks_like_format(data: N2KInput, input_format: N2KFormat) -> bool:
+    """Cheaply check whether an input starts like ``input_format``.
+
+    A ``True`` result is a strong hint, not a validation: it only inspects
+    the first characters or header bytes. ``False`` means the input should
+    go through :func:`detect_format`.
+    """
+    if isinstance(data, str):
+        check = _TEXT_PREFIX_CHECKS.get(input_format)
+        return check is not None and check(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        binary_check = _BINARY_PREFIX_CHECKS.get(input_format)
+        return binary_check is not None and len(data) > 0 and binary_check(data)
+    return input_format == N2KFormat.PYTHON_CAN and is_can_message(data)
+
+
+def _ascii_line(packet: bytes | bytearray | memoryview) -> str | None:
+    """Return a bytes input as a stripped text line, or None if it is not ASCII."""
+    raw = packet.tobytes() if isinstance(packet, memoryview) else packet
+    if not raw.isascii():
+        return None
+    return raw.decode("ascii").strip()
+
+
 def detect_format(data: N2KInput) -> N2KFormat:
     """Infer the NMEA 2000 wire format from one text, binary, or python-can input."""
-    if isinstance(data, can.message.Message):
+    if is_can_message(data):
         return N2KFormat.PYTHON_CAN
 
     if isinstance(data, str):
         line = data.strip()
         if not line:
             raise ValueError("Input must contain a non-empty string")
-        if _is_n2k_ascii(line):
-            return N2KFormat.N2K_ASCII_RAW
-        if _is_basic_string(line):
-            return N2KFormat.BASIC_STRING
-        if _is_can_frame_ascii(line):
-            return N2KFormat.CAN_FRAME_ASCII
-        if _is_pcdin(line):
-            return N2KFormat.PCDIN
-        if _is_mxpgn(line):
-            return N2KFormat.MXPGN
-        if _is_pdgy(line):
-            return N2KFormat.PDGY
-        if _is_pdgy_debug(line):
-            return N2KFormat.PDGY_DEBUG
-        if _is_candump1(line):
-            return N2KFormat.CANDUMP1
-        if _is_candump2(line):
-            return N2KFormat.CANDUMP2
-        if _is_candump3(line):
-            return N2KFormat.CANDUMP3
-        raise ValueError(f"Parser not found for input: {line}")
+        pattern, candidate = _classify_text_line(line)
+        if candidate is not None and (pattern is None or pattern.match(line)):
+            return candidate
+        return _detect_text_format_sequential(line)
 
     if isinstance(data, (bytes, bytearray, memoryview)):
-        packet = bytes(data)
+        packet = data
+        if len(packet) == 0:
+            raise ValueError("Parser not found for empty binary input")
+        # Text lines read as bytes; only a confirmed text format wins over
+        # the binary checks
+        line = _ascii_line(packet)
+        if line:
+            pattern, candidate = _classify_text_line(line)
+            if candidate is not None and (pattern is None or pattern.match(line)):
+                return candidate
         if _looks_like_usb(packet):
             return N2KFormat.WAVESHARE
-        if _is_bst_d0(packet):
+        first = packet[0]
+        if first == 0xD0 and _is_bst_d0(packet):
             return N2KFormat.BST_D0
-        if _is_bst_95(packet):
+        if first == 0x95 and _is_bst_95(packet):
             return N2KFormat.BST_95
         if _is_tcp(packet):
             return N2KFormat.EBYTE
+        if line:
+            return _detect_text_format_sequential(line)
         raise ValueError(f"Parser not found for binary input: {packet.hex()}")
 
     raise ValueError(
@@ -238,4 +381,10 @@ def detect_format(data: N2KInput) -> N2KFormat:
     )
 
 
-__all__ = ["TEXT_FORMATS", "N2KFormat", "N2KInput", "detect_format"]
+__all__ = [
+    "TEXT_FORMATS",
+    "N2KFormat",
+    "N2KInput",
+    "detect_format",
+    "looks_like_format",
+]
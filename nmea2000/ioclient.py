@@ -1,12 +1,16 @@
 """Async transport clients for TCP, serial, and python-can NMEA 2000 gateways."""
 
 import asyncio
+import json
 import logging
+import os
 import socket
 from abc import ABC, abstractmethod
 from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
 from enum import Enum
-from typing import ClassVar
+from pathlib import Path
+from typing import Any, ClassVar
 
 import can.cli
 import can.interface
@@ -18,7 +22,7 @@ from tenacity.asyncio import AsyncRetrying
 from .consts import PhysicalQuantities
 from .decoder import InvalidFrameError, NMEA2000Decoder
 from .encoder import EncoderInterface, N2KEncoded, create_encoder
-from .input_formats import TEXT_FORMATS, N2KFormat
+from .input_formats import TEXT_FORMATS, N2KFormat, N2KInput
 from .message import NMEA2000Message
 from .utils import calculate_canbus_checksum
 
@@ -72,6 +76,125 @@ class State(Enum):
     CLOSED = 2
 
 
+# Largest run of received bytes that may hold no complete frame, as for
+# StreamReader.readline
+_RECEIVE_BUFFER_SIZE = 64 * 1024
+# Batches of frames that may wait for the decode executor before reading pauses
+_DECODE_QUEUE_BATCHES = 4
+
+
+class _FramedStreamProtocol(asyncio.BufferedProtocol):
+    """TCP stream protocol that splits received data into frames in batches.
+
+    The event loop reads into the free tail of one preallocated buffer. After
+    each read, every complete frame is copied out of the buffer in one pass
+    and the frames are handed on as one batch; only the bytes of an
+    incomplete frame are moved to the front of the buffer. The protocol also
+    acts as the client's stream writer.
+    """
+
+    def __init__(
+        self,
+        split_frames: Callable[[bytearray, int], tuple[list[N2KInput], int]],
+        handle_frames: Callable[[list[N2KInput]], None],
+    ):
+        self._split_frames = split_frames
+        self._handle_frames = handle_frames
+        self._buffer = bytearray(_RECEIVE_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._length = 0
+        self._transport: asyncio.Transport | None = None
+        self._loop = asyncio.get_running_loop()
+        self._closed: asyncio.Future[Exception] = self._loop.create_future()
+        self._write_paused = False
+        self._drain_waiter: asyncio.Future[None] | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        del sizehint
+        return self._view[self._length :]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        length = self._length + nbytes
+        self._length = length
+        try:
+            frames, consumed = self._split_frames(self._buffer, length)
+            remaining = length - consumed
+            if remaining == len(self._buffer):
+                raise ValueError(
+                    f"No complete frame in {remaining} received bytes; "
+                    "is the gateway format correct?"
+                )
+            if consumed:
+                self._buffer[:remaining] = self._buffer[consumed:length]
+                self._length = remaining
+            if frames:
+                self._handle_frames(frames)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self._set_closed(exc)
+            assert self._transport is not None
+            self._transport.abort()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._set_closed(exc or ConnectionError("Connection closed by remote host"))
+        self.resume_writing()
+
+    def pause_reading(self) -> None:
+        """Stop reading from the transport until ``resume_reading``."""
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.pause_reading()
+
+    def resume_reading(self) -> None:
+        """Resume reading from the transport."""
+        if self._transport is not None and not self._transport.is_closing():
+            self._transport.resume_reading()
+
+    def pause_writing(self) -> None:
+        self._write_paused = True
+
+    def resume_writing(self) -> None:
+        self._write_paused = False
+        waiter = self._drain_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _set_closed(self, exc: Exception) -> None:
+        if not self._closed.done():
+            self._closed.set_result(exc)
+
+    def write(self, data: bytes) -> None:
+        """Write data to the transport, like ``StreamWriter.write``."""
+        assert self._transport is not None
+        self._transport.write(data)
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer has room again."""
+        if self._closed.done():
+            raise ConnectionResetError("Connection lost")
+        if self._write_paused:
+            self._drain_waiter = self._loop.create_future()
+            await self._drain_waiter
+            if self._closed.done():
+                raise ConnectionResetError("Connection lost")
+
+    def close(self) -> None:
+        """Close the transport."""
+        if self._transport is not None:
+            self._transport.close()
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        """Return transport information, like ``StreamWriter.get_extra_info``."""
+        assert self._transport is not None
+        return self._transport.get_extra_info(name, default)
+
+    async def wait_closed(self) -> Exception:
+        """Wait until the connection ends and return the error that ended it."""
+        return await asyncio.shield(self._closed)
+
+
 class AsyncIOClient(ABC):
     """Base class for asynchronous NMEA2000 clients.
 
@@ -125,19 +248,45 @@ class AsyncIOClient(ABC):
         build_network_map: bool,
         seed_network_map: bool,
         bound_format: N2KFormat | None = None,
+        decoder_options: dict[str, Any] | None = None,
+        decode_executor: Executor | None = None,
+        decode_batch_size: int = 64,
+        state_file: str | None = None,
+        state_save_interval: float = 60.0,
     ):
         """Initialize the AsyncIOClient.
 
         Args:
             exclude_pgns: List of PGNs to exclude from processing.
             include_pgns: List of PGNs to include for processing.
+            decoder_options: Extra keyword arguments for the NMEA2000Decoder,
+                e.g. ``{"on_change": True}``.
+            decode_executor: Optional thread pool that decodes received frames
+                off the event loop. Messages are still delivered in order. One
+                batch decodes at a time, so a single worker is enough; the
+                executor keeps decoding off the loop, it does not add
+                parallelism.
+            decode_batch_size: Maximum number of frames handed to the executor
+                in one call. At most a few batches of frames wait for it;
+                beyond that, reading from the gateway pauses.
+            state_file: Optional JSON file holding a decoder snapshot. It is
+                restored on start, saved every ``state_save_interval`` seconds
+                and on close, so restarts keep the network map.
+            state_save_interval: Seconds between periodic state saves.
         """
+        if isinstance(decode_executor, ProcessPoolExecutor):
+            raise ValueError(
+                "decode_executor must run in this process; the decoder keeps "
+                "fast-packet and network-map state that cannot be shared with a process pool"
+            )
+        if decode_batch_size < 1:
+            raise ValueError("decode_batch_size must be at least 1")
         self._state = State.DISCONNECTED
         self.seed_network_map = seed_network_map
         if not build_network_map:
             self.seed_network_map = False
         self.reader = None
-        self.writer: asyncio.StreamWriter | None = None
+        self.writer: asyncio.StreamWriter | _FramedStreamProtocol | None = None
         self.receive_callback = None
         self.status_callback = None
         self.queue = asyncio.Queue()
@@ -151,6 +300,7 @@ class AsyncIOClient(ABC):
             dump_to_file=dump_to_file,
             dump_pgns=dump_pgns,
             build_network_map=build_network_map,
+            **(decoder_options or {}),
         )
         self.lock = asyncio.Lock()
 
@@ -162,6 +312,33 @@ class AsyncIOClient(ABC):
         )  # Track the process queue task
         self._receive_task = None  # Track the receive loop task
 
+        self.decode_executor = decode_executor
+        self.decode_batch_size = decode_batch_size
+        self._frame_queue: asyncio.Queue[N2KInput] = asyncio.Queue()
+        self._frame_queue_limit = decode_batch_size * _DECODE_QUEUE_BATCHES
+        self._frame_queue_has_room = asyncio.Event()
+        self._frame_queue_has_room.set()
+        self._decode_task = None
+        if decode_executor is not None:
+            self._decode_task = asyncio.create_task(self._decode_frames())
+
+        # Keep-latest rate limiting holds messages until their window ends
+        self._rate_limit_flush_task = None
+        rate_limits = (decoder_options or {}).get("rate_limits")
+        if rate_limits and (decoder_options or {}).get("rate_limit_keep_latest"):
+            self._rate_limit_flush_task = asyncio.create_task(
+                self._flush_rate_limited_periodically(1 / max(rate_limits.values()))
+            )
+
+        self.state_file = state_file
+        self.state_save_interval = state_save_interval
+        self._state_save_task = None
+        if state_file is not None:
+            self._load_decoder_state()
+            self._state_save_task = asyncio.create_task(
+                self._save_decoder_state_periodically()
+            )
+
     def set_status_callback(self, callback: Callable[[State], Awaitable[None]] | None):
         """Registers a callback to be executed when the connection status changes.
 
@@ -336,6 +513,14 @@ class AsyncIOClient(ABC):
         This method closes the connection and sets the state to CLOSED.
         After calling this method, the client cannot be reconnected.
         """
+        if self._rate_limit_flush_task and not self._rate_limit_flush_task.done():
+            self._rate_limit_flush_task.cancel()
+            # Deliver the messages rate limiting still holds before stopping
+            self._queue_rate_limited(force=True)
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=1)
+            except TimeoutError:
+                self.logger.warning("Closing before all held messages were delivered")
         await self._update_state(State.CLOSED)
         if self.writer:
             self.writer.close()
@@ -343,12 +528,150 @@ class AsyncIOClient(ABC):
         if self._receive_task and not self._receive_task.done():
             self._receive_task.cancel()
             await asyncio.sleep(0.01)  # Allow cancellation to propagate
+        # Cancel the executor decode task if it exists
+        if self._decode_task and not self._decode_task.done():
+            self._decode_task.cancel()
+            await asyncio.sleep(0.01)  # Allow cancellation to propagate
         # Cancel the process queue task if it exists
         if self._process_queue_task and not self._process_queue_task.done():
             self._process_queue_task.cancel()
             await asyncio.sleep(0.01)  # Allow cancellation to propagate
+        # Stop periodic state saves and persist the final decoder state
+        if self._state_save_task and not self._state_save_task.done():
+            self._state_save_task.cancel()
+        if self.state_file is not None:
+            self._save_decoder_state()
         self.logger.info("Connection closed.")
 
+    def _load_decoder_state(self):
+        """Restore the decoder snapshot from the state file, if there is one."""
+        assert self.state_file is not None
+        path = Path(self.state_file)
+        if not path.exists():
+            return
+        try:
+            self.decoder.restore(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError) as exc:
+            self.logger.warning(
+                "Failed to restore decoder state from %s: %s", path, exc
+            )
+
+    def _save_decoder_state(self):
+        """Write the decoder snapshot to the state file atomically."""
+        assert self.state_file is not None
+        path = Path(self.state_file)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + ".tmp")
+            tmp_path.write_text(json.dumps(self.decoder.snapshot()), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            self.logger.warning("Failed to save decoder state to %s: %s", path, exc)
+
+    async def _save_decoder_state_periodically(self):
+        while self._state != State.CLOSED:
+            await asyncio.sleep(self.state_save_interval)
+            await asyncio.to_thread(self._save_decoder_state)
+
+    def _queue_rate_limited(self, force: bool = False):
+        """Queue the messages keep-latest rate limiting held past their window."""
+        for message in self.decoder.flush_rate_limited(force, live=True):
+            self.queue.put_nowait(message)
+
+    async def _flush_rate_limited_periodically(self, interval: float):
+        while self._state != State.CLOSED:
+            await asyncio.sleep(interval)
+            self._queue_rate_limited()
+
+    def _decode_frame(self, data: N2KInput) -> NMEA2000Message | None:
+        """Decode one received frame, logging and swallowing decode errors."""
+        try:
+            return self.decoder.decode(data)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self.logger.warning(
+                "decoding failed. data: %s. Error: %s",
+                data.hex() if isinstance(data, (bytes, bytearray)) else data,
+                e,
+                exc_info=True,
+            )
+            return None
+
+    def _decode_batch(self, frames: list[N2KInput]) -> list[NMEA2000Message]:
+        """Decode a batch of frames in order; runs on the decode executor."""
+        messages = []
+        for frame in frames:
+            message = self._decode_frame(frame)
+            if message is not None:
+                messages.append(message)
+        return messages
+
+    async def _handle_frame(self, data: N2KInput):
+        """Decode a received frame inline, or hand it to the decode executor."""
+        if self.decode_executor is not None:
+            await self._frame_queue_has_room.wait()
+            self._queue_frames([data])
+            return
+
+        message = self._decode_frame(data)
+        self.logger.debug("Received message: %s", message)
+        if message is not None:
+            await self.queue.put(message)
+
+    def _handle_frames(self, frames: list[N2KInput]):
+        """Decode a batch of frames inline, or hand them to the decode executor.
+
+        Protocol callbacks call this directly, so nothing here awaits.
+        """
+        if self.decode_executor is not None:
+            self._queue_frames(frames)
+            return
+
+        for message in self._decode_batch(frames):
+            self.queue.put_nowait(message)
+
+    def _queue_frames(self, frames: list[N2KInput]):
+        """Queue frames for the decode executor, pausing reading when full."""
+        for frame in frames:
+            self._frame_queue.put_nowait(frame)
+        if self._frame_queue.qsize() >= self._frame_queue_limit:
+            self._frame_queue_has_room.clear()
+            self._pause_reading()
+
+    def _pause_reading(self):
+        """Stop reading from the gateway while the frame queue is full.
+
+        Clients whose receive loop awaits ``_handle_frame`` are already held
+        back by it; protocol based clients override this.
+        """
+
+    def _resume_reading(self):
+        """Resume reading from the gateway once the frame queue has room."""
+
+    async def _decode_frames(self):
+        """Decode queued frames on the executor in batches.
+
+        A single task submits one batch at a time, so the decoder's reassembly
+        state has one owner and messages reach the queue in arrival order.
+        Frames received while a batch is decoding form the next batch. Only
+        decoding moves off the loop; batches never decode in parallel.
+        """
+        loop = asyncio.get_running_loop()
+        while self._state != State.CLOSED:
+            batch = [await self._frame_queue.get()]
+            while len(batch) < self.decode_batch_size and not self._frame_queue.empty():
+                batch.append(self._frame_queue.get_nowait())
+            if (
+                not self._frame_queue_has_room.is_set()
+                and self._frame_queue.qsize() < self._frame_queue_limit
+            ):
+                self._frame_queue_has_room.set()
+                self._resume_reading()
+            messages = await loop.run_in_executor(
+                self.decode_executor, self._decode_batch, batch
+            )
+            for message in messages:
+                await self.queue.put(message)
+
     async def _process_queue(self):
         """Process received messages in order.
 
@@ -393,7 +716,76 @@ class AsyncIOClient(ABC):
         await self.close()
 
 
-class EByteNmea2000Gateway(AsyncIOClient):
+class _FramedTcpGateway(AsyncIOClient):
+    """Base class of the TCP gateway clients, reading through a protocol.
+
+    Subclasses set ``host`` and ``port`` and implement ``_split_frames`` for
+    their wire framing. Received frames are decoded in batches by the
+    protocol callbacks, so ``_receive_impl`` only waits for the connection to
+    end.
+    """
+
+    host: str
+    port: int
+    _protocol: _FramedStreamProtocol | None = None
+
+    @abstractmethod
+    def _split_frames(
+        self, buffer: bytearray, length: int
+    ) -> tuple[list[N2KInput], int]:
+        """Copy the complete frames out of the first ``length`` received bytes.
+
+        ``buffer`` is the protocol's receive buffer, which is reused for the
+        next read, so frames must not share it. Returns the frames and the
+        number of bytes they used; the remaining bytes are kept until more
+        data arrives.
+        """
+
+    def _receive_frames(self, frames: list[N2KInput]):
+        self.logger.debug("Received %d frames", len(frames))
+        self._handle_frames(frames)
+
+    def _pause_reading(self):
+        if self._protocol is not None:
+            self._protocol.pause_reading()
+
+    def _resume_reading(self):
+        if self._protocol is not None:
+            self._protocol.resume_reading()
+
+    async def _connect_impl(self):
+        """Connect to the TCP server.
+
+        This method establishes a TCP connection to the server and configures
+        TCP keepalive to detect dropped connections. It's called by the
+        connect() method.
+        """
+        self.logger.info("Connecting to %s:%s", self.host, self.port)
+        _transport, protocol = await asyncio.get_running_loop().create_connection(
+            lambda: _FramedStreamProtocol(self._split_frames, self._receive_frames),
+            self.host,
+            self.port,
+        )
+        self._protocol = self.writer = protocol
+        if not self._frame_queue_has_room.is_set():
+            protocol.pause_reading()
+        # Get the underlying socket
+        sock = protocol.get_extra_info("socket")
+        if sock:
+            _configure_tcp_keepalive(sock)
+        self.logger.info("Connected to %s:%s", self.host, self.port)
+
+    async def _receive_impl(self):
+        """Wait while the protocol receives frames, then raise why it stopped."""
+        assert self._protocol is not None
+        raise await self._protocol.wait_closed()
+
+
+class _GatewayBusyError(ConnectionError):
+    """The gateway refused the connection because it has too many clients."""
+
+
+class EByteNmea2000Gateway(_FramedTcpGateway):
     """TCP implementation of AsyncIOClient for NMEA2000 gateways.
 
     This class implements a TCP client for connecting to NMEA2000 networks
@@ -413,6 +805,11 @@ class EByteNmea2000Gateway(AsyncIOClient):
         dump_to_file: str | None = None,
         dump_pgns: list[int | str] | None = None,
         build_network_map: bool = False,
+        decoder_options: dict[str, Any] | None = None,
+        decode_executor: Executor | None = None,
+        decode_batch_size: int = 64,
+        state_file: str | None = None,
+        state_save_interval: float = 60.0,
     ):
         """Initialize a TCP NMEA2000 gateway client.
 
@@ -433,55 +830,40 @@ class EByteNmea2000Gateway(AsyncIOClient):
             build_network_map=build_network_map,
             seed_network_map=True,
             bound_format=N2KFormat.EBYTE,
+            decoder_options=decoder_options,
+            decode_executor=decode_executor,
+            decode_batch_size=decode_batch_size,
+            state_file=state_file,
+            state_save_interval=state_save_interval,
         )
         self.host = host
         self.port = port
         self.encoder = create_encoder(N2KFormat.EBYTE)
         self.lock = asyncio.Lock()
 
-    async def _connect_impl(self):
-        """Connect to the TCP server.
-
-        This method establishes a TCP connection to the server and configures
-        TCP keepalive to detect dropped connections. It's called by the
-        connect() method.
-        """
-        self.logger.info("Connecting to %s:%s", self.host, self.port)
-        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
-        # Get the underlying socket
-        sock = self.writer.get_extra_info("socket")
-        if sock:
-            _configure_tcp_keepalive(sock)
-        self.logger.info("Connected to %s:%s", self.host, self.port)
+    def _split_frames(
+        self, buffer: bytearray, length: int
+    ) -> tuple[list[N2KInput], int]:
+        """Split the received data into 13 byte CAN frames."""
+        end = length - length % 13
+        view = memoryview(buffer)
+        frames: list[N2KInput] = [view[i : i + 13].tobytes() for i in range(0, end, 13)]
+        if b"Sorry,Limited" in frames:  # cant handle more TCP connections
+            raise _GatewayBusyError("Gateway busy. reconnecting.")
+        return frames, end
 
     async def _receive_impl(self):
-        """Receive data from the TCP connection.
+        """Receive CAN frames until the connection ends.
 
-        This method reads exactly 13 bytes from the TCP connection (the size of
-        a standard NMEA2000 message) and processes it. It's called repeatedly
-        by the _receive_loop() method.
+        When the gateway has no room for another TCP connection, wait 30
+        seconds before reconnecting.
         """
-        data = await self.reader.readexactly(13)
-        self.logger.debug("Received: %s", data.hex())
-        if data == b"Sorry,Limited":  # cant handle more TCP connections
+        try:
+            await super()._receive_impl()
+        except _GatewayBusyError:
             self.logger.error("Sorry, Limited. sleeping for 30 seconds")
             await asyncio.sleep(30)
-            raise ConnectionError("Gateway busy. reconnecting.")
-        try:
-            message = self.decoder.decode(data)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.warning(
-                "decoding failed. text: %s, bytes: %s. Error: %s",
-                data,
-                data.hex(),
-                e,
-                exc_info=True,
-            )
-            return
-
-        self.logger.debug("Received message: %s", message)
-        if message is not None:
-            await self.queue.put(message)
+            raise
 
     def _encode_impl(self, message: NMEA2000Message) -> list[bytes]:
         """Encode a NMEA2000 message over the TCP connection.
@@ -492,7 +874,7 @@ class EByteNmea2000Gateway(AsyncIOClient):
         return self.encoder.encode(message)
 
 
-class TextNmea2000Gateway(AsyncIOClient):
+class TextNmea2000Gateway(_FramedTcpGateway):
     """TCP client for text/line-based NMEA 2000 gateways.
 
     Connects to any gateway that sends line-delimited ASCII frames over TCP
@@ -517,6 +899,11 @@ class TextNmea2000Gateway(AsyncIOClient):
         dump_pgns: list[int | str] | None = None,
         build_network_map: bool = False,
         seed_network_map: bool = True,
+        decoder_options: dict[str, Any] | None = None,
+        decode_executor: Executor | None = None,
+        decode_batch_size: int = 64,
+        state_file: str | None = None,
+        state_save_interval: float = 60.0,
     ):
         """Initialize a TCP NMEA2000 gateway client.
 
@@ -551,6 +938,11 @@ class TextNmea2000Gateway(AsyncIOClient):
             build_network_map=build_network_map,
             seed_network_map=seed_network_map,
             bound_format=output_format,
+            decoder_options=decoder_options,
+            decode_executor=decode_executor,
+            decode_batch_size=decode_batch_size,
+            state_file=state_file,
+            state_save_interval=state_save_interval,
         )
         self.host = host
         self.port = port
@@ -560,37 +952,21 @@ class TextNmea2000Gateway(AsyncIOClient):
         )
         self.lock = asyncio.Lock()
 
-    async def _connect_impl(self):
-        """Connect to the TCP server."""
-        self.logger.info("Connecting to %s:%s", self.host, self.port)
-        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
-        sock = self.writer.get_extra_info("socket")
-        if sock:
-            _configure_tcp_keepalive(sock)
-        self.logger.info("Connected to %s:%s", self.host, self.port)
-
-    async def _receive_impl(self):
-        """Receive a single text line from the TCP connection and decode it."""
-        data = await self.reader.readline()
-        if not data:
-            raise ConnectionError("Connection closed by remote host")
-        self.logger.debug("Received: %s", data.hex())
-        line = data.decode("utf-8", errors="ignore").strip()
-        try:
-            message = self.decoder.decode(line)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.warning(
-                "decoding failed. text: %s, bytes: %s. Error: %s",
-                line,
-                data.hex(),
-                e,
-                exc_info=True,
-            )
-            return
-
-        self.logger.debug("Received message: %s", message)
-        if message is not None:
-            await self.queue.put(message)
+    def _split_frames(
+        self, buffer: bytearray, length: int
+    ) -> tuple[list[N2KInput], int]:
+        """Split the received data into text lines, skipping blank ones."""
+        # Lines stay bytes; the decoder detects text read as bytes and
+        # rejects lines that are not ASCII
+        view = memoryview(buffer)
+        frames: list[N2KInput] = []
+        start = 0
+        while (newline := buffer.find(b"\n", start, length)) >= 0:
+            line = view[start:newline].tobytes()
+            start = newline + 1
+            if line.strip():
+                frames.append(line)
+        return frames, start
 
     def _encode_impl(self, message: NMEA2000Message) -> list[bytes]:
         """Encode a NMEA2000 message using the bound format."""
@@ -632,6 +1008,11 @@ class WaveShareNmea2000Gateway(AsyncIOClient):
         dump_to_file: str | None = None,
         dump_pgns: list[int | str] | None = None,
         build_network_map: bool = False,
+        decoder_options: dict[str, Any] | None = None,
+        decode_executor: Executor | None = None,
+        decode_batch_size: int = 64,
+        state_file: str | None = None,
+        state_save_interval: float = 60.0,
     ):
         """Initialize a USB/Serial NMEA2000 gateway client.
 
@@ -651,6 +1032,11 @@ class WaveShareNmea2000Gateway(AsyncIOClient):
             build_network_map=build_network_map,
             seed_network_map=True,
             bound_format=N2KFormat.WAVESHARE,
+            decoder_options=decoder_options,
+            decode_executor=decode_executor,
+            decode_batch_size=decode_batch_size,
+            state_file=state_file,
+            state_save_interval=state_save_interval,
         )
         self.port = port
         self.encoder = create_encoder(N2KFormat.WAVESHARE)
@@ -732,9 +1118,20 @@ class WaveShareNmea2000Gateway(AsyncIOClient):
                 # Not enough data for a full packet yet
                 break
 
-            # Extract the complete packet, including the end delimiter
-            packet = self._buffer[start : start + 20]
-            self.logger.debug("single packet: %s", packet.hex())
+            # View the complete packet; it is only copied if it has to be queued
+            packet = memoryview(self._buffer)[start : start + 20]
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("single packet: %s", packet.hex())
+
+            if self.decode_executor is not None:
+                # Validate inline so a false aa55 marker still triggers a resync
+                if calculate_canbus_checksum(packet) != packet[19]:
+                    self.logger.debug("Invalid frame checksum, resyncing")
+                    self._buffer = self._buffer[start + 2 :]
+                    continue
+                await self._handle_frame(bytes(packet))
+                self._buffer = self._buffer[start + 20 :]
+                continue
 
             # Process the packet
             message = None
@@ -791,6 +1188,11 @@ class PythonCanAsyncIOClient(AsyncIOClient):
         send_timeout: float = 0.1,
         send_retry_count: int = 3,
         send_retry_delay: float = 0.05,
+        decoder_options: dict[str, Any] | None = None,
+        decode_executor: Executor | None = None,
+        decode_batch_size: int = 64,
+        state_file: str | None = None,
+        state_save_interval: float = 60.0,
         **kwargs,
     ):
         """Initialize a python-can NMEA2000 client.
@@ -811,6 +1213,11 @@ class PythonCanAsyncIOClient(AsyncIOClient):
             build_network_map=build_network_map,
             seed_network_map=True,
             bound_format=N2KFormat.PYTHON_CAN,
+            decoder_options=decoder_options,
+            decode_executor=decode_executor,
+            decode_batch_size=decode_batch_size,
+            state_file=state_file,
+            state_save_interval=state_save_interval,
         )
         self.interface = interface
         self.channel = channel
@@ -840,17 +1247,7 @@ class PythonCanAsyncIOClient(AsyncIOClient):
             return
 
         self.logger.debug("Received: %s", msg)
-        try:
-            decoded_frame = self.decoder.decode(msg)
-        except Exception as e:  # pylint: disable=broad-exception-caught
-            self.logger.warning(
-                "decoding failed. message: %s. Error: %s", msg, e, exc_info=True
-            )
-            return
-
-        self.logger.debug("Received message: %s", decoded_frame)
-        if decoded_frame is not None:
-            await self.queue.put(decoded_frame)
+        await self._handle_frame(msg)
 
     def _encode_impl(self, message: NMEA2000Message) -> list[can.message.Message]:
         """Encode a NMEA2000 message for python-can device."""
@@ -910,51 +1307,53 @@ class PythonCanAsyncIOClient(AsyncIOClient):
 _DLE = 0x10
 _STX = 0x02
 _ETX = 0x03
+_DLE_BYTE = bytes([_DLE])
+_DLE_STX = bytes([_DLE, _STX])
 
 
-def bdtp_unwrap(buffer: bytearray) -> tuple[bytes | None, int]:
+def bdtp_unwrap(
+    buffer: bytes | bytearray, start: int = 0, end: int | None = None
+) -> tuple[bytearray | None, int]:
     """Extract one BDTP frame from a byte buffer.
 
     Returns ``(payload, consumed)`` where *payload* is the un-escaped data
     block (or ``None`` if no complete frame is available yet) and *consumed*
-    is the number of bytes to discard from the front of *buffer*.
+    is the number of bytes to discard from the front of *buffer*. The payload
+    is a new buffer that is not shared with *buffer*. Scanning begins at
+    *start*, whose bytes before it count as consumed, and stops at *end*,
+    the length of the received data in *buffer*.
     """
+    if end is None:
+        end = len(buffer)
     # Find DLE STX
-    start = -1
-    for i in range(len(buffer) - 1):
-        if buffer[i] == _DLE and buffer[i + 1] == _STX:
-            start = i
-            break
-    if start == -1:
+    frame_start = buffer.find(_DLE_STX, start, end)
+    if frame_start == -1:
         # No frame start found; discard everything except possibly a trailing DLE
-        return None, max(0, len(buffer) - 1)
+        return None, max(start, end - 1)
 
     # Scan for DLE ETX while un-escaping DLE DLE
     result = bytearray()
-    i = start + 2  # skip past DLE STX
-    while i < len(buffer):
-        if buffer[i] == _DLE:
-            if i + 1 >= len(buffer):
-                # Need more data to decide
-                return None, start
-            if buffer[i + 1] == _ETX:
-                # End of frame
-                return bytes(result), i + 2
-            if buffer[i + 1] == _DLE:
-                # Escaped DLE
-                result.append(_DLE)
-                i += 2
-                continue
-            if buffer[i + 1] == _STX:
-                # Unexpected new frame start — discard current and restart
-                return None, i
-            # Unknown DLE escape — discard frame
-            return None, i + 2
-        result.append(buffer[i])
-        i += 1
-
-    # Incomplete frame — need more data
-    return None, start
+    i = frame_start + 2  # skip past DLE STX
+    while True:
+        dle = buffer.find(_DLE_BYTE, i, end)
+        if dle == -1 or dle + 1 >= end:
+            # Incomplete frame — need more data
+            return None, frame_start
+        result += buffer[i:dle]
+        following = buffer[dle + 1]
+        if following == _ETX:
+            # End of frame
+            return result, dle + 2
+        if following == _DLE:
+            # Escaped DLE
+            result.append(_DLE)
+            i = dle + 2
+            continue
+        if following == _STX:
+            # Unexpected new frame start — discard current and restart
+            return None, dle
+        # Unknown DLE escape — discard frame
+        return None, dle + 2
 
 
 def bdtp_wrap(data: bytes) -> bytes:
@@ -967,7 +1366,7 @@ def bdtp_wrap(data: bytes) -> bytes:
     return bytes([_DLE, _STX]) + bytes(escaped) + bytes([_DLE, _ETX])
 
 
-class ActisenseBstNmea2000Gateway(AsyncIOClient):
+class ActisenseBstNmea2000Gateway(_FramedTcpGateway):
     """TCP client for Actisense devices using BST protocol over BDTP framing.
 
     Supports both BST D0 (pre-assembled N2K messages) and BST 95 (raw CAN
@@ -991,6 +1390,11 @@ class ActisenseBstNmea2000Gateway(AsyncIOClient):
         dump_to_file: str | None = None,
         dump_pgns: list[int | str] | None = None,
         build_network_map: bool = False,
+        decoder_options: dict[str, Any] | None = None,
+        decode_executor: Executor | None = None,
+        decode_batch_size: int = 64,
+        state_file: str | None = None,
+        state_save_interval: float = 60.0,
     ):
         super().__init__(
             exclude_pgns=exclude_pgns,
@@ -1003,35 +1407,32 @@ class ActisenseBstNmea2000Gateway(AsyncIOClient):
             build_network_map=build_network_map,
             seed_network_map=True,
             bound_format=None,
+            # Gateways interleave reassembled D0 and raw-frame 95 messages
+            decoder_options={"mixed_formats": True, **(decoder_options or {})},
+            decode_executor=decode_executor,
+            decode_batch_size=decode_batch_size,
+            state_file=state_file,
+            state_save_interval=state_save_interval,
         )
         self.host = host
         self.port = port
         self.encoder = create_encoder(N2KFormat.BST_95)
-        self._buffer: bytearray | None = None
-
-    async def _connect_impl(self):
-        self.logger.info("Connecting to %s:%s (BST/BDTP)", self.host, self.port)
-        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
-        sock = self.writer.get_extra_info("socket")
-        if sock:
-            _configure_tcp_keepalive(sock)
-        self._buffer = bytearray()
-        self.logger.info("Connected to %s:%s", self.host, self.port)
-
-    async def _receive_impl(self):
-        data = await self.reader.read(4096)
-        if not data:
-            raise ConnectionError("Connection closed by remote host")
-        self.logger.debug("Received %d bytes: %s", len(data), data.hex())
-        assert self._buffer is not None
-        self._buffer.extend(data)
 
+    def _split_frames(
+        self, buffer: bytearray, length: int
+    ) -> tuple[list[N2KInput], int]:
+        """Unwrap every complete BDTP frame holding a supported BST message."""
+        frames: list[N2KInput] = []
+        consumed = 0
         while True:
-            payload, consumed = bdtp_unwrap(self._buffer)
+            payload, end = bdtp_unwrap(buffer, consumed, length)
             if payload is None:
-                self._buffer = self._buffer[consumed:]
-                break
-            self._buffer = self._buffer[consumed:]
+                if end == consumed:
+                    return frames, consumed
+                # Skipped bytes that do not start a frame
+                consumed = end
+                continue
+            consumed = end
 
             if not payload or payload[0] not in self._SUPPORTED_BST_CMDS:
                 self.logger.debug(
@@ -1040,16 +1441,7 @@ class ActisenseBstNmea2000Gateway(AsyncIOClient):
                 )
                 continue
 
-            try:
-                message = self.decoder.decode(payload)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                self.logger.warning(
-                    "BST decode failed: %s. Data: %s", e, payload.hex(), exc_info=True
-                )
-                continue
-
-            if message is not None:
-                await self.queue.put(message)
+            frames.append(payload)
 
     def _encode_impl(self, message: NMEA2000Message) -> list[bytes]:
         bst_packets = self.encoder.encode(message)
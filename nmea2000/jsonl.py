@@ -0,0 +1,103 @@
+"""Read and write NMEA2000Message streams as JSON lines, one message per line.
+
+This is the format of decoder dump files (``dump_to_file``). Files are read
+through a large buffer and written in batches, and fields are rebuilt with the
+metadata of the PGN's generated field specs, so replaying a long dump does not
+allocate the names, units and types of every field again.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Iterable, Iterator
+from typing import IO
+
+import orjson
+
+from .message import NMEA2000Message, _message_from_json_dict
+
+READ_BUFFER_SIZE = 1 << 20
+# Messages serialized before each write
+WRITE_BATCH_SIZE = 1024
+
+JsonlSource = str | os.PathLike[str] | IO[bytes] | IO[str]
+
+
+def read_jsonl(source: JsonlSource) -> Iterator[NMEA2000Message]:
+    """Yield the messages of a JSON-lines file, path or open file.
+
+    Both the default and the compact ``to_json`` forms are accepted, and blank
+    lines are skipped. A line that is not valid JSON raises ValueError with its
+    line number.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb", buffering=READ_BUFFER_SIZE) as file:
+            yield from _read_messages(file)
+    else:
+        yield from _read_messages(source)
+
+
+def _read_messages(file: IO[bytes] | IO[str]) -> Iterator[NMEA2000Message]:
+    for line_number, line in enumerate(file, 1):
+        try:
+            data = orjson.loads(line)  # pylint: disable=no-member
+        except orjson.JSONDecodeError as exc:  # pylint: disable=no-member
+            if not line.strip():
+                continue
+            raise ValueError(f"Line {line_number}: not valid JSON: {exc}") from exc
+        yield _message_from_json_dict(data)
+
+
+def write_jsonl(
+    messages: Iterable[NMEA2000Message],
+    target: JsonlSource,
+    compact: bool = False,
+    raw_values: bool = False,
+) -> int:
+    """Write messages to a path or open file, one JSON object per line.
+
+    ``compact`` and ``raw_values`` select the ``to_json`` form. A path is
+    created or truncated. Returns the number of messages written.
+    """
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as file:
+            return _write_messages(messages, file, compact, raw_values)
+    return _write_messages(messages, target, compact, raw_values)
+
+
+def _write_messages(
+    messages: Iterable[NMEA2000Message],
+    file: IO[bytes] | IO[str],
+    compact: bool,
+    raw_values: bool,
+) -> int:
+    binary = not isinstance(file, io.TextIOBase)
+    option = orjson.OPT_APPEND_NEWLINE  # pylint: disable=no-member
+    batch: list[bytes] = []
+    count = 0
+    for message in messages:
+        batch.append(
+            message._json_bytes(  # pylint: disable=protected-access
+                compact, raw_values, option
+            )
+        )
+        if len(batch) == WRITE_BATCH_SIZE:
+            _write_batch(file, batch, binary)
+            count += len(batch)
+            batch = []
+    if batch:
+        _write_batch(file, batch, binary)
+        count += len(batch)
+    return count
+
+
+def _write_batch(file: IO[bytes] | IO[str], batch: list[bytes], binary: bool) -> None:
+    data = b"".join(batch)
+    if binary:
+        file.write(data)  # type: ignore[arg-type]
+    else:
+        file.write(data.decode())  # type: ignore[arg-type]
+
+
+__all__ = ["read_jsonl", "write_jsonl"]
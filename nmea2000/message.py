@@ -5,6 +5,7 @@ from __future__ import annotations
 import binascii
 import hashlib
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
 from datetime import date, datetime, time, timedelta
@@ -35,6 +36,188 @@ FieldRawValue: TypeAlias = int | float | str | bytes | None
 RepeatingFieldEntry: TypeAlias = "dict[str, NMEA2000Field]"
 FieldValue: TypeAlias = "FieldScalarValue | list[RepeatingFieldEntry]"
 
+# (physical quantity, requested unit) -> (unit label, converter)
+_PREFERRED_UNIT_CONVERSIONS: dict[
+    tuple[PhysicalQuantities, str], tuple[str, Callable[[Any], float | None]]
+] = {
+    (PhysicalQuantities.TEMPERATURE, "c"): ("C", kelvin_to_celsius),
+    (PhysicalQuantities.TEMPERATURE, "f"): ("F", kelvin_to_fahrenheit),
+    (PhysicalQuantities.PRESSURE, "bar"): ("Bar", pascal_to_bar),
+    (PhysicalQuantities.PRESSURE, "psi"): ("PSI", pascal_to_psi),
+    (PhysicalQuantities.ANGLE, "deg"): ("Deg", radians_to_degrees),
+    (PhysicalQuantities.SPEED, "kts"): ("kts", mps_to_knots),
+}
+
+
+def _preferred_unit_conversion(
+    physical_quantities: PhysicalQuantities | None,
+    preferred_units: dict[PhysicalQuantities, str],
+) -> tuple[str, Callable[[Any], float | None]] | None:
+    if physical_quantities is None:
+        return None
+    requested_unit = preferred_units.get(physical_quantities)
+    if requested_unit is None:
+        return None
+    return _PREFERRED_UNIT_CONVERSIONS.get((physical_quantities, requested_unit))
+
+
+def _numeric_value(field_id: str, value: Any) -> float | None:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    raise TypeError(f"Cannot convert non-numeric value for field {field_id}: {value!r}")
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (bytes, bytearray)):
+        return obj.hex()
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, RepeatingFieldColumns):
+        return obj.to_entries()
+    raise TypeError
+
+
+def _compact_entries(
+    value: list[RepeatingFieldEntry] | RepeatingFieldColumns, raw: bool
+) -> list[dict[str, Any]]:
+    if isinstance(value, RepeatingFieldColumns):
+        field_ids = [spec.id for spec in value.specs]
+        columns = value.raw_values if raw else value.values
+        return [dict(zip(field_ids, row)) for row in zip(*columns)]
+    if raw:
+        return [{k: f.raw_value for k, f in entry.items()} for entry in value]
+    return [{k: f.value for k, f in entry.items()} for entry in value]
+
+
+def _field_from_spec(spec: FieldSpec, value: Any, raw_value: Any) -> NMEA2000Field:
+    return NMEA2000Field(
+        spec.id,
+        spec.name,
+        spec.description,
+        spec.unit_of_measurement,
+        value,
+        raw_value,
+        spec.physical_quantities,
+        spec.type,
+        spec.part_of_primary_key,
+    )
+
+
+# PGN variant id -> {field id: spec}, filled on first use of each PGN
+_FIELD_SPECS_BY_ID: dict[str, dict[str, FieldSpec]] = {}
+
+
+def _field_specs(message_id: str) -> dict[str, FieldSpec]:
+    specs = _FIELD_SPECS_BY_ID.get(message_id)
+    if specs is None:
+        from .records import RECORD_CLASSES  # pylint: disable=import-outside-toplevel
+
+        cls = RECORD_CLASSES.get(message_id)
+        specs = {}
+        if cls is not None:
+            specs = {s.id: s for s in (*cls.FIELDS, *cls.REPEATING_FIELDS)}
+        _FIELD_SPECS_BY_ID[message_id] = specs
+    return specs
+
+
+def _field_from_json(
+    data: dict[str, Any], specs: dict[str, FieldSpec]
+) -> NMEA2000Field:
+    """Build a field from its verbose JSON, sharing the metadata of a matching spec."""
+    spec = specs.get(data.get("id"))  # type: ignore[arg-type]
+    # Preferred-unit conversion relabels the unit, keep the JSON metadata then
+    unit = data.get("unit_of_measurement")
+    if spec is not None and unit == spec.unit_of_measurement:
+        return _field_from_spec(spec, data.get("value"), data.get("raw_value"))
+    entries = data.get("value")
+    if isinstance(entries, list):
+        data["value"] = [
+            {
+                field_id: _field_from_json(entry_field, specs)
+                for field_id, entry_field in entry.items()
+            }
+            for entry in entries
+        ]
+    nmea_field = NMEA2000Field(**data)
+    # Enum members serialize as their auto() value, a one-item list
+    if isinstance(nmea_field.type, list):
+        nmea_field.type = FieldTypes(tuple(nmea_field.type))
+    if isinstance(nmea_field.physical_quantities, list):
+        nmea_field.physical_quantities = PhysicalQuantities(
+            tuple(nmea_field.physical_quantities)
+        )
+    return nmea_field
+
+
+def _message_from_json_dict(data: dict[str, Any]) -> NMEA2000Message:
+    if isinstance(data.get("timestamp"), str):
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    fields = data.get("fields")
+    if isinstance(fields, dict):
+        return _message_from_compact_json(data)
+    msg = NMEA2000Message(**data)
+    specs = _field_specs(msg.id)
+    msg.fields = [_field_from_json(field, specs) for field in fields or []]
+    return msg
+
+
+def _message_from_compact_json(data: dict[str, Any]) -> NMEA2000Message:
+    """Rebuild a message from compact JSON using the PGN's generated field specs."""
+    from .records import record_class  # pylint: disable=import-outside-toplevel
+
+    cls = record_class(data["id"])
+    values: dict[str, Any] = data["fields"]
+    raw_values: dict[str, Any] = data.get("raw_values") or {}
+    fields = [
+        _field_from_spec(spec, values.get(spec.id), raw_values.get(spec.id))
+        for spec in cls.FIELDS
+    ]
+    entries = values.get("##list##")
+    if entries is not None:
+        raw_entries = raw_values.get("##list##") or [{}] * len(entries)
+        entry_fields = [
+            {
+                spec.id: _field_from_spec(spec, entry[spec.id], raw_entry.get(spec.id))
+                for spec in cls.REPEATING_FIELDS
+                if spec.id in entry
+            }
+            for entry, raw_entry in zip(entries, raw_entries)
+        ]
+        fields.append(
+            NMEA2000Field(
+                "##list##",
+                "List",
+                None,
+                None,
+                entry_fields,
+                None,
+                None,
+                FieldTypes.VARIABLE,
+                False,
+            )
+        )
+    else:
+        # Without entries the decoder leaves the repeating fields in place
+        fields.extend(
+            _field_from_spec(spec, values[spec.id], raw_values.get(spec.id))
+            for spec in cls.REPEATING_FIELDS
+            if spec.id in values
+        )
+
+    message = NMEA2000Message(
+        PGN=data["PGN"],
+        id=cls.ID,
+        description=cls.DESCRIPTION,
+        ttl=cls.TTL,
+        fields=fields,
+        source=data.get("source", 0),
+        destination=data.get("destination", 0),
+        priority=data.get("priority", 0),
+    )
+    if data.get("timestamp") is not None:
+        message.timestamp = data["timestamp"]
+    return message
+
 
 # Helper function
 def int_to_bytes(value):
@@ -83,17 +266,22 @@ class NMEA2000Message:
 
         if build_network_map:
             # Using MD5 as we don't need secure hashing and speed matters
-            # For now, we will NOT include the ISO name in the primary key
-            # primary_key = f"{self.id}_{self.source_iso_name.name if self.source_iso_name else '#'}"
-            primary_key = f"{self.id}"
-            for nmea_field in self.fields:
-                if nmea_field.part_of_primary_key:
-                    primary_key += "_" + str(nmea_field.raw_value)
+            primary_key = self.primary_key()
             logger.debug(
                 "primary key: %s. iso name: %s", primary_key, self.source_iso_name
             )
             self.hash = hashlib.md5(primary_key.encode()).hexdigest()
 
+    def primary_key(self) -> str:
+        """Return the PGN id joined with the raw values of its primary-key fields."""
+        # For now, we will NOT include the ISO name in the primary key
+        # primary_key = f"{self.id}_{self.source_iso_name.name if self.source_iso_name else '#'}"
+        primary_key = f"{self.id}"
+        for nmea_field in self.fields:
+            if nmea_field.part_of_primary_key:
+                primary_key += "_" + str(nmea_field.raw_value)
+        return primary_key
+
     def apply_preferred_units(self, preferred_units: dict[PhysicalQuantities, str]):
         """Convert numeric field values in place to the caller's preferred units."""
         if len(preferred_units) == 0:
@@ -101,7 +289,9 @@ class NMEA2000Message:
 
         for f in self.fields:
             self._apply_preferred_units_to_field(f, preferred_units)
-            if isinstance(f.value, list):
+            if isinstance(f.value, RepeatingFieldColumns):
+                f.value.apply_preferred_units(preferred_units)
+            elif isinstance(f.value, list):
                 for entry in f.value:
                     if isinstance(entry, dict):
                         for nested_field in entry.values():
@@ -113,40 +303,10 @@ class NMEA2000Message:
     def _apply_preferred_units_to_field(
         f: NMEA2000Field, preferred_units: dict[PhysicalQuantities, str]
     ):
-        if f.physical_quantities == PhysicalQuantities.TEMPERATURE:
-            requested_unit = preferred_units.get(PhysicalQuantities.TEMPERATURE, None)
-            if requested_unit == "c":
-                f.unit_of_measurement = "C"
-                f.value = kelvin_to_celsius(NMEA2000Message._numeric_value(f))
-            elif requested_unit == "f":
-                f.unit_of_measurement = "F"
-                f.value = kelvin_to_fahrenheit(NMEA2000Message._numeric_value(f))
-        if f.physical_quantities == PhysicalQuantities.PRESSURE:
-            requested_unit = preferred_units.get(PhysicalQuantities.PRESSURE, None)
-            if requested_unit == "bar":
-                f.unit_of_measurement = "Bar"
-                f.value = pascal_to_bar(NMEA2000Message._numeric_value(f))
-            elif requested_unit == "psi":
-                f.unit_of_measurement = "PSI"
-                f.value = pascal_to_psi(NMEA2000Message._numeric_value(f))
-        if f.physical_quantities == PhysicalQuantities.ANGLE:
-            requested_unit = preferred_units.get(PhysicalQuantities.ANGLE, None)
-            if requested_unit == "deg":
-                f.unit_of_measurement = "Deg"
-                f.value = radians_to_degrees(NMEA2000Message._numeric_value(f))
-        if f.physical_quantities == PhysicalQuantities.SPEED:
-            requested_unit = preferred_units.get(PhysicalQuantities.SPEED, None)
-            if requested_unit == "kts":
-                f.unit_of_measurement = "kts"
-                f.value = mps_to_knots(NMEA2000Message._numeric_value(f))
-
-    @staticmethod
-    def _numeric_value(f: NMEA2000Field) -> float | None:
-        if f.value is None or isinstance(f.value, (int, float)):
-            return f.value
-        raise TypeError(
-            f"Cannot convert non-numeric value for field {f.id}: {f.value!r}"
-        )
+        conversion = _preferred_unit_conversion(f.physical_quantities, preferred_units)
+        if conversion is not None:
+            f.unit_of_measurement, converter = conversion
+            f.value = converter(_numeric_value(f.id, f.value))
 
     def __str__(self):
         """Return a readable summary of the message header and decoded fields."""
@@ -161,29 +321,74 @@ class NMEA2000Message:
         fields_str = ", ".join([field.to_string_test_style() for field in self.fields])
         return f"{self.PGN} {self.description}: {fields_str}"
 
-    def to_json(self):
-        """Serialize the message to JSON, converting bytes and timedeltas explicitly."""
+    def to_json(self, compact: bool = False, raw_values: bool = False) -> str:
+        """Serialize the message to JSON, converting bytes and timedeltas explicitly.
 
-        def default(obj: Any) -> Any:
-            if isinstance(obj, (bytes, bytearray)):
-                return obj.hex()
-            if isinstance(obj, timedelta):
-                return obj.total_seconds()
-            raise TypeError
+        The default output holds every attribute and the full metadata of each
+        field. ``compact=True`` writes only the header and a field id -> value
+        map; the names, units and types are the same for every message of a PGN
+        and ``from_json`` restores them from the generated schema. Raw values
+        are added as a second map with ``raw_values=True``.
+        """
+        return self._json_bytes(compact, raw_values).decode()
 
+    def _json_bytes(self, compact: bool, raw_values: bool, option: int = 0) -> bytes:
+        data = self._compact_json_dict(raw_values) if compact else self.__dict__
         return orjson.dumps(  # pylint: disable=no-member
-            self.__dict__, default=default
-        ).decode()
+            data, default=_json_default, option=option
+        )
+
+    def _compact_json_dict(self, raw_values: bool) -> dict[str, Any]:
+        fields = self.fields
+        values: dict[str, Any] = {f.id: f.value for f in fields}
+        entries = values.get("##list##")
+        if entries is not None:
+            values["##list##"] = _compact_entries(entries, raw=False)
+        data = {
+            "PGN": self.PGN,
+            "id": self.id,
+            "source": self.source,
+            "destination": self.destination,
+            "priority": self.priority,
+            "timestamp": self.timestamp,
+            "fields": values,
+        }
+        if raw_values:
+            raws: dict[str, Any] = {f.id: f.raw_value for f in fields}
+            if entries is not None:
+                raws["##list##"] = _compact_entries(entries, raw=True)
+            data["raw_values"] = raws
+        return data
 
     @staticmethod
     def from_json(json_str):
-        """Deserialize a JSON string into an NMEA2000Message and field objects."""
-        data = orjson.loads(json_str)  # pylint: disable=no-member
-        if isinstance(data.get("timestamp"), str):
-            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
-        msg = NMEA2000Message(**data)
-        msg.fields = [NMEA2000Field(**field) for field in data.get("fields", [])]
-        return msg
+        """Deserialize a JSON string into an NMEA2000Message and field objects.
+
+        Both the default and the compact ``to_json`` output are accepted.
+        """
+        return _message_from_json_dict(
+            orjson.loads(json_str)  # pylint: disable=no-member
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize the message to the compact binary format of ``nmea2000.binary``.
+
+        Field values are stored in the order of the PGN's generated field specs,
+        without names or units, so ``from_bytes`` needs the same ``pgns.py``
+        build. ``hash`` and ``raw_can_data`` are not stored.
+        """
+        from .binary import message_to_bytes  # pylint: disable=import-outside-toplevel
+
+        return message_to_bytes(self)
+
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview) -> NMEA2000Message:
+        """Deserialize a message written by ``to_bytes``."""
+        from .binary import (  # pylint: disable=import-outside-toplevel
+            message_from_bytes,
+        )
+
+        return message_from_bytes(data)
 
     def get_field_by_id(self, field_id: str) -> NMEA2000Field:
         """Return the decoded field with a matching identifier or raise if absent."""
@@ -192,24 +397,25 @@ class NMEA2000Message:
             raise ValueError(f"PGN: {self.id}: Field with id '{field_id}' is missing.")
         return nmea_field
 
-    def get_list_field_size(self) -> int:
-        """Return the number of repeating-list entries stored under ##list##."""
+    def _list_field_value(self) -> list[RepeatingFieldEntry] | RepeatingFieldColumns:
         list_fields = self.get_field_by_id("##list##")
-        if list_fields.value is None or not isinstance(list_fields.value, list):
+        if not isinstance(list_fields.value, (list, RepeatingFieldColumns)):
             raise ValueError(f"PGN: {self.id}: Field with id '##list##' is not a list.")
-        return len(list_fields.value)
+        return list_fields.value
+
+    def get_list_field_size(self) -> int:
+        """Return the number of repeating-list entries stored under ##list##."""
+        return len(self._list_field_value())
 
     def get_list_field_by_id(self, list_index: int, field_id: str) -> NMEA2000Field:
         """Return one field from a specific repeating-list entry by index and id."""
-        list_fields = self.get_field_by_id("##list##")
-        if list_fields.value is None or not isinstance(list_fields.value, list):
-            raise ValueError(f"PGN: {self.id}: Field with id '##list##' is not a list.")
-        if list_index < 0 or list_index >= len(list_fields.value):
+        entries = self._list_field_value()
+        if list_index < 0 or list_index >= len(entries):
             raise ValueError(
                 f"PGN: {self.id}: Repeating field index {list_index} is out of range."
             )
         nmea_field = next(
-            (f for f in list_fields.value[list_index].values() if f.id == field_id),
+            (f for f in entries[list_index].values() if f.id == field_id),
             None,
         )
         if nmea_field is None:
@@ -288,7 +494,8 @@ class NMEA2000Field:
     name: str | None = None
     description: str | None = None
     unit_of_measurement: str | None = None
-    value: FieldValue = 0
+    # Only a columnar ##list## field holds RepeatingFieldColumns
+    value: FieldValue | RepeatingFieldColumns = 0
     raw_value: FieldRawValue = None
     physical_quantities: PhysicalQuantities | None = None
     type: FieldTypes = FieldTypes.NUMBER
@@ -299,6 +506,28 @@ class NMEA2000Field:
         """Return True if this field type represents a numeric value (NUMBER, FLOAT, or DECIMAL)."""
         return self.type in _NUMERIC_FIELD_TYPES
 
+    def copy(self) -> NMEA2000Field:
+        """Return a copy of the field, including copies of repeating-set entries."""
+        value = self.value
+        if isinstance(value, RepeatingFieldColumns):
+            value = value.copy()
+        elif isinstance(value, list):
+            value = [
+                {field_id: nested.copy() for field_id, nested in entry.items()}
+                for entry in value
+            ]
+        return NMEA2000Field(
+            self.id,
+            self.name,
+            self.description,
+            self.unit_of_measurement,
+            value,
+            self.raw_value,
+            self.physical_quantities,
+            self.type,
+            self.part_of_primary_key,
+        )
+
     def __str__(self):
         """Return a readable summary of the field metadata and values."""
         return f"NMEA2000Field(id={self.id}, name={self.name}, description={self.description}, unit_of_measurement={self.unit_of_measurement}, value={self.value}, raw_value={self.raw_value}, physical_quantities={self.physical_quantities}, type={self.type}, part_of_primary_key = {self.part_of_primary_key})"
@@ -319,6 +548,171 @@ class NMEA2000Field:
         return f'{self.name} = {self.value} (bytes = "{raw_value_hex}")'
 
 
+class FieldSpec:
+    """Static metadata of one PGN field, shared by all messages of that PGN."""
+
+    __slots__ = (
+        "attribute",
+        "bit_length",
+        "bit_offset",
+        "description",
+        "id",
+        "name",
+        "part_of_primary_key",
+        "physical_quantities",
+        "resolution",
+        "signed",
+        "type",
+        "unit_of_measurement",
+    )
+
+    def __init__(
+        self,
+        field_id: str,
+        attribute: str | None,
+        name: str,
+        description: str | None,
+        unit_of_measurement: str | None,
+        physical_quantities: PhysicalQuantities | None,
+        field_type: FieldTypes,
+        part_of_primary_key: bool,
+        bit_offset: int | None = None,
+        bit_length: int | None = None,
+        resolution: float = 1,
+        signed: bool = False,
+    ) -> None:
+        self.id = field_id
+        # Record attribute, None for reserved and spare fields
+        self.attribute = attribute
+        self.name = name
+        self.description = description
+        self.unit_of_measurement = unit_of_measurement
+        self.physical_quantities = physical_quantities
+        self.type = field_type
+        self.part_of_primary_key = part_of_primary_key
+        # Position in the payload, None when earlier fields have variable length
+        self.bit_offset = bit_offset
+        # None for variable-length fields
+        self.bit_length = bit_length
+        self.resolution = resolution
+        self.signed = signed
+
+    def __repr__(self):
+        return f"FieldSpec(id={self.id!r}, attribute={self.attribute!r})"
+
+
+class RepeatingFieldColumns:
+    """A repeating field set stored as one list of values per field.
+
+    The field metadata is shared with every message of the PGN, so a set of any
+    length costs a few lists instead of one NMEA2000Field per value. Indexing
+    returns one entry in the list-of-dicts form and ``to_entries`` converts the
+    whole set.
+    """
+
+    __slots__ = ("raw_values", "specs", "units", "values")
+
+    def __init__(
+        self,
+        specs: tuple[FieldSpec, ...],
+        values: tuple[list[Any], ...],
+        raw_values: tuple[list[Any], ...],
+        units: tuple[str | None, ...] | None = None,
+    ) -> None:
+        self.specs = specs
+        # values[i] and raw_values[i] hold the column of specs[i]
+        self.values = values
+        self.raw_values = raw_values
+        # Unit labels after preferred-unit conversion, None for the spec units
+        self.units = units
+
+    def __len__(self) -> int:
+        return len(self.values[0]) if self.values else 0
+
+    def __getitem__(self, index: int) -> RepeatingFieldEntry:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("repeating field index out of range")
+        units = self.units or tuple(s.unit_of_measurement for s in self.specs)
+        return {
+            spec.id: NMEA2000Field(
+                spec.id,
+                spec.name,
+                spec.description,
+                unit,
+                values[index],
+                raw_values[index],
+                spec.physical_quantities,
+                spec.type,
+                spec.part_of_primary_key,
+            )
+            for spec, unit, values, raw_values in zip(
+                self.specs, units, self.values, self.raw_values
+            )
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RepeatingFieldColumns):
+            return NotImplemented
+        return (
+            self.specs is other.specs
+            and self.values == other.values
+            and self.raw_values == other.raw_values
+            and self.units == other.units
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self):
+        return f"RepeatingFieldColumns({self.to_entries()!r})"
+
+    def column(self, field_id: str) -> list[Any]:
+        """Return the values of one repeating field, one per entry."""
+        return self.values[self._index(field_id)]
+
+    def raw_column(self, field_id: str) -> list[Any]:
+        """Return the raw values of one repeating field, one per entry."""
+        return self.raw_values[self._index(field_id)]
+
+    def _index(self, field_id: str) -> int:
+        for index, spec in enumerate(self.specs):
+            if spec.id == field_id:
+                return index
+        raise ValueError(f"Repeating field with id '{field_id}' is missing.")
+
+    def to_entries(self) -> list[RepeatingFieldEntry]:
+        """Return the set as a list of dicts of NMEA2000Field, one per entry."""
+        return [self[index] for index in range(len(self))]
+
+    def copy(self) -> RepeatingFieldColumns:
+        """Return a copy whose columns can be changed independently."""
+        return RepeatingFieldColumns(
+            self.specs,
+            tuple(list(v) for v in self.values),
+            tuple(list(v) for v in self.raw_values),
+            self.units,
+        )
+
+    def apply_preferred_units(
+        self, preferred_units: dict[PhysicalQuantities, str]
+    ) -> None:
+        """Convert numeric columns in place to the caller's preferred units."""
+        units = list(self.units or (s.unit_of_measurement for s in self.specs))
+        for index, spec in enumerate(self.specs):
+            conversion = _preferred_unit_conversion(
+                spec.physical_quantities, preferred_units
+            )
+            if conversion is None:
+                continue
+            units[index], converter = conversion
+            self.values[index][:] = [
+                converter(_numeric_value(spec.id, value))
+                for value in self.values[index]
+            ]
+        self.units = tuple(units)
+
+
 class LookupFieldTypeEnumeration:
     """Schema metadata describing one lookup-backed field type declaration."""
 
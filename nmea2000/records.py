@@ -0,0 +1,200 @@
+"""Slotted per-PGN record classes for attribute access to decoded values.
+
+``pgns.py`` generates one ``N2KRecord`` subclass per PGN variant, for example
+``VesselHeading`` with ``heading``, ``deviation``, ``variation``, ``reference``
+and ``sid`` attributes. A record only keeps field values, so it is much
+smaller than an ``NMEA2000Message`` and its values are plain attribute reads.
+``to_message`` rebuilds the full message for APIs that expect one.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from .consts import FieldTypes
+from .message import (
+    FieldSpec,
+    IsoName,
+    NMEA2000Field,
+    NMEA2000Message,
+    RepeatingFieldColumns,
+    RepeatingFieldEntry,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+LIST_FIELD_ID = "##list##"
+
+
+class N2KRecord:
+    """Base class of the generated per-PGN record classes."""
+
+    __slots__ = (
+        "_raw_values",
+        "destination",
+        "priority",
+        "source",
+        "source_iso_name",
+        "timestamp",
+    )
+
+    PGN: ClassVar[int]
+    ID: ClassVar[str]
+    DESCRIPTION: ClassVar[str]
+    TTL: ClassVar[timedelta | None] = None
+    # Non-repeating fields in decode order
+    FIELDS: ClassVar[tuple[FieldSpec, ...]] = ()
+    # Repeating field set, kept as a list under ``entries``
+    REPEATING_FIELDS: ClassVar[tuple[FieldSpec, ...]] = ()
+    REPEATING_FIELD_IDS: ClassVar[frozenset[str]] = frozenset()
+
+    source: int
+    destination: int
+    priority: int
+    timestamp: datetime | None
+    source_iso_name: IsoName | None
+    _raw_values: tuple[Any, ...] | None
+
+    def _init_header(self) -> None:
+        self.source = 0
+        self.destination = 0
+        self.priority = 0
+        self.timestamp = None
+        self.source_iso_name = None
+        self._raw_values = None
+
+    @classmethod
+    def from_message(cls, message: NMEA2000Message) -> N2KRecord:
+        """Build a record from a complete decoded message of this PGN variant."""
+        if message.id != cls.ID:
+            raise ValueError(f"Cannot build {cls.__name__} from a {message.id} message")
+        fields: Sequence[NMEA2000Field] = message.fields
+        entries: list[RepeatingFieldEntry] | RepeatingFieldColumns = []
+        if fields and fields[-1].id == LIST_FIELD_ID:
+            value = fields[-1].value
+            if isinstance(value, (list, RepeatingFieldColumns)):
+                entries = value
+            fields = fields[:-1]
+        elif cls.REPEATING_FIELD_IDS:
+            # Without entries the decoder leaves the repeating fields in place
+            fields = [f for f in fields if f.id not in cls.REPEATING_FIELD_IDS]
+        if len(fields) != len(cls.FIELDS):
+            raise ValueError(
+                f"PGN: {message.id}: expected {len(cls.FIELDS)} fields, "
+                f"got {len(fields)}"
+            )
+
+        record = cls.__new__(cls)
+        raw_values = []
+        for spec, nmea_field in zip(cls.FIELDS, fields):
+            if spec.attribute is not None:
+                setattr(record, spec.attribute, nmea_field.value)
+            raw_values.append(nmea_field.raw_value)
+        if cls.REPEATING_FIELD_IDS:
+            setattr(record, "entries", entries)  # noqa: B010
+        record.source = message.source
+        record.destination = message.destination
+        record.priority = message.priority
+        record.timestamp = message.timestamp
+        record.source_iso_name = message.source_iso_name
+        record._raw_values = tuple(raw_values)
+        return record
+
+    def to_message(self) -> NMEA2000Message:
+        """Return the equivalent NMEA2000Message, for encoders and other APIs."""
+        raw_values = self._raw_values or (None,) * len(self.FIELDS)
+        fields = []
+        for spec, raw_value in zip(self.FIELDS, raw_values):
+            value = raw_value
+            if spec.attribute is not None:
+                value = getattr(self, spec.attribute)
+            fields.append(
+                NMEA2000Field(
+                    spec.id,
+                    spec.name,
+                    spec.description,
+                    spec.unit_of_measurement,
+                    value,
+                    raw_value,
+                    spec.physical_quantities,
+                    spec.type,
+                    spec.part_of_primary_key,
+                )
+            )
+        entries = getattr(self, "entries", None)
+        if entries:
+            fields.append(
+                NMEA2000Field(
+                    LIST_FIELD_ID,
+                    "List",
+                    None,
+                    None,
+                    entries,
+                    None,
+                    None,
+                    FieldTypes.VARIABLE,
+                    False,
+                )
+            )
+        message = NMEA2000Message(
+            PGN=self.PGN,
+            id=self.ID,
+            description=self.DESCRIPTION,
+            ttl=self.TTL,
+            fields=fields,
+            source=self.source,
+            destination=self.destination,
+            priority=self.priority,
+            source_iso_name=self.source_iso_name,
+        )
+        if self.timestamp is not None:
+            message.timestamp = self.timestamp
+        return message
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, N2KRecord) or type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()  # pylint: disable=protected-access
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def _values(self) -> tuple[Any, ...]:
+        values = [getattr(self, s.attribute) for s in self.FIELDS if s.attribute]
+        if self.REPEATING_FIELD_IDS:
+            values.append(getattr(self, "entries"))  # noqa: B009
+        return (self.source, self.destination, self.priority, *values)
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{s.attribute}={getattr(self, s.attribute)!r}"
+            for s in self.FIELDS
+            if s.attribute
+        )
+        return f"{type(self).__name__}({values})"
+
+
+# PGN variant id -> record class, filled in when pgns.py is imported
+RECORD_CLASSES: dict[str, type[N2KRecord]] = {}
+
+
+def record_class(message_id: str) -> type[N2KRecord]:
+    """Return the generated record class of a PGN variant id, e.g. vesselHeading."""
+    cls = RECORD_CLASSES.get(message_id)
+    if cls is None:
+        raise ValueError(f"No record class for PGN id '{message_id}'")
+    return cls
+
+
+def record_from_message(message: NMEA2000Message) -> N2KRecord:
+    """Convert a decoded message to its per-PGN record."""
+    return record_class(message.id).from_message(message)
+
+
+__all__ = [
+    "RECORD_CLASSES",
+    "N2KRecord",
+    "record_class",
+    "record_from_message",
+]
@@ -6,6 +6,7 @@ import logging
 import math
 import struct
 from datetime import date, time, timedelta
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -368,6 +369,23 @@ def encode_number(
     return number_int
 
 
+def encode_number_unchecked(
+    value: Any, bit_length: int, signed: bool, resolution: float
+) -> int:
+    """Encode a number like ``encode_number``, without the type and range checks.
+
+    Used by the trusted encode functions for values known to fit the field.
+    """
+    if value is None:
+        if bit_length <= 3 or not signed:
+            return (1 << bit_length) - 1
+        return (1 << (bit_length - 1)) - 1
+    number_int = round(value / resolution)
+    if number_int < 0:
+        number_int += 1 << bit_length
+    return number_int
+
+
 def encode_number_raw(
     raw_value: int | float | None, bit_length: int, signed: bool
 ) -> int:
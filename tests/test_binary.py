@@ -0,0 +1,105 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+"""Tests for the binary serialization of NMEA2000Message."""
+
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from nmea2000 import (
+    IsoName,
+    NMEA2000Decoder,
+    NMEA2000Message,
+    PhysicalQuantities,
+    read_binary,
+    write_binary,
+)
+from nmea2000.encoder import create_encoder
+from nmea2000.input_formats import N2KFormat
+from nmea2000.pgns import decode_pgn_60928
+
+HEADING_LINE = "09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01"
+SATS_LINE = (
+    "2025-01-01T00:00:00.000Z,6,129540,1,255,27,"
+    "00,fd,02,01,88,13,10,27,b8,0b,00,00,00,00,f1,"
+    "05,b8,0b,20,4e,c4,09,64,00,00,00,f2"
+)
+ISO_NAME = 0xC0508A0000A0D4A1
+
+
+def _decode(line, **kwargs):
+    if line is SATS_LINE:
+        kwargs["already_combined"] = True
+    message = NMEA2000Decoder(**kwargs).decode(line)
+    assert message is not None
+    message.raw_can_data = None
+    return message
+
+
+def _encoded(message):
+    return create_encoder(N2KFormat.N2K_ASCII_RAW).encode(message)
+
+
+@pytest.mark.parametrize("line", [HEADING_LINE, SATS_LINE])
+def test_round_trip(line):
+    """A decoded message survives to_bytes and from_bytes unchanged."""
+    message = _decode(line)
+    data = message.to_bytes()
+    assert len(data) < len(message.to_json(compact=True))
+
+    restored = NMEA2000Message.from_bytes(data)
+    assert restored == message
+    assert _encoded(restored) == _encoded(message)
+
+
+def test_columnar_entries_read_back_as_entries():
+    """Columnar repeating sets are written as entries with the same values."""
+    message = _decode(SATS_LINE, columnar_repeating=True)
+    restored = NMEA2000Message.from_bytes(message.to_bytes())
+    assert restored == _decode(SATS_LINE)
+
+
+def test_preferred_units_and_header_metadata():
+    """Converted units, aware timestamps and the source ISO NAME are kept."""
+    message = _decode(HEADING_LINE, preferred_units={PhysicalQuantities.ANGLE: "deg"})
+    offset = timezone(timedelta(hours=2))
+    message.timestamp = datetime(2025, 1, 1, 12, 30, tzinfo=offset)
+    message.source_iso_name = IsoName(decode_pgn_60928(ISO_NAME, 64), ISO_NAME)
+
+    restored = NMEA2000Message.from_bytes(message.to_bytes())
+    assert restored.fields == message.fields
+    assert restored.fields[1].unit_of_measurement == "Deg"
+    assert restored.timestamp == message.timestamp
+    assert restored.source_iso_name is not None
+    assert restored.source_iso_name.name == ISO_NAME
+    assert str(restored.source_iso_name) == str(message.source_iso_name)
+
+
+def test_stream_round_trip(tmp_path):
+    """write_binary and read_binary frame messages in files and streams."""
+    messages = [_decode(HEADING_LINE), _decode(SATS_LINE)]
+    path = tmp_path / "dump.bin"
+    assert write_binary(messages, path) == 2
+    assert list(read_binary(path)) == messages
+
+    buffer = io.BytesIO()
+    write_binary(messages * 2, buffer)
+    buffer.seek(0)
+    restored = list(read_binary(buffer))
+    assert [m.id for m in restored] == ["vesselHeading", "gnssSatsInView"] * 2
+
+
+def test_errors():
+    """Schema mismatches, truncation and unknown versions raise ValueError."""
+    message = _decode(HEADING_LINE)
+    data = message.to_bytes()
+    with pytest.raises(ValueError, match="Truncated"):
+        NMEA2000Message.from_bytes(data[:-3])
+    with pytest.raises(ValueError, match="version"):
+        NMEA2000Message.from_bytes(b"\x02" + data[1:])
+    with pytest.raises(ValueError, match="Truncated"):
+        list(read_binary(io.BytesIO(b"\x10\x00\x00\x00" + data[:8])))
+
+    del message.fields[1]
+    with pytest.raises(ValueError, match="generated schema"):
+        message.to_bytes()
@@ -230,3 +230,15 @@ class TestBdtpFraming:
 
         p2, _c2 = bdtp_unwrap(buf)
         assert p2 == b"\x02"
+
+    def test_unwrap_from_start_offset(self):
+        """Unwrapping from an offset reports positions from the buffer start."""
+        frame1 = bdtp_wrap(b"\x01")
+        frame2 = bdtp_wrap(b"\x10\x02")
+        buf = frame1 + frame2 + frame1[:3]
+
+        p1, c1 = bdtp_unwrap(buf)
+        p2, c2 = bdtp_unwrap(buf, c1)
+        assert (p1, p2) == (b"\x01", b"\x10\x02")
+        assert c2 == len(frame1 + frame2)
+        assert bdtp_unwrap(buf, c2) == (None, c2)
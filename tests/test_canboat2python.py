@@ -0,0 +1,109 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+"""Tests for trimmed builds of the generated PGN modules."""
+
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+HEADING_LINE = "09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01"
+WIND_LINE = "09:53:01.952 R 09FD0223 01 98 3A 64 00 38 FF 01"
+
+_spec = importlib.util.spec_from_file_location(
+    "canboat2python", ROOT_DIR / "canboat2python.py"
+)
+assert _spec is not None and _spec.loader is not None
+canboat2python = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(canboat2python)
+
+
+@pytest.fixture(name="schema", scope="module")
+def schema_fixture():
+    return json.loads((ROOT_DIR / "canboat.json").read_text(encoding="utf-8"))
+
+
+def test_trim_schema_keeps_selected_and_required_pgns(schema):
+    """A variant id keeps its whole PGN, and the management PGNs are always kept."""
+    pgns, ids = canboat2python.parse_pgn_selection(["127250", " windData ", ""])
+    trimmed = canboat2python.trim_schema(schema, pgns, ids)
+
+    kept = {pgn["PGN"] for pgn in trimmed["PGNs"]}
+    assert kept == {127250, 130306} | canboat2python.REQUIRED_PGNS
+    assert len(trimmed["PGNs"]) == sum(
+        1 for pgn in schema["PGNs"] if pgn["PGN"] in kept
+    )
+
+
+def test_trim_schema_keeps_only_referenced_lookups(schema):
+    """Lookups no kept field refers to are dropped, MANUFACTURER_CODE stays."""
+    trimmed = canboat2python.trim_schema(schema, {127250}, set())
+
+    names = {lookup["Name"] for lookup in trimmed["LookupEnumerations"]}
+    assert {"DIRECTION_REFERENCE", "MANUFACTURER_CODE"} <= names
+    assert "ENGINE_INSTANCE" not in names
+    referenced = {
+        field["LookupEnumeration"]
+        for pgn in trimmed["PGNs"]
+        for field in pgn["Fields"]
+        if "LookupEnumeration" in field
+    }
+    assert referenced <= names
+    assert len(trimmed["LookupEnumerations"]) < len(schema["LookupEnumerations"])
+
+
+def test_trim_schema_rejects_unknown_selection(schema):
+    """Typos in a profile fail instead of silently producing a smaller build."""
+    with pytest.raises(ValueError, match="vesselHeadin"):
+        canboat2python.trim_schema(schema, set(), {"vesselHeadin"})
+    with pytest.raises(ValueError, match="1"):
+        canboat2python.trim_schema(schema, {1}, set())
+
+
+def test_trimmed_build_decodes_and_encodes_selected_pgns(tmp_path):
+    """A package built from a profile decodes its PGNs and skips the others."""
+    package_dir = tmp_path / "nmea2000"
+    shutil.copytree(
+        ROOT_DIR / "nmea2000",
+        package_dir,
+        ignore=shutil.ignore_patterns("__pycache__", "pgns.py", "consts.py"),
+    )
+    profile = tmp_path / "gateway.txt"
+    profile.write_text("# heading only\nvesselHeading\n", encoding="utf-8")
+    subprocess.run(
+        [sys.executable, "canboat2python.py", "--profile", str(profile)]
+        + ["--output-dir", str(package_dir)],
+        cwd=ROOT_DIR,
+        check=True,
+        capture_output=True,
+    )
+
+    probe = (
+        "from nmea2000 import NMEA2000Decoder, create_encoder\n"
+        "from nmea2000.input_formats import N2KFormat\n"
+        "decoder = NMEA2000Decoder()\n"
+        f"message = decoder.decode({HEADING_LINE!r})\n"
+        "print(create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW).encode(message))\n"
+        f"print(decoder.decode({WIND_LINE!r}))\n"
+        "message.PGN = 130306\n"
+        "try:\n"
+        "    create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW).encode(message)\n"
+        "except ValueError as exc:\n"
+        "    print(exc)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=tmp_path,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.splitlines() == [
+        HEADING_LINE,
+        "None",
+        "No encoding function found for PGN: 130306",
+    ]
@@ -80,6 +80,23 @@ class TestCliDecode:
         assert fields[0]["id"] == "manufacturerCode"
         assert fields[0]["value"] == "Furuno"
 
+    def test_decode_frame_compact(self):
+        """--compact should print a field id to value map instead of field objects."""
+        result = subprocess.run(
+            [*CLI_MODULE, "decode", "--frame", N2K_ASCII_FRAME, "--compact"],
+            capture_output=True,
+            text=True,
+            timeout=CLI_COMMAND_TIMEOUT,
+            check=False,
+        )
+        data = json.loads(result.stdout.strip())
+        assert data["id"] == "furunoHeave"
+        assert data["fields"]["manufacturerCode"] == "Furuno"
+        assert data["raw_values"]["manufacturerCode"] == 1855
+        assert NMEA2000Message.from_json(result.stdout).fields[0].name == (
+            "Manufacturer Code"
+        )
+
     def test_decode_missing_args(self):
         """Decode without a frame or file should fail instead of succeeding silently."""
         result = subprocess.run(
@@ -136,6 +153,46 @@ class TestCliEncode:
         assert result.returncode == 0
         assert "09FF7" in result.stdout
 
+    def test_encode_jsonl_file(self, tmp_path):
+        """Encode should emit one frame per line of a JSONL file."""
+        json_file = tmp_path / "messages.jsonl"
+        json_file.write_text(self.SAMPLE_JSON + "\n" + self.SAMPLE_JSON + "\n")
+        result = subprocess.run(
+            [*CLI_MODULE, "encode", "--file", str(json_file)],
+            capture_output=True,
+            text=True,
+            timeout=CLI_COMMAND_TIMEOUT,
+            check=False,
+        )
+        assert result.returncode == 0
+        assert result.stdout.count("09FF7") == 2
+
+    def test_encode_jsonl_file_to_capture(self, tmp_path):
+        """Encode should stream a JSONL file to a capture in the given format."""
+        json_file = tmp_path / "messages.jsonl"
+        json_file.write_text(self.SAMPLE_JSON + "\n" + self.SAMPLE_JSON + "\n")
+        capture = tmp_path / "capture.log"
+        result = subprocess.run(
+            [
+                *CLI_MODULE,
+                "encode",
+                "--file",
+                str(json_file),
+                "--format",
+                "candump2",
+                "--output",
+                str(capture),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=CLI_COMMAND_TIMEOUT,
+            check=False,
+        )
+        assert result.returncode == 0
+        assert "Encoded 2 messages" in result.stdout
+        lines = capture.read_text().splitlines()
+        assert lines == ["can0  1CFF0009   [8]  3F 9F DC FF FF FF FF FF"] * 2
+
     def test_encode_missing_args(self):
         """Encode without a frame or file should report an error condition."""
         result = subprocess.run(
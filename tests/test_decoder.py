@@ -5,6 +5,7 @@ import json
 import math
 import os
 import struct
+import threading
 import uuid
 from datetime import datetime, timedelta
 
@@ -12,10 +13,15 @@ import pytest
 
 from nmea2000 import decoder_formats
 from nmea2000.consts import FieldTypes, PhysicalQuantities
-from nmea2000.decoder import InvalidFrameError, NMEA2000Decoder, NMEA2000Message
+from nmea2000.decoder import (
+    SNAPSHOT_VERSION,
+    InvalidFrameError,
+    NMEA2000Decoder,
+    NMEA2000Message,
+)
 from nmea2000.encoder import create_encoder
 from nmea2000.input_formats import N2KFormat
-from nmea2000.message import IsoName, NMEA2000Field
+from nmea2000.message import IsoName, NMEA2000Field, RepeatingFieldColumns
 from nmea2000.pgns import (
     decode_pgn_127503,
     decode_pgn_129540,
@@ -394,6 +400,69 @@ def test_json():
         assert field2.raw_value == field.raw_value
 
 
+def test_compact_json_round_trips_through_the_schema():
+    """Compact JSON keeps only values, and from_json restores the field metadata."""
+    msg = _get_decoder().decode("A000057.055 09FF7 0FF00 3F9FDCFFFFFFFFFF")
+    assert isinstance(msg, NMEA2000Message)
+    compact = msg.to_json(compact=True, raw_values=True)
+    data = json.loads(compact)
+    assert set(data) == {
+        "PGN",
+        "id",
+        "source",
+        "destination",
+        "priority",
+        "timestamp",
+        "fields",
+        "raw_values",
+    }
+    assert data["fields"] == {f.id: f.value for f in msg.fields}
+    assert len(compact) < len(msg.to_json()) / 3
+
+    msg2 = NMEA2000Message.from_json(compact)
+    assert (msg2.PGN, msg2.id, msg2.description, msg2.ttl) == (
+        msg.PGN,
+        msg.id,
+        msg.description,
+        msg.ttl,
+    )
+    assert msg2.timestamp == msg.timestamp
+    assert msg2.fields == msg.fields
+    encoder = create_encoder(N2KFormat.N2K_ASCII_RAW)
+    assert encoder.encode(msg2) == create_encoder(N2KFormat.N2K_ASCII_RAW).encode(msg)
+
+
+def test_compact_json_repeating_entries():
+    """Repeating sets become lists of value maps, for list and columnar forms."""
+    legacy = _get_decoder(already_combined=True).decode(SATS_IN_VIEW_LINE)
+    columnar = NMEA2000Decoder(already_combined=True, columnar_repeating=True).decode(
+        SATS_IN_VIEW_LINE
+    )
+    assert legacy is not None
+    assert columnar is not None
+    compact = legacy.to_json(compact=True, raw_values=True)
+    assert columnar.to_json(compact=True, raw_values=True) == compact
+
+    entries = json.loads(compact)["fields"]["##list##"]
+    assert [entry["prn"] for entry in entries] == [1, 5]
+    restored = NMEA2000Message.from_json(compact)
+    assert restored.get_list_field_size() == 2
+    assert restored.get_list_field_by_id(1, "status").raw_value == 2
+    assert restored.fields == legacy.fields
+
+
+def test_dump_compact_writes_compact_json_lines():
+    """dump_compact writes the compact form with raw values to the dump file."""
+    filename = f"./dumps/pgn_dump_{uuid.uuid4().hex[:8]}.jsonl"
+    with NMEA2000Decoder(dump_to_file=filename, dump_compact=True) as decoder:
+        msg = decoder.decode("A000057.055 09FF7 0FF00 3F9FDCFFFFFFFFFF")
+    assert isinstance(msg, NMEA2000Message)
+    with open(filename, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    os.remove(filename)
+    assert lines == [msg.to_json(compact=True, raw_values=True)]
+
+
 def _validate_130842_message(msg: NMEA2000Message | None):
     assert isinstance(msg, NMEA2000Message)
     assert msg.PGN == 130842
@@ -602,6 +671,21 @@ def test_usb_bytes_invalid_length():
         decoder.decode(bytes.fromhex("aa550102010900ff1c08"))
 
 
+def test_text_line_read_as_bytes():
+    """Detects and decodes an ASCII text line passed as bytes instead of str."""
+    decoder = NMEA2000Decoder()
+    msg = decoder.decode(b"09F11223 00 FF 7F FF 7F FF 7F 00")
+    assert isinstance(msg, NMEA2000Message)
+    assert msg.PGN == 127250
+
+
+def test_text_bytes_not_ascii():
+    """Rejects a bytes text line with non-ASCII bytes instead of dropping them."""
+    decoder = NMEA2000Decoder(bound_format=N2KFormat.CAN_FRAME_ASCII)
+    with pytest.raises(InvalidFrameError, match="not ASCII"):
+        decoder.decode(b"09F11223 00 FF 7F FF 7F FF\xe97F 00")
+
+
 def test_iso_request_decode():
     """Preserves ISO Request field values through binary and JSON round-trips."""
     decoder = _get_decoder()
@@ -1191,3 +1275,459 @@ def test_pgn_129540_apply_preferred_units_to_list_fields():
     # SNR should be unaffected (not an ANGLE)
     assert msg.get_list_field_by_id(0, "snr").value == pytest.approx(30.0)
     assert msg.get_list_field_by_id(0, "snr").unit_of_measurement == "dB"
+
+
+SATS_IN_VIEW_LINE = (
+    "2025-01-01T00:00:00.000Z,6,129540,1,255,27,"
+    "00,fd,02,01,88,13,10,27,b8,0b,00,00,00,00,f1,"
+    "05,b8,0b,20,4e,c4,09,64,00,00,00,f2"
+)
+
+
+def test_columnar_repeating_matches_list_of_dicts():
+    """Columnar repeating sets hold the same fields as the list-of-dicts form."""
+    legacy = _get_decoder(already_combined=True).decode(SATS_IN_VIEW_LINE)
+    columnar = NMEA2000Decoder(already_combined=True, columnar_repeating=True).decode(
+        SATS_IN_VIEW_LINE
+    )
+    assert legacy is not None
+    assert columnar is not None
+
+    columns = columnar.get_field_by_id("##list##").value
+    assert isinstance(columns, RepeatingFieldColumns)
+    assert columns.column("prn") == [1, 5]
+    assert columns.raw_column("status") == [1, 2]
+    assert columns.to_entries() == legacy.get_field_by_id("##list##").value
+    assert columnar.get_list_field_size() == 2
+    assert columnar.get_list_field_by_id(1, "snr") == legacy.get_list_field_by_id(
+        1, "snr"
+    )
+    assert columnar.to_json() == legacy.to_json()
+
+    # Separate encoders, so both get the same fast-packet sequence number
+    assert create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW).encode(
+        columnar
+    ) == create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW).encode(legacy)
+
+
+def test_columnar_repeating_applies_preferred_units():
+    """Preferred units convert whole columns and relabel their unit."""
+    decoder = NMEA2000Decoder(
+        already_combined=True,
+        columnar_repeating=True,
+        preferred_units={PhysicalQuantities.ANGLE: "deg"},
+    )
+    msg = decoder.decode(SATS_IN_VIEW_LINE)
+    assert msg is not None
+
+    columns = msg.get_field_by_id("##list##").value
+    assert isinstance(columns, RepeatingFieldColumns)
+    assert columns.column("elevation") == [
+        round(math.degrees(0.5), 0),
+        round(math.degrees(0.3), 0),
+    ]
+    assert msg.get_list_field_by_id(0, "azimuth").unit_of_measurement == "Deg"
+    assert msg.get_list_field_by_id(0, "snr").unit_of_measurement == "dB"
+
+
+def _battery_status_frame(second: int, instance: int, voltage: int, sid: int) -> str:
+    return (
+        f"2016-04-09T16:41:{second:02d}.000Z,2,127508,17,255,8,"
+        f"{instance:02x},{voltage & 0xFF:02x},{voltage >> 8:02x},64,00,a0,73,{sid:02x}"
+    )
+
+
+def test_on_change_suppresses_repeats_and_reports_diffs():
+    """Test that on-change mode drops identical repeats and delivers only changed fields."""
+    decoder = NMEA2000Decoder(on_change=True)
+
+    first = decoder.decode(_battery_status_frame(0, 1, 1256, 5))
+    assert isinstance(first, NMEA2000Message)
+    assert [f.id for f in first.fields] == [
+        "instance",
+        "voltage",
+        "current",
+        "temperature",
+        "sid",
+    ]
+
+    assert decoder.decode(_battery_status_frame(1, 1, 1256, 5)) is None
+    assert decoder.decode(_battery_status_frame(2, 1, 1256, 5)) is None
+
+    changed = decoder.decode(_battery_status_frame(3, 1, 1257, 5))
+    assert isinstance(changed, NMEA2000Message)
+    assert [f.id for f in changed.fields] == ["instance", "voltage"]
+    assert changed.get_field_by_id("voltage").value == pytest.approx(12.57)
+    assert decoder.suppressed_repeats(changed) == 2
+
+    # A different primary key is tracked independently
+    other = decoder.decode(_battery_status_frame(4, 2, 1257, 5))
+    assert isinstance(other, NMEA2000Message)
+    assert len(other.fields) == 5
+
+    assert decoder.get_statistics()["on_change_suppressed"] == 2
+
+
+def test_on_change_heartbeat_delivers_full_message():
+    """Test that unchanged messages are re-sent in full once the heartbeat is due."""
+    decoder = NMEA2000Decoder(on_change=True, on_change_heartbeat=timedelta(seconds=5))
+
+    assert decoder.decode(_battery_status_frame(0, 1, 1256, 5)) is not None
+    assert decoder.decode(_battery_status_frame(4, 1, 1256, 5)) is None
+    heartbeat = decoder.decode(_battery_status_frame(5, 1, 1256, 5))
+    assert isinstance(heartbeat, NMEA2000Message)
+    assert len(heartbeat.fields) == 5
+    assert decoder.suppressed_repeats(heartbeat) == 1
+    assert decoder.decode(_battery_status_frame(6, 1, 1256, 5)) is None
+
+
+def test_on_change_heartbeat_requires_on_change():
+    """Test that configuring a heartbeat without on-change mode is rejected."""
+    with pytest.raises(ValueError, match="on_change"):
+        NMEA2000Decoder(
+            bound_format=N2KFormat.BASIC_STRING,
+            on_change_heartbeat=timedelta(seconds=1),
+        )
+
+
+def _battery_status_at(milliseconds: int, sid: int) -> str:
+    return (
+        f"2016-04-09T16:41:{milliseconds // 1000:02d}.{milliseconds % 1000:03d}Z,"
+        f"2,127508,17,255,8,01,e8,04,64,00,a0,73,{sid:02x}"
+    )
+
+
+def test_rate_limit_keeps_first_message_per_window():
+    """Test that rate limiting delivers the first message of each window by frame time."""
+    decoder = NMEA2000Decoder(rate_limits={127508: 1.0})
+    delivered = []
+    for sid in range(7):
+        msg = decoder.decode(_battery_status_at(sid * 400, sid))
+        if msg is not None:
+            delivered.append(msg.get_field_by_id("sid").value)
+
+    assert delivered == [0, 3, 6]
+    statistics = decoder.get_statistics()
+    assert statistics["rate_limit_dropped"] == 4
+    assert statistics["rate_limit_dropped_127508"] == 4
+
+
+def test_rate_limit_keep_latest_delivers_last_message_of_window():
+    """Test that keep-latest mode delivers the first message, then each window's newest."""
+    decoder = NMEA2000Decoder(rate_limits={127508: 1.0}, rate_limit_keep_latest=True)
+    delivered = []
+    for sid in range(7):
+        msg = decoder.decode(_battery_status_at(sid * 400, sid))
+        if msg is not None:
+            delivered.append(msg.get_field_by_id("sid").value)
+
+    assert delivered == [0, 2, 5]
+    # Only the replaced messages 1, 3 and 4 were discarded
+    assert decoder.get_statistics()["rate_limit_dropped"] == 3
+
+    # Measured by the frame timestamps the last window is still open
+    assert decoder.flush_rate_limited() == []
+    window_end = datetime(2016, 4, 9, 16, 41, 3, 400000)
+    assert decoder.flush_rate_limited(now=window_end - timedelta(milliseconds=1)) == []
+    flushed = decoder.flush_rate_limited(now=window_end)
+    assert [m.get_field_by_id("sid").value for m in flushed] == [6]
+    assert decoder.flush_rate_limited(force=True) == []
+
+
+def test_rate_limit_keep_latest_flush_waits_for_window_end():
+    """Test that a held message is only flushed before its window ends when forced."""
+    decoder = NMEA2000Decoder(rate_limits={127508: 0.01}, rate_limit_keep_latest=True)
+    assert decoder.decode(_battery_status_at(0, 0)) is not None
+    assert decoder.decode(_battery_status_at(1, 1)) is None
+
+    # The 100 second window is still open, by frame time and by wall clock
+    assert decoder.flush_rate_limited() == []
+    assert decoder.flush_rate_limited(live=True) == []
+    flushed = decoder.flush_rate_limited(force=True)
+    assert [m.get_field_by_id("sid").value for m in flushed] == [1]
+
+
+def test_rate_limit_keep_latest_live_flush_counts_elapsed_time(monkeypatch):
+    """Test that a live flush advances the latest naive frame timestamp by wall-clock time."""
+    clock = [1000.0]
+    monkeypatch.setattr("nmea2000.decoder.time.monotonic", lambda: clock[0])
+    decoder = NMEA2000Decoder(rate_limits={127508: 1.0}, rate_limit_keep_latest=True)
+    # candump3 timestamps are naive UTC
+    lines = [
+        f"(1649061120.{sid}00000) can0 09F21411#01E8046400A073{sid:02X}"
+        for sid in range(2)
+    ]
+    assert decoder.decode(lines[0]) is not None
+    assert decoder.decode(lines[1]) is None
+
+    clock[0] += 0.5
+    assert decoder.flush_rate_limited(live=True) == []
+    clock[0] += 0.5
+    flushed = decoder.flush_rate_limited(live=True)
+    assert [m.get_field_by_id("sid").value for m in flushed] == [1]
+
+
+def test_rate_limit_rejects_invalid_config():
+    """Test that non-positive rates and ISO address claims are rejected."""
+    with pytest.raises(ValueError, match="positive"):
+        NMEA2000Decoder(bound_format=N2KFormat.BASIC_STRING, rate_limits={127508: 0})
+    with pytest.raises(ValueError, match="ISO address claims"):
+        NMEA2000Decoder(bound_format=N2KFormat.BASIC_STRING, rate_limits={60928: 1.0})
+
+
+def test_shared_decoder_is_thread_safe_across_sources():
+    """Test that threads feeding different sources into one decoder reassemble every message."""
+    source_message = _get_decoder(already_combined=True).decode(
+        "2016-04-09T16:41:39.628Z,3,129029,0,255,47,"
+        "00,2f,e7,95,3d,00,73,d6,e0,00,00,00,e7,35,00,00,40,5f,a5,00,16,00,00,"
+        "00,00,00,00,10,fc,00,00,00,00,00,00,00,23,fc,00,a0,00,08,00,00,00,00,ff"
+    )
+    assert isinstance(source_message, NMEA2000Message)
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW)
+    frames_by_source = {}
+    for source in range(16):
+        source_message.source = source
+        frames = []
+        for _ in range(25):
+            frames.extend(encoder.encode(source_message))
+        frames_by_source[source] = frames
+
+    decoder = NMEA2000Decoder(bound_format=N2KFormat.CAN_FRAME_ASCII_RAW)
+    decoded: list[NMEA2000Message] = []
+
+    def worker(frames):
+        for frame in frames:
+            msg = decoder.decode(frame)
+            if msg is not None:
+                decoded.append(msg)
+
+    threads = [
+        threading.Thread(target=worker, args=(frames,))
+        for frames in frames_by_source.values()
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(decoded) == 16 * 25
+    assert {msg.source for msg in decoded} == set(range(16))
+    assert all(msg.PGN == 129029 for msg in decoded)
+
+
+def test_snapshot_restore_resumes_network_map_and_sessions():
+    """Test that a restored decoder knows ISO names, in-flight fast packets and on-change state."""
+    decoder = NMEA2000Decoder(on_change=True, build_network_map=True)
+    decoder.decode("2016-04-09T16:41:39.628Z,6,60928,17,255,8,2d,0b,e0,ff,00,96,b2,c0")
+    assert decoder.decode(_battery_status_frame(0, 1, 1256, 5)) is not None
+    # First frame of a 129029 fast packet, the rest arrives after the restart
+    decoder.decode("2022-09-28-11:36:59.668,3,129029,17,255,8,00,2f,e7,95,3d,00,73,d6")
+
+    snapshot = json.loads(json.dumps(decoder.snapshot()))
+    assert snapshot["iso_names"] == {"17": 13885325532173699885}
+    assert list(snapshot["fast_packets"]) == ["129029_17_255"]
+
+    restored = NMEA2000Decoder(on_change=True, build_network_map=True)
+    restored.restore(snapshot)
+
+    # Known source: no 10 minute wait, and the unchanged repeat stays suppressed
+    assert restored.decode(_battery_status_frame(1, 1, 1256, 5)) is None
+    changed = restored.decode(_battery_status_frame(2, 1, 1257, 5))
+    assert isinstance(changed, NMEA2000Message)
+    assert changed.source_iso_name is not None
+    assert changed.source_iso_name.name == 13885325532173699885
+    assert restored.snapshot()["fast_packets"] == snapshot["fast_packets"]
+
+
+def test_snapshot_restore_keeps_held_messages_and_repeat_counts():
+    """Test that a restored decoder delivers held rate-limited messages and repeat counts."""
+    decoder = NMEA2000Decoder(rate_limits={127508: 1.0}, rate_limit_keep_latest=True)
+    assert decoder.decode(_battery_status_at(0, 0)) is not None
+    assert decoder.decode(_battery_status_at(400, 1)) is None
+    on_change = NMEA2000Decoder(on_change=True)
+    assert on_change.decode(_battery_status_frame(0, 1, 1256, 5)) is not None
+    assert on_change.decode(_battery_status_frame(1, 1, 1256, 5)) is None
+
+    restored = NMEA2000Decoder(rate_limits={127508: 1.0}, rate_limit_keep_latest=True)
+    restored.restore(json.loads(json.dumps(decoder.snapshot())))
+    # The held message is delivered by the first message after its window
+    held = restored.decode(_battery_status_at(1200, 2))
+    assert isinstance(held, NMEA2000Message)
+    assert held.get_field_by_id("sid").value == 1
+    assert held.timestamp == decoder.flush_rate_limited(force=True)[0].timestamp
+
+    restored = NMEA2000Decoder(on_change=True)
+    restored.restore(json.loads(json.dumps(on_change.snapshot())))
+    changed = restored.decode(_battery_status_frame(2, 1, 1257, 5))
+    assert isinstance(changed, NMEA2000Message)
+    assert restored.suppressed_repeats(changed) == 1
+
+
+def test_unbound_decoder_snapshot_is_versioned():
+    """Test that a decoder without state still returns a snapshot it can restore."""
+    decoder = NMEA2000Decoder()
+    snapshot = decoder.snapshot()
+    assert snapshot["version"] == SNAPSHOT_VERSION
+
+    restored = NMEA2000Decoder()
+    restored.restore(snapshot)
+    assert restored.decode(_battery_status_frame(0, 1, 1256, 5)) is not None
+
+
+def test_restore_rejects_unknown_snapshot_version():
+    """Test that snapshots from an unknown format version are rejected."""
+    with pytest.raises(ValueError, match="snapshot version"):
+        NMEA2000Decoder().restore({"version": 0})
+
+
+def test_decode_cache_returns_independent_copies():
+    """Test that cached decodes match fresh ones, keep per-frame headers and do not share fields."""
+    decoder = NMEA2000Decoder(
+        decode_cache_size=1, preferred_units={PhysicalQuantities.TEMPERATURE: "C"}
+    )
+    first = decoder.decode(_battery_status_frame(0, 1, 1256, 5))
+    second = decoder.decode(
+        _battery_status_frame(1, 1, 1256, 5).replace(",17,", ",18,")
+    )
+    assert isinstance(first, NMEA2000Message)
+    assert isinstance(second, NMEA2000Message)
+
+    assert second.source == 18
+    assert second.timestamp == first.timestamp + timedelta(seconds=1)
+    assert second.fields == first.fields
+    assert second.fields[0] is not first.fields[0]
+    # Preferred units are applied exactly once
+    assert second.get_field_by_id("temperature").value == pytest.approx(22.85)
+
+    first.fields[1].value = -1
+    third = decoder.decode(_battery_status_frame(2, 1, 1256, 5))
+    assert isinstance(third, NMEA2000Message)
+    assert third.get_field_by_id("voltage").value == pytest.approx(12.56)
+
+    # A different payload evicts the single cached entry
+    decoder.decode(_battery_status_frame(3, 1, 1257, 5))
+    decoder.decode(_battery_status_frame(4, 1, 1256, 5))
+    statistics = decoder.get_statistics()
+    assert statistics["decode_cache_hits"] == 2
+    assert statistics["decode_cache_misses"] == 3
+    assert statistics["decode_cache_size"] == 1
+    assert statistics["decode_cache_hit_rate"] == pytest.approx(0.4)
+
+
+def test_unchanged_filtered_iso_claim_is_not_decoded_again(monkeypatch):
+    """Test that a filtered ISO claim with a known NAME skips decoding and keeps the source record."""
+    from nmea2000 import pgns  # pylint: disable=import-outside-toplevel
+
+    calls = []
+    original = pgns.decode_pgn_60928
+
+    def counting_decode(data_raw, data_length_bits):
+        calls.append(data_raw)
+        return original(data_raw, data_length_bits)
+
+    monkeypatch.setattr(pgns, "decode_pgn_60928", counting_decode)
+    decoder = NMEA2000Decoder(
+        exclude_pgns=[60928],
+        exclude_manufacturer_code=["2047"],
+        build_network_map=True,
+    )
+    claim = "2016-04-09T16:41:39.628Z,6,60928,17,255,8,2d,0b,e0,ff,00,96,b2,c0"
+    assert decoder.decode(claim) is None
+    assert decoder.decode(claim) is None
+    assert len(calls) == 1
+
+    # The manufacturer verdict is precomputed, so data from source 17 is dropped
+    assert decoder.decode(_battery_status_frame(0, 1, 1256, 5)) is None
+    iso_names = decoder.snapshot()["iso_names"]
+    assert iso_names == {"17": 13885325532173699885}
+
+
+def test_invalid_source_address_is_rejected():
+    """Test that a source address outside the 8-bit range raises a ValueError."""
+    with pytest.raises(ValueError, match="Invalid source address"):
+        _get_decoder(already_combined=True).decode(
+            "2016-04-09T16:41:39.628Z,2,127508,300,255,8,01,e8,04,64,00,a0,73,05"
+        )
+
+
+def test_source_to_iso_name_writes_through_to_source_records():
+    """Test that edits to source_to_iso_name update the source records and verdicts."""
+    decoder = decoder_formats.BasicStringDecoder(
+        build_network_map=True, exclude_manufacturer_code=["2047"]
+    )
+    claim = decoder.decode(
+        "2016-04-09T16:41:39.628Z,6,60928,17,255,8,2d,0b,e0,ff,00,96,b2,c0"
+    )
+    assert isinstance(claim, NMEA2000Message)
+    iso_name = decoder.source_to_iso_name[17]
+    assert dict(decoder.source_to_iso_name) == {17: iso_name}
+
+    del decoder.source_to_iso_name[17]
+    decoder.source_to_iso_name[40] = iso_name
+    assert decoder.source_records[17] is None
+    record = decoder.source_records[40]
+    assert record is not None
+    assert record.iso_name is iso_name
+    assert record.manufacturer_allowed is False
+
+    decoder.source_to_iso_name = {}
+    assert len(decoder.source_to_iso_name) == 0
+    with pytest.raises(ValueError, match="Invalid source address"):
+        decoder.source_to_iso_name[300] = iso_name
+
+
+def test_mixed_formats_share_reassembly_and_network_map():
+    """Test that interleaved formats decode in one pass with shared fast-packet and ISO state."""
+    source_message = _get_decoder(already_combined=True).decode(
+        "2016-04-09T16:41:39.628Z,3,129029,17,255,47,"
+        "00,2f,e7,95,3d,00,73,d6,e0,00,00,00,e7,35,00,00,40,5f,a5,00,16,00,00,"
+        "00,00,00,00,10,fc,00,00,00,00,00,00,00,23,fc,00,a0,00,08,00,00,00,00,ff"
+    )
+    assert isinstance(source_message, NMEA2000Message)
+    raw_frames = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW).encode(source_message)
+    candump_frames = create_encoder(N2KFormat.CANDUMP3).encode(source_message)
+    assert len(raw_frames) == len(candump_frames) > 2
+
+    decoder = NMEA2000Decoder(mixed_formats=True, build_network_map=True)
+    claim = decoder.decode(
+        "2016-04-09T16:41:39.628Z,6,60928,17,255,8,2d,0b,e0,ff,00,96,b2,c0"
+    )
+    assert isinstance(claim, NMEA2000Message)
+
+    # Alternate the wire format frame by frame within one fast packet
+    decoded = [
+        decoder.decode(raw if idx % 2 == 0 else candump)
+        for idx, (raw, candump) in enumerate(zip(raw_frames, candump_frames))
+    ]
+    assert decoded[:-1] == [None] * (len(decoded) - 1)
+    msg = decoded[-1]
+    assert isinstance(msg, NMEA2000Message)
+    assert msg.PGN == 129029
+    assert msg.source_iso_name == claim.source_iso_name
+    assert [f.value for f in msg.fields] == [f.value for f in source_message.fields]
+    assert decoder.snapshot()["iso_names"] == {"17": 13885325532173699885}
+    decoder.close()
+
+
+def test_binary_frames_decode_from_a_reused_receive_buffer():
+    """Test that views of a reused buffer decode fast packets and keep bytes copies."""
+    source_message = _get_decoder(already_combined=True).decode(
+        "2016-04-09T16:41:39.628Z,3,129029,17,255,47,"
+        "00,2f,e7,95,3d,00,73,d6,e0,00,00,00,e7,35,00,00,40,5f,a5,00,16,00,00,"
+        "00,00,00,00,10,fc,00,00,00,00,00,00,00,23,fc,00,a0,00,08,00,00,00,00,ff"
+    )
+    assert isinstance(source_message, NMEA2000Message)
+    packets = create_encoder(N2KFormat.EBYTE).encode(source_message)
+
+    decoder = NMEA2000Decoder(bound_format=N2KFormat.EBYTE)
+    receive_buffer = bytearray(13)
+    msg = None
+    for packet in packets:
+        receive_buffer[:] = packet
+        msg = decoder.decode(memoryview(receive_buffer))
+        # The next read overwrites the buffer the decoder was handed
+        receive_buffer[:] = bytes(13)
+    assert isinstance(msg, NMEA2000Message)
+    assert [f.value for f in msg.fields] == [f.value for f in source_message.fields]
+    assert msg.raw_can_data == packets[-1]
+    assert isinstance(msg.raw_can_data, bytes)
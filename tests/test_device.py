@@ -379,6 +379,71 @@ async def test_device_product_information_encodes_scaled_nmea_version(tmp_path):
     assert version_field.raw_value == 1300
 
 
+@pytest.mark.asyncio
+async def test_device_heartbeats_reuse_their_encode_template(tmp_path):
+    """Heartbeats are built from one template with the counter and address patched."""
+    client = EncodingFakeClient()
+    device = N2KDevice(
+        client,
+        persistence_path=tmp_path / "device.json",
+        address_claim_startup_delay=0,
+        address_claim_detection_time=0,
+        heartbeat_interval=0.01,
+    )
+
+    try:
+        await device.start()
+        await device.wait_ready(timeout=1)
+        await asyncio.sleep(0.05)
+    finally:
+        await device.close()
+
+    heartbeats = [message for message in client.sent_messages if message.PGN == 126993]
+    assert len(heartbeats) >= 2
+    counters = [m.get_field_int_value_by_id("sequenceCounter") for m in heartbeats]
+    assert counters == list(range(1, len(heartbeats) + 1))
+    for heartbeat in heartbeats:
+        plain = NMEA2000Message(
+            PGN=126993,
+            id="heartbeat",
+            source=device.address,
+            destination=255,
+            priority=6,
+            fields=heartbeat.fields,
+        )
+        assert client.encoder.encode(heartbeat) == client.encoder.encode(plain)
+    templates = device._templates  # pylint: disable=protected-access
+    assert set(templates) == {60928, 126993}
+
+
+@pytest.mark.asyncio
+async def test_device_product_information_reflects_changed_attributes(tmp_path):
+    """Product information replies should carry attributes changed after startup."""
+    client = EncodingFakeClient()
+    device = N2KDevice(
+        client,
+        persistence_path=tmp_path / "device.json",
+        address_claim_startup_delay=0,
+        address_claim_detection_time=0.01,
+        heartbeat_interval=3600,
+    )
+
+    try:
+        await device.start()
+        await device.wait_ready(timeout=1)
+        await client.emit(_build_iso_request(126996, source=31, destination=255))
+        device.model_id = "updated model"
+        device.software_version_code = "9.9.9"
+        await client.emit(_build_iso_request(126996, source=31, destination=255))
+    finally:
+        await device.close()
+
+    product_information = client.sent_messages[-1]
+    assert product_information.PGN == 126996
+    assert product_information.get_field_by_id("modelId").value == "updated model"
+    assert product_information.get_field_by_id("softwareVersionCode").value == "9.9.9"
+
+
 @pytest.mark.asyncio
 async def test_device_pgn_list_always_includes_management_pgns(tmp_path):
     """Reported transmit PGN lists should always include required management PGNs."""
@@ -2,16 +2,20 @@
 """Encoder round-trip tests for transport-specific and auto-sensed formats."""
 
 import json
+import random
+from datetime import datetime
 from pathlib import Path
 
 import can.message
 import pytest
 
-from nmea2000.consts import PhysicalQuantities
+from nmea2000.consts import FieldTypes, PhysicalQuantities
 from nmea2000.decoder import NMEA2000Decoder
-from nmea2000.encoder import create_encoder
+from nmea2000.encoder import EncodeTemplate, create_encoder, encode_values
+from nmea2000.encoder_formats import ENCODER_CLASSES
 from nmea2000.input_formats import N2KFormat, detect_format
 from nmea2000.message import NMEA2000Field, NMEA2000Message
+from nmea2000.records import RECORD_CLASSES
 
 from .test_decoder import _get_decoder
 
@@ -249,3 +253,238 @@ def test_canboatjs_autosense_roundtrip_cases(case: dict):
         msg,
         allow_basic_string_canonicalization=bool(case.get("skipEncoderTest")),
     )
+
+
+def test_encode_template_matches_full_encode():
+    """Template output equals encoding the message with the changed fields."""
+    msg = NMEA2000Decoder().decode("09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01")
+    assert msg is not None
+    template = EncodeTemplate(msg, varying=("sid", "heading", "deviation", "reference"))
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW_OUT)
+    assert template.encode() == bytes.fromhex("01983A640038FF01")
+
+    changed = template.message(sid=7, heading=1.2345, deviation=-0.01, reference=0)
+    assert changed.get_field_by_id("deviation").raw_value == -100
+    variation = msg.get_field_by_id("variation")
+    assert changed.get_field_by_id("variation") is not variation
+    assert changed.get_field_by_id("variation").value == variation.value
+    expected = NMEA2000Message(
+        PGN=msg.PGN,
+        id=msg.id,
+        source=msg.source,
+        destination=msg.destination,
+        priority=msg.priority,
+        fields=[f.copy() for f in changed.fields],
+    )
+    assert encoder.encode(changed) == encoder.encode(expected)
+
+    assert template.can_id == 0x09F11223
+    template.source = 0x42
+    assert template.can_id == 0x09F11242
+    assert template.encode(heading=None)[1:3] == b"\xff\xff"
+
+
+def test_encode_template_messages_do_not_send_stale_payloads():
+    """Checked encoders encode changed fields; template messages share no fields."""
+    msg = NMEA2000Decoder().decode("09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01")
+    assert msg is not None
+    template = EncodeTemplate(msg, varying=("sid",))
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW_OUT)
+    trusted = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW_OUT, trusted=True)
+
+    changed = template.message(sid=2)
+    assert changed.payload_is_current()
+    variation = changed.get_field_by_id("variation")
+    variation.value = variation.raw_value = None
+    assert not changed.payload_is_current()
+    assert encoder.encode(changed) == "09F11223 02 98 3A 64 00 FF 7F 01"
+    assert trusted.encode(changed) == encoder.encode(template.message(sid=2))
+    assert template.message(sid=2).get_field_by_id("variation").value is not None
+
+
+def test_encode_template_rejects_fields_it_cannot_patch():
+    """Only fixed-size fields listed as varying can change."""
+    msg = NMEA2000Decoder().decode("09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01")
+    assert msg is not None
+    with pytest.raises(ValueError, match="missing"):
+        EncodeTemplate(msg, varying=("speed",))
+    template = EncodeTemplate(msg, varying=("heading", "reference"))
+    with pytest.raises(ValueError, match="not varying"):
+        template.encode(sid=1)
+    with pytest.raises(ValueError, match="out of range"):
+        template.encode(heading=100.0)
+    with pytest.raises(ValueError, match="2 bits"):
+        template.encode(reference=4)
+
+    product = NMEA2000Message(
+        PGN=126998,
+        id="configurationInformation",
+        fields=[
+            NMEA2000Field("installationDescription1", value="a", raw_value="a"),
+            NMEA2000Field("installationDescription2", value="b", raw_value="b"),
+            NMEA2000Field("manufacturerInformation", value="c", raw_value="c"),
+        ],
+    )
+    with pytest.raises(ValueError, match="fixed position"):
+        EncodeTemplate(product, varying=("installationDescription2",))
+
+
+def test_encode_values_matches_message_encode():
+    """Plain values encode to the same frames as the equivalent message."""
+    msg = NMEA2000Decoder().decode("09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01")
+    assert msg is not None
+    values = {f.id: f.value for f in msg.fields}
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW_OUT)
+
+    encoded = encode_values("vesselHeading", values, source=0x23, priority=2)
+    assert encoded.payload == bytes.fromhex("01983A640038FF01")
+    assert encoder.encode(encoded) == encoder.encode(msg)
+    by_pgn = encode_values(127250, tuple(values.values()), source=0x23, priority=2)
+    assert by_pgn.payload == encoded.payload
+    assert encode_values(127250, sid=1, heading=1.5).payload == bytes.fromhex(
+        "01983AFF7FFF7FFF"
+    )
+
+
+def test_encode_values_with_repeating_entries():
+    """Repeating field sets are passed as entries of plain values."""
+    decoder = NMEA2000Decoder(already_combined=True)
+    msg = decoder.decode(
+        "2025-01-01T00:00:00.000Z,6,129540,1,255,27,"
+        "00,fd,02,01,88,13,10,27,b8,0b,00,00,00,00,f1,"
+        "05,b8,0b,20,4e,c4,09,64,00,00,00,f2"
+    )
+    assert msg is not None
+    values = {f.id: f.raw_value for f in msg.fields if f.id != "##list##"}
+    list_value = msg.get_field_by_id("##list##").value
+    assert isinstance(list_value, list)
+    entries = [
+        {field_id: nmea_field.raw_value for field_id, nmea_field in entry.items()}
+        for entry in list_value
+    ]
+    encoded = encode_values(
+        "gnssSatsInView", values, source=1, priority=6, entries=entries
+    )
+    encoder = create_encoder(N2KFormat.N2K_ASCII_RAW)
+    assert encoder.encode(encoded) == encoder.encode(msg)
+
+
+def test_encode_values_errors():
+    """Unknown fields, ambiguous PGNs and bad values raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown fields: speed"):
+        encode_values("vesselHeading", speed=1)
+    with pytest.raises(ValueError, match="at most 6 values"):
+        encode_values("vesselHeading", (0,) * 7)
+    with pytest.raises(ValueError, match="several variants"):
+        encode_values(65280)
+    with pytest.raises(ValueError, match="out of range"):
+        encode_values("vesselHeading", heading=100.0)
+
+
+_BUFFER_FORMATS = [
+    f for f in ENCODER_CLASSES if f not in (N2KFormat.PYTHON_CAN, N2KFormat.PDGY_DEBUG)
+]
+
+
+@pytest.mark.parametrize("output_format", _BUFFER_FORMATS)
+def test_encode_many_matches_encode(output_format: N2KFormat):
+    """encode_many writes the frames of encode, text frames one per line."""
+    decoded = [
+        NMEA2000Decoder().decode("09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01"),
+        NMEA2000Decoder(already_combined=True).decode(
+            "2025-01-01T00:00:00.000Z,6,129540,1,255,27,"
+            "00,fd,02,01,88,13,10,27,b8,0b,00,00,00,00,f1,"
+            "05,b8,0b,20,4e,c4,09,64,00,00,00,f2"
+        ),
+    ]
+    messages = [message for message in decoded if message is not None]
+    assert len(messages) == len(decoded)
+    expected = bytearray()
+    encoder = create_encoder(output_format)
+    for message in messages:
+        encoded = encoder.encode(message)
+        for frame in encoded if isinstance(encoded, list) else [encoded]:
+            if isinstance(frame, str):
+                expected += frame.encode() + b"\n"
+            else:
+                assert isinstance(frame, bytes)
+                expected += frame
+
+    encoded_many = create_encoder(output_format).encode_many(messages)
+    assert bytes(encoded_many) == bytes(expected)
+    with pytest.raises(ValueError, match="python-can"):
+        create_encoder(N2KFormat.PYTHON_CAN).encode_many(messages)
+
+
+@pytest.mark.parametrize(
+    "case",
+    _CANBOATJS_ROUNDTRIP_CASES,
+    ids=_roundtrip_case_id,
+)
+def test_trusted_encode_matches_checked_encode(case: dict):
+    """The validation-free encode functions produce the same frames."""
+    msg = _decode_roundtrip_case(case)
+    encoded = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW_OUT).encode(msg)
+    trusted = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW_OUT, trusted=True)
+    assert trusted.encode(msg) == encoded
+
+
+_RANDOM_INTEGER_FIELD_TYPES = {
+    FieldTypes.LOOKUP,
+    FieldTypes.BITLOOKUP,
+    FieldTypes.RESERVED,
+    FieldTypes.SPARE,
+}
+
+
+def test_trusted_encode_matches_checked_encode_for_random_values():
+    """Random in-range values encode the same with and without validation."""
+    rng = random.Random(2000)
+    compared = 0
+    for record in RECORD_CLASSES.values():
+        specs = [
+            (spec, spec.bit_length)
+            for spec in record.FIELDS
+            if spec.bit_length is not None
+        ]
+        for _ in range(5):
+            values = {}
+            for spec, bit_length in specs:
+                top = (1 << bit_length) - 2
+                if spec.type in _RANDOM_INTEGER_FIELD_TYPES:
+                    values[spec.id] = rng.randint(0, top)
+                elif spec.type is FieldTypes.NUMBER and rng.random() < 0.9:
+                    low = -(top + 2) // 2 if spec.signed else 0
+                    high = top // 2 if spec.signed else top
+                    values[spec.id] = rng.randint(low, high) * spec.resolution
+                elif spec.type is FieldTypes.NUMBER:
+                    values[spec.id] = None
+            try:
+                checked = encode_values(record.ID, values).payload
+            except ValueError:
+                continue
+            assert encode_values(record.ID, values, trusted=True).payload == checked
+            compared += 1
+    assert compared > 2000
+
+
+def test_text_timestamps_follow_each_second():
+    """Cached per-second timestamp prefixes change with the second."""
+    msg = NMEA2000Decoder().decode("09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01")
+    assert msg is not None
+    can_frame_encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW)
+    candump3_encoder = create_encoder(N2KFormat.CANDUMP3)
+    for timestamp in (
+        datetime(2025, 1, 1, 9, 53, 1, 952000),
+        datetime(2025, 1, 1, 9, 53, 1, 5000),
+        datetime(2025, 1, 2, 9, 53, 1, 5000),
+        datetime(2025, 1, 2, 9, 53, 2, 999999),
+    ):
+        msg.timestamp = timestamp
+        assert can_frame_encoder.encode(msg) == (
+            f"{timestamp.strftime('%H:%M:%S.%f')[:-3]} R 09F11223 "
+            "01 98 3A 64 00 38 FF 01"
+        )
+        assert candump3_encoder.encode(msg) == (
+            f"({timestamp.timestamp():.6f}) slcan0 09F11223#01983A640038FF01"
+        )
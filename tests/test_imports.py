@@ -0,0 +1,47 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+"""Import-time tests for the lazily loaded transport dependencies."""
+
+import subprocess
+import sys
+
+import nmea2000
+from nmea2000 import ioclient
+
+_TRANSPORT_MODULES = ("can", "serial_asyncio", "tenacity")
+
+
+def _loaded_modules_after(code: str) -> list[str]:
+    """Run code in a fresh interpreter and return the transport modules it loaded."""
+    probe = (
+        f"{code}\nimport sys\n"
+        f"print(','.join(m for m in {_TRANSPORT_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def test_offline_decode_and_encode_do_not_import_transports():
+    """Decoding and encoding text and binary frames should not load transport packages."""
+    code = (
+        "from nmea2000 import NMEA2000Decoder, create_encoder\n"
+        "from nmea2000.input_formats import N2KFormat\n"
+        "msg = NMEA2000Decoder().decode('09FF7 0FF00 3F9FDCFFFFFFFFFF')\n"
+        "create_encoder(N2KFormat.CANDUMP1).encode(msg)\n"
+        "create_encoder(N2KFormat.EBYTE).encode(msg)\n"
+        "NMEA2000Decoder().decode(bytes.fromhex('881cff00093f9fdcffffffffff'))"
+    )
+    assert _loaded_modules_after(code) == []
+
+
+def test_gateway_exports_load_on_first_access():
+    """Gateway classes should still be importable from the package root."""
+    assert nmea2000.EByteNmea2000Gateway is ioclient.EByteNmea2000Gateway
+    assert "N2KDevice" in dir(nmea2000)
+    assert _loaded_modules_after("from nmea2000 import State") == list(
+        _TRANSPORT_MODULES
+    )
@@ -1,14 +1,18 @@
 # pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
 """Input-format detection and generic encode/decode round-trip tests."""
 
+# pylint: disable=protected-access
 import copy
+from datetime import datetime
 from pathlib import Path
 
 import can.message
 import pytest
 
+from nmea2000 import input_formats
+from nmea2000.decoder import NMEA2000Decoder
 from nmea2000.encoder import create_encoder
-from nmea2000.input_formats import N2KFormat, detect_format
+from nmea2000.input_formats import N2KFormat, detect_format, looks_like_format
 from nmea2000.message import NMEA2000Message
 
 from .test_decoder import _get_decoder
@@ -115,6 +119,50 @@ def test_detect_format_supported_inputs(input_data, expected_format: N2KFormat):
     assert detect_format(input_data) == expected_format
 
 
+@pytest.mark.parametrize(
+    "input_data",
+    [
+        N2K_ASCII_FRAME,
+        N2K_ASCII_RAW_PACKET,
+        BASIC_STRING_FRAME,
+        CAN_FRAME_ASCII_FRAME,
+        CAN_FRAME_ASCII_RAW_PACKET,
+        PCDIN_FRAME,
+        MXPGN_FRAME,
+        PDGY_FRAME,
+        PDGY_DEBUG_FRAME,
+        CANDUMP1_FRAME,
+        CANDUMP2_FRAME,
+        CANDUMP3_FRAME,
+    ],
+)
+def test_detect_format_classifies_common_lines_without_fallback(
+    input_data, monkeypatch
+):
+    """Typical lines should be classified by prefix without the sequential fallback."""
+    expected = input_formats._detect_text_format_sequential(input_data)
+
+    def fail(line):
+        raise AssertionError(f"sequential fallback used for {line}")
+
+    monkeypatch.setattr(input_formats, "_detect_text_format_sequential", fail)
+    assert detect_format(input_data) == expected
+
+
+@pytest.mark.parametrize(
+    ("input_data", "expected_format"),
+    [
+        (TCP_PACKET, N2KFormat.EBYTE),
+        (USB_PACKET, N2KFormat.WAVESHARE),
+        (BST_D0_PACKET, N2KFormat.BST_D0),
+    ],
+)
+def test_detect_format_accepts_memoryview_input(input_data, expected_format):
+    """Binary detection should work on memoryview slices of a receive buffer."""
+    buffer = bytearray(b"\x00\x00") + input_data
+    assert detect_format(memoryview(buffer)[2:]) == expected_format
+
+
 def test_detect_format_supports_python_can_messages():
     """detect_format should classify python-can Message objects as PYTHON_CAN."""
     decoder = _get_decoder()
@@ -299,3 +347,61 @@ def test_encoder_roundtrips_fast_packet_combined_output_formats(
     redecoded = _get_decoder().decode(encoded)
     assert isinstance(redecoded, NMEA2000Message)
     _assert_semantic_roundtrip(prepared, redecoded)
+
+
+def test_looks_like_format_checks_prefixes_only():
+    """Test that the cheap prefix check accepts its own format and rejects others."""
+    pcdin = "$PCDIN,01F119,00000000,0F,2AAF00D1067414FF*59"
+    candump2 = "can0  18EEFF01   [8]  05 A0"
+    assert looks_like_format(pcdin, N2KFormat.PCDIN)
+    assert looks_like_format("19F51323 01 2F 30", N2KFormat.CAN_FRAME_ASCII)
+    assert looks_like_format("17:33:21.107 R 19F51323 01", N2KFormat.CAN_FRAME_ASCII)
+    assert looks_like_format("09FF7 0FF00 3F9FDCFF", N2KFormat.N2K_ASCII_RAW)
+    assert not looks_like_format("<0x18EEFF01> [8] 05 A0", N2KFormat.CANDUMP3)
+    assert not looks_like_format(candump2, N2KFormat.CAN_FRAME_ASCII)
+    assert not looks_like_format("09FF7 0FF00 3F9FDCFF", N2KFormat.CAN_FRAME_ASCII)
+    # Formats without a distinctive prefix always go through detect_format
+    assert not looks_like_format(candump2, N2KFormat.CANDUMP2)
+    assert not looks_like_format(b"", N2KFormat.EBYTE)
+    assert not looks_like_format(pcdin, N2KFormat.EBYTE)
+
+
+@pytest.mark.parametrize(
+    ("input_data", "input_format"),
+    [
+        (N2K_ASCII_FRAME, N2KFormat.N2K_ASCII_RAW),
+        (BASIC_STRING_FRAME, N2KFormat.BASIC_STRING),
+        (CAN_FRAME_ASCII_FRAME, N2KFormat.CAN_FRAME_ASCII),
+        (PCDIN_FRAME, N2KFormat.PCDIN),
+        (CANDUMP1_FRAME, N2KFormat.CANDUMP1),
+        (CANDUMP2_FRAME, N2KFormat.CANDUMP2),
+        (CANDUMP3_FRAME, N2KFormat.CANDUMP3),
+    ],
+)
+def test_bound_text_decoders_accept_bytes_lines(input_data, input_format):
+    """Bound text decoders should decode a bytes line exactly like its str form."""
+    from_str = NMEA2000Decoder(bound_format=input_format).decode(input_data)
+    from_bytes = NMEA2000Decoder(bound_format=input_format).decode(
+        memoryview(input_data.encode() + b"\r\n")
+    )
+    assert isinstance(from_str, NMEA2000Message)
+    assert isinstance(from_bytes, NMEA2000Message)
+    assert from_bytes.PGN == from_str.PGN
+    assert from_bytes.fields == from_str.fields
+
+
+@pytest.mark.parametrize(
+    ("timestamp", "expected"),
+    [
+        ("2016-04-09T16:41:09.078Z", datetime(2016, 4, 9, 16, 41, 9, 78000)),
+        ("2021-01-30-20:43:21.684", datetime(2021, 1, 30, 20, 43, 21, 684000)),
+        ("2016-04-09T16:41:09.5", datetime(2016, 4, 9, 16, 41, 9, 500000)),
+        ("2016-04-09T16:41:09.123456Z", datetime(2016, 4, 9, 16, 41, 9, 123456)),
+    ],
+)
+def test_basic_string_timestamps_match_strptime(timestamp, expected):
+    """The cached date/time prefix parse should agree with the strptime formats."""
+    line = f"{timestamp},2,127508,17,255,8,01,e8,04,64,00,a0,73,05"
+    msg = NMEA2000Decoder(bound_format=N2KFormat.BASIC_STRING).decode(line)
+    assert isinstance(msg, NMEA2000Message)
+    assert msg.timestamp == expected
@@ -6,6 +6,7 @@ from __future__ import annotations
 # pylint: disable=protected-access
 import asyncio
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from typing import cast
 
@@ -13,6 +14,7 @@ import can
 import can.message
 import pytest
 
+from nmea2000.decoder import NMEA2000Decoder
 from nmea2000.device import N2KDevice
 from nmea2000.encoder import create_encoder
 from nmea2000.input_formats import N2KFormat
@@ -58,7 +60,7 @@ class FakeWriter:
 class RecordingClient(AsyncIOClient):
     """AsyncIO client subclass that returns predetermined encoded byte chunks."""
 
-    def __init__(self, encoded_messages: list[bytes]) -> None:
+    def __init__(self, encoded_messages: list[bytes], **kwargs) -> None:
         """Store encoded messages that the test send path should write verbatim."""
         super().__init__(
             exclude_pgns=[],
@@ -70,6 +72,7 @@ class RecordingClient(AsyncIOClient):
             dump_pgns=[],
             build_network_map=False,
             seed_network_map=False,
+            **kwargs,
         )
         self.encoded_messages = encoded_messages
 
@@ -320,3 +323,137 @@ async def test_python_can_device_becomes_ready_on_virtual_bus(tmp_path) -> None:
         await device.close()
 
     assert device.ready is False
+
+
+@pytest.mark.asyncio
+async def test_decode_executor_delivers_messages_in_order() -> None:
+    """Frames decoded on a worker pool should reach the callback in arrival order."""
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW)
+    fast_message = NMEA2000Decoder(already_combined=True).decode(
+        "2016-04-09T16:41:39.628Z,3,129029,0,255,47,"
+        "00,2f,e7,95,3d,00,73,d6,e0,00,00,00,e7,35,00,00,40,5f,a5,00,16,00,00,"
+        "00,00,00,00,10,fc,00,00,00,00,00,00,00,23,fc,00,a0,00,08,00,00,00,00,ff"
+    )
+    assert fast_message is not None
+    frames: list[str] = []
+    for sid in range(20):
+        fast_message.fields[0].value = sid
+        fast_message.fields[0].raw_value = sid
+        frames.extend(encoder.encode(fast_message))
+
+    received: list[int] = []
+
+    async def on_message(message: NMEA2000Message) -> None:
+        received.append(cast(int, message.get_field_by_id("sid").value))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        client = RecordingClient(
+            [],
+            bound_format=N2KFormat.CAN_FRAME_ASCII_RAW,
+            decode_executor=executor,
+            decode_batch_size=4,
+        )
+        client.set_receive_callback(on_message)
+        try:
+            for frame in frames:
+                await client._handle_frame(frame)
+            for _ in range(200):
+                if len(received) == 20:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await client.close()
+
+    assert received == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_decode_executor_rejects_process_pool() -> None:
+    """A process pool cannot own the decoder state and should be rejected."""
+    with (
+        ProcessPoolExecutor(max_workers=1) as executor,
+        pytest.raises(ValueError, match="process pool"),
+    ):
+        RecordingClient([], decode_executor=executor)
+
+
+class PausingClient(RecordingClient):
+    """Recording client that counts read pauses caused by a full frame queue."""
+
+    def __init__(self, encoded_messages: list[bytes], **kwargs) -> None:
+        """Start with no pauses or resumes recorded."""
+        super().__init__(encoded_messages, **kwargs)
+        self.pauses = 0
+        self.resumes = 0
+
+    def _pause_reading(self) -> None:
+        self.pauses += 1
+
+    def _resume_reading(self) -> None:
+        self.resumes += 1
+
+
+@pytest.mark.asyncio
+async def test_decode_executor_pauses_reading_while_frame_queue_is_full() -> None:
+    """A full frame queue should pause reading until the executor drains it."""
+    frame = "2016-04-09T16:41:39.628Z,2,127250,10,255,8,00,00,00,ff,7f,ff,7f,fd"
+    received: list[NMEA2000Message] = []
+
+    async def on_message(message: NMEA2000Message) -> None:
+        received.append(message)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        client = PausingClient([], decode_executor=executor, decode_batch_size=2)
+        client.set_receive_callback(on_message)
+        try:
+            client._handle_frames([frame] * 10)
+            assert client.pauses == 1
+            for _ in range(200):
+                if len(received) == 10:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await client.close()
+
+    assert len(received) == 10
+    assert client.resumes == 1
+
+
+@pytest.mark.asyncio
+async def test_state_file_persists_decoder_state_across_clients(tmp_path) -> None:
+    """The decoder snapshot should be saved on close and restored by the next client."""
+    state_file = tmp_path / "state" / "decoder.json"
+    client = RecordingClient([], state_file=str(state_file))
+    await client._handle_frame(
+        "2016-04-09T16:41:39.628Z,6,60928,17,255,8,2d,0b,e0,ff,00,96,b2,c0"
+    )
+    await client.close()
+    assert state_file.exists()
+
+    restored = RecordingClient([], state_file=str(state_file))
+    try:
+        assert restored.decoder.snapshot()["iso_names"] == {"17": 13885325532173699885}
+    finally:
+        await restored.close()
+
+
+@pytest.mark.asyncio
+async def test_close_delivers_messages_held_by_rate_limiting() -> None:
+    """Messages held by keep-latest rate limiting should reach the callback on close."""
+    client = RecordingClient(
+        [],
+        decoder_options={"rate_limits": {127508: 1.0}, "rate_limit_keep_latest": True},
+    )
+    received: list[int] = []
+
+    async def on_message(message: NMEA2000Message) -> None:
+        received.append(cast(int, message.get_field_by_id("sid").value))
+
+    client.set_receive_callback(on_message)
+    for sid in range(3):
+        await client._handle_frame(
+            f"2016-04-09T16:41:39.{sid}00Z,2,127508,17,255,8,01,e8,04,64,00,a0,73,{sid:02x}"
+        )
+    await client.close()
+
+    assert received == [0, 2]
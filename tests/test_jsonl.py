@@ -0,0 +1,76 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+"""Tests for reading and writing NMEA2000Message JSON-lines streams."""
+
+import io
+
+import pytest
+
+from nmea2000 import NMEA2000Decoder, read_jsonl, write_jsonl
+from nmea2000.encoder import create_encoder
+from nmea2000.input_formats import N2KFormat
+from nmea2000.pgns import VesselHeading
+
+HEADING_LINE = "09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01"
+SATS_LINE = (
+    "2025-01-01T00:00:00.000Z,6,129540,1,255,27,"
+    "00,fd,02,01,88,13,10,27,b8,0b,00,00,00,00,f1,"
+    "05,b8,0b,20,4e,c4,09,64,00,00,00,f2"
+)
+
+
+def _messages():
+    heading = NMEA2000Decoder().decode(HEADING_LINE)
+    sats = NMEA2000Decoder(already_combined=True).decode(SATS_LINE)
+    assert heading is not None
+    assert sats is not None
+    return [heading, sats]
+
+
+def _encoded(messages):
+    return [create_encoder(N2KFormat.N2K_ASCII_RAW).encode(m) for m in messages]
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"compact": True}, {"compact": True, "raw_values": True}]
+)
+def test_write_and_read_round_trip(tmp_path, options):
+    """Messages written to a JSONL file read back to the same fields."""
+    messages = _messages()
+    path = tmp_path / "dump.jsonl"
+    assert write_jsonl(messages, path, **options) == 2
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        m.to_json(**options) for m in messages
+    ]
+
+    restored = list(read_jsonl(path))
+    assert [m.id for m in restored] == ["vesselHeading", "gnssSatsInView"]
+    assert [m.timestamp for m in restored] == [m.timestamp for m in messages]
+    if options.get("raw_values") or not options.get("compact"):
+        assert [m.fields for m in restored] == [m.fields for m in messages]
+        assert _encoded(restored) == _encoded(messages)
+
+
+def test_read_shares_field_metadata_with_the_schema():
+    """Verbose lines reuse the generated field specs instead of fresh strings."""
+    heading = _messages()[0]
+    restored = next(read_jsonl(io.BytesIO(heading.to_json().encode())))
+
+    spec = VesselHeading.FIELDS[1]
+    assert restored.fields[1].name is spec.name
+    assert restored.fields[1].type is spec.type
+    assert restored.fields[1].physical_quantities is spec.physical_quantities
+
+
+def test_text_files_and_blank_lines():
+    """Text streams work in both directions, and blank lines are skipped."""
+    buffer = io.StringIO()
+    write_jsonl(_messages(), buffer, compact=True, raw_values=True)
+    restored = list(read_jsonl(io.StringIO("\n" + buffer.getvalue() + "\n\n")))
+    assert len(restored) == 2
+
+
+def test_invalid_line_reports_its_line_number():
+    """A corrupt line raises ValueError naming the line."""
+    data = _messages()[0].to_json().encode() + b"\n{not json\n"
+    with pytest.raises(ValueError, match="Line 2"):
+        list(read_jsonl(io.BytesIO(data)))
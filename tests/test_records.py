@@ -0,0 +1,159 @@
+# pylint: disable=missing-module-docstring,missing-class-docstring,missing-function-docstring
+"""Tests for the generated per-PGN record classes."""
+
+import pytest
+
+from nmea2000 import NMEA2000Decoder, PhysicalQuantities
+from nmea2000.encoder import create_encoder
+from nmea2000.input_formats import N2KFormat
+from nmea2000.pgns import GnssSatsInView, VesselHeading, decode_pgn_127250
+from nmea2000.records import (
+    RECORD_CLASSES,
+    N2KRecord,
+    record_class,
+    record_from_message,
+)
+
+HEADING_LINE = "09:53:01.952 R 09F11223 01 98 3A 64 00 38 FF 01"
+SATS_LINE = (
+    "2017-04-15T14:57:58.469Z,6,129540,3,255,51,b8,ff,04,03,d1,15,9f,d0,1c,0c,"
+    "00,00,00,00,f5,04,39,28,44,75,f0,0a,00,00,00,00,f5,0a,17,04,2c,71,f0,0a,"
+    "00,00,00,00,f5,0e,ff,2c,ff,3b,b8,0b,00,00,00,00,f5"
+)
+
+
+def _field_tuples(message):
+    return [(f.id, f.value, f.raw_value, f.unit_of_measurement) for f in message.fields]
+
+
+def test_decode_record_exposes_fields_as_attributes():
+    """decode_record returns the PGN's record class with typed attributes."""
+    decoder = NMEA2000Decoder()
+    record = decoder.decode_record(HEADING_LINE)
+    message = NMEA2000Decoder().decode(HEADING_LINE)
+
+    assert isinstance(record, VesselHeading)
+    assert message is not None
+    assert record.heading == message.get_field_by_id("heading").value
+    assert record.deviation == message.get_field_by_id("deviation").value
+    assert record.reference == "Magnetic"
+    assert record.source == 0x23
+    assert record.priority == 2
+    assert not hasattr(record, "__dict__")
+    assert record_class("vesselHeading") is VesselHeading
+
+
+def test_record_converts_back_to_an_equivalent_message():
+    """to_message rebuilds the decoded fields, raw values and header."""
+    message = NMEA2000Decoder().decode(HEADING_LINE)
+    assert message is not None
+    rebuilt = record_from_message(message).to_message()
+
+    assert _field_tuples(rebuilt) == _field_tuples(message)
+    assert (rebuilt.PGN, rebuilt.id, rebuilt.source, rebuilt.timestamp) == (
+        message.PGN,
+        message.id,
+        message.source,
+        message.timestamp,
+    )
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW)
+    assert encoder.encode(rebuilt) == encoder.encode(message)
+
+
+def test_constructed_record_encodes_like_a_decoded_one():
+    """A record built from values encodes to the same payload as the decoded one."""
+    decoded = NMEA2000Decoder().decode_record(HEADING_LINE)
+    assert isinstance(decoded, VesselHeading)
+    built = VesselHeading(
+        sid=decoded.sid,
+        heading=decoded.heading,
+        deviation=decoded.deviation,
+        variation=decoded.variation,
+        reference=decoded.reference,
+    )
+    built.source, built.destination = decoded.source, decoded.destination
+    built.priority, built.timestamp = decoded.priority, decoded.timestamp
+
+    assert built == decoded
+    encoder = create_encoder(N2KFormat.CAN_FRAME_ASCII_RAW)
+    assert encoder.encode(built.to_message()) == encoder.encode(decoded.to_message())
+
+
+def test_record_keeps_repeating_entries():
+    """Repeating field sets are kept as the list of entries."""
+    record = NMEA2000Decoder(already_combined=True).decode_record(SATS_LINE)
+
+    assert isinstance(record, GnssSatsInView)
+    assert record.sats_in_view == 4
+    assert isinstance(record.entries, list)
+    assert [entry["prn"].value for entry in record.entries] == [3, 4, 10, 14]
+    assert record.to_message().get_list_field_size() == 4
+
+
+@pytest.mark.parametrize("line", [HEADING_LINE, SATS_LINE])
+def test_decode_record_matches_the_record_of_the_decoded_message(line):
+    """Records filled by the decode functions equal those built from messages."""
+    message = NMEA2000Decoder(already_combined=True).decode(line)
+    record = NMEA2000Decoder(already_combined=True).decode_record(line)
+    assert message is not None
+    assert record is not None
+
+    expected = record_from_message(message)
+    assert record == expected
+    assert record.timestamp == expected.timestamp
+    assert _field_tuples(record.to_message()) == _field_tuples(message)
+
+
+def test_decode_function_fills_the_record_directly():
+    """The generated decode function returns a record without a message."""
+    record = decode_pgn_127250(0xFD7FFF7FFF000000, 64, False, True)
+
+    assert isinstance(record, VesselHeading)
+    assert record.reference == "Magnetic"
+    assert record.to_message().get_field_by_id("reference").raw_value == 1
+
+
+def test_decode_record_builds_the_network_map_from_address_claims():
+    """An address claim decoded as a record still names its source."""
+    decoder = NMEA2000Decoder(build_network_map=True)
+    claim = decoder.decode_record(
+        "2016-04-09T16:41:39.628Z,6,60928,17,255,8,2d,0b,e0,ff,00,96,b2,c0"
+    )
+    record = decoder.decode_record(
+        "2016-04-09T16:41:39.628Z,2,127250,17,255,8,00,00,00,ff,7f,ff,7f,fd"
+    )
+
+    assert claim is not None
+    assert claim.source_iso_name is not None
+    assert claim.source_iso_name.name == 13885325532173699885
+    assert isinstance(record, VesselHeading)
+    assert record.source_iso_name == claim.source_iso_name
+
+
+def test_decode_record_in_mixed_formats_leaves_decode_unchanged():
+    """A mixed-format decoder returns records only from decode_record calls."""
+    decoder = NMEA2000Decoder(mixed_formats=True)
+    record = decoder.decode_record(HEADING_LINE.encode())
+    message = decoder.decode(HEADING_LINE)
+
+    assert isinstance(record, VesselHeading)
+    assert message is not None
+    assert not isinstance(message, N2KRecord)
+    assert _field_tuples(record.to_message()) == _field_tuples(message)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"on_change": True}, {"preferred_units": {PhysicalQuantities.TEMPERATURE: "c"}}],
+)
+def test_decode_record_rejects_options_that_change_fields(options):
+    """on_change and preferred_units would leave records incomplete or mislabelled."""
+    with pytest.raises(ValueError, match="decode_record"):
+        NMEA2000Decoder(**options).decode_record(HEADING_LINE)
+
+
+def test_every_pgn_variant_has_a_record_class():
+    """Each record class is registered under its PGN variant id."""
+    assert RECORD_CLASSES["gnssSatsInView"] is GnssSatsInView
+    assert all(issubclass(cls, N2KRecord) for cls in RECORD_CLASSES.values())
+    assert all(cls.ID == message_id for message_id, cls in RECORD_CLASSES.items())
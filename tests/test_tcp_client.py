@@ -3,14 +3,24 @@
 
 import asyncio
 import logging
+import random
 
 # pylint: disable=protected-access
 import pytest
 
 from nmea2000.consts import PhysicalQuantities
+from nmea2000.decoder import NMEA2000Decoder
+from nmea2000.encoder import create_encoder, encode_values
 from nmea2000.input_formats import N2KFormat
-from nmea2000.ioclient import EByteNmea2000Gateway, State, TextNmea2000Gateway
+from nmea2000.ioclient import (
+    ActisenseBstNmea2000Gateway,
+    EByteNmea2000Gateway,
+    State,
+    TextNmea2000Gateway,
+    bdtp_wrap,
+)
 from nmea2000.message import NMEA2000Message
+from tests.test_bst_d0 import BST_D0_PACKET
 from tests.test_decoder import _validate_65280_message, _validate_130842_message
 
 from .NMEA2000TestServer import NMEA2000TestServer
@@ -296,3 +306,135 @@ async def test_text_gateway_encodes_transport_bytes():
 
     assert len(encoded) == 1
     assert encoded[0].endswith(b"\r\n")
+
+
+async def _receive_stream(server, client, receive_queue, chunks, count):
+    """Send the chunks as separate server writes and collect count messages."""
+    await server.start()
+    await client.connect()
+    await _wait_for_server_client(server)
+    try:
+        for chunk in chunks:
+            await server.send_to_clients(chunk)
+        return [
+            await asyncio.wait_for(receive_queue.get(), timeout=10)
+            for _ in range(count)
+        ]
+    finally:
+        await client.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("input_format", [N2KFormat.EBYTE, N2KFormat.CAN_FRAME_ASCII])
+async def test_frames_split_and_batched_across_writes(input_format):
+    """Frames split across writes, or batched in one write, all decode in order."""
+    server, client, _receive_signal, receive_queue = _create_server_client(input_format)
+    messages = [
+        encode_values("vesselHeading", sid=sid, heading=1.0, source=1)
+        for sid in range(200)
+    ]
+    stream = bytes(create_encoder(input_format).encode_many(messages))
+    half = len(stream) // 2
+    chunks = [stream[i : i + 5] for i in range(0, half, 5)] + [stream[half:]]
+
+    received = await _receive_stream(server, client, receive_queue, chunks, 200)
+    assert [m.get_field_by_id("sid").value for m in received] == list(range(200))
+
+
+@pytest.mark.asyncio
+async def test_actisense_bst_frames_split_across_writes():
+    """BDTP frames are unwrapped across writes, skipping noise and unknown BST."""
+    server = NMEA2000TestServer("127.0.0.1", 8881, N2KFormat.EBYTE)
+    client = ActisenseBstNmea2000Gateway("127.0.0.1", 8881)
+    receive_queue = asyncio.Queue()
+    client.set_receive_callback(receive_queue.put)
+    frame = bdtp_wrap(BST_D0_PACKET)
+    stream = b"\xff\x00" + frame + bdtp_wrap(b"\x93\x01") + frame * 3
+    chunks = [stream[i : i + 3] for i in range(0, len(stream), 3)]
+
+    received = await _receive_stream(server, client, receive_queue, chunks, 4)
+    for message in received:
+        _validate_65280_message(message)
+
+
+# Fast packet PGNs of different lengths, sent by two sources
+_INTERLEAVED_IDS = (
+    "productInformation",
+    "gnssPositionData",
+    "aisClassAPositionReport",
+    "aisClassBPositionReport",
+)
+
+
+def _strict_reassemble(frames):
+    """Count fast packets completed by a receiver keyed by (PGN, source).
+
+    Like receivers that drop retransmissions, a first frame repeating the
+    sequence counter of the last completed message of its key is ignored.
+    """
+    last_sequence = {}
+    pending = {}
+    completed = 0
+    for pgn, source, data in frames:
+        key = (pgn, source)
+        sequence, frame_counter = data[0] >> 5, data[0] & 0x1F
+        if frame_counter == 0:
+            if last_sequence.get(key) == sequence:
+                pending.pop(key, None)
+                continue
+            pending[key] = [sequence, data[1], len(data) - 2]
+        else:
+            state = pending.get(key)
+            if state is None or state[0] != sequence:
+                continue
+            state[2] += len(data) - 1
+        state = pending[key]
+        if state[2] >= state[1]:
+            completed += 1
+            last_sequence[key] = sequence
+            del pending[key]
+    return completed
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("gateway_cls", "kwargs"),
+    [
+        (EByteNmea2000Gateway, {}),
+        (
+            TextNmea2000Gateway,
+            {"output_format": N2KFormat.CAN_FRAME_ASCII, "seed_network_map": False},
+        ),
+    ],
+)
+async def test_interleaved_fast_packets_reassemble(gateway_cls, kwargs):
+    """Interleaved fast packet PGNs keep their own sequence counters."""
+    client = gateway_cls("127.0.0.1", 8881, **kwargs)
+    rng = random.Random(2000)
+    messages = [
+        encode_values(rng.choice(_INTERLEAVED_IDS), source=rng.choice((1, 2)))
+        for _ in range(400)
+    ]
+    try:
+        encoded = [client._encode_impl(message) for message in messages]
+    finally:
+        await client.close()
+
+    decoder = NMEA2000Decoder()
+    frames = []
+    decoded = []
+    for message, packets in zip(messages, encoded):
+        for packet in packets:
+            if isinstance(client, EByteNmea2000Gateway):
+                data = packet[5:]
+            else:
+                packet = packet.decode().strip()
+                data = bytes.fromhex(packet.split(" ", 1)[1])
+            frames.append((message.PGN, message.source, data))
+            result = decoder.decode(packet)
+            if result is not None:
+                decoded.append(result.id)
+
+    assert _strict_reassemble(frames) == len(messages)
+    assert decoded == [message.id for message in messages]
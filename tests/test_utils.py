@@ -14,6 +14,8 @@ from nmea2000.utils import (
     encode_date,
     encode_decimal,
     encode_float,
+    encode_number,
+    encode_number_unchecked,
     encode_time,
 )
 
@@ -215,3 +217,23 @@ def test_decode_number_16bit_not_available_sentinels_with_resolution():
     # 16-bit unsigned fields reserve 0xFFFF and 0xFFFE as not available/error values.
     assert decode_number(0xFFFF, 0, 16, False, 60, 0, 3931920) is None
     assert decode_number(0xFFFE, 0, 16, False, 60, 0, 3931920) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "bit_length", "signed", "resolution"),
+    [
+        (None, 2, False, 1),
+        (None, 16, False, 0.01),
+        (None, 16, True, 0.01),
+        (1.5, 16, False, 0.0001),
+        (-1.5, 16, True, 0.0001),
+        (300, 8, True, 10),
+    ],
+)
+def test_encode_number_unchecked_matches_encode_number(
+    value, bit_length, signed, resolution
+):
+    """In-range values encode the same with and without the checks."""
+    assert encode_number_unchecked(
+        value, bit_length, signed, resolution
+    ) == encode_number(value, bit_length, signed, resolution)
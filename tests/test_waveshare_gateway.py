@@ -54,6 +54,7 @@ def _create_gateway() -> WaveShareNmea2000Gateway:
     )
     gw.queue = asyncio.Queue()
     gw._buffer = bytearray()
+    gw.decode_executor = None
     gw.logger = logging.getLogger("test_waveshare")
     return gw
 